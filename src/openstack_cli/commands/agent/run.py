@@ -0,0 +1,45 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import signal
+
+from openstack_cli import __app_name__
+from openstack_cli.core.agent import AgentServer, agent_socket_path, is_agent_supported
+from openstack_cli.core.config import Configuration
+from openstack_cli.core.updates import upgrade_manager
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+
+__module__ = CommandMetaInfo("run", "Run the agent in the foreground")
+__args__ = __module__.arg_builder\
+  .add_argument("refresh", int, "Token and servers list refresh interval in seconds", default=60)
+
+
+def __init__(conf: Configuration, refresh: int):
+  if not is_agent_supported():
+    print("Agent is not supported on this platform")
+    return
+
+  if not conf.is_key_persisted:
+    print("Agent could not be used with master password protected configuration")
+    return
+
+  def _conf_factory() -> Configuration:
+    return Configuration(upgrade_manager=upgrade_manager, app_name=__app_name__, lazy_init=True)\
+      .initialize(upgrade=False)
+
+  server = AgentServer(agent_socket_path(__app_name__), _conf_factory, refresh_interval=max(refresh, 5))
+  signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+  server.serve_forever(on_ready=lambda: print(f"Agent is listening on {agent_socket_path(__app_name__)}", flush=True))
+  print("Agent stopped")
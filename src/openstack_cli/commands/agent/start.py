@@ -0,0 +1,72 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import subprocess
+import sys
+import time
+
+from openstack_cli import __app_name__, __my_root_dir__
+from openstack_cli.core.agent import AgentClient, LOG_FILE_NAME, is_agent_supported
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+
+__module__ = CommandMetaInfo("start", "Start the agent in the background")
+__args__ = __module__.arg_builder\
+  .add_argument("refresh", int, "Token and servers list refresh interval in seconds", default=60)
+
+
+def __init__(conf: Configuration, refresh: int):
+  client = AgentClient(__app_name__)
+  status = client.ping()
+  if status:
+    print(f"Agent is already running, pid {status['pid']}")
+    return
+
+  if not is_agent_supported():
+    print("Agent is not supported on this platform")
+    return
+
+  if not conf.is_key_persisted:
+    print("Agent could not be used with master password protected configuration")
+    return
+
+  env = dict(os.environ)
+  env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(__my_root_dir__), env.get("PYTHONPATH")]))
+  log_path = os.path.join(conf.configuration_dir, LOG_FILE_NAME)
+
+  with open(log_path, "ab") as log:
+    p = subprocess.Popen(
+      [sys.executable, "-m", "openstack_cli", "agent", "run", "--refresh", str(refresh)],
+      stdin=subprocess.DEVNULL,
+      stdout=log,
+      stderr=subprocess.STDOUT,
+      env=env,
+      close_fds=True,
+      start_new_session=True
+    )
+
+  start_time = time.time()
+  while time.time() - start_time < 30:
+    status = client.ping()
+    if status:
+      print(f"Agent started, pid {status['pid']}")
+      return
+
+    if p.poll() is not None:
+      break
+    time.sleep(0.1)
+
+  print(f"Agent failed to start, check the log for details: {log_path}")
@@ -0,0 +1,38 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime
+
+from openstack_cli import __app_name__
+from openstack_cli.core.agent import AgentClient
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.utils import format_age
+
+__module__ = CommandMetaInfo("status", "Show status of the agent")
+
+
+def __init__(conf: Configuration):
+  client = AgentClient(__app_name__)
+  status = client.ping()
+  if not status:
+    print("Agent is not running")
+    return
+
+  print(f"Agent is running, pid {status['pid']}")
+  print(f"  socket:        {client.socket_path}")
+  print(f"  started:       {datetime.fromtimestamp(status['started']).strftime('%Y-%m-%d %H:%M:%S')}")
+  print(f"  last refresh:  {format_age(status['refreshed'])} ago")
+  print(f"  served:        {status['served']} command(s)")
@@ -0,0 +1,30 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.apputils.terminal import TableSizeColumn
+
+__module__ = CommandMetaInfo("limit", "Show or set max size of the cache in megabytes, 0 - unlimited")
+__args__ = __module__.arg_builder\
+  .add_default_argument("size", int, "Cache size limit in megabytes", default=-1)
+
+
+def __init__(conf: Configuration, size: int):
+  if size >= 0:
+    conf.cache_size_limit = size * 1024 * 1024
+
+  limit = conf.cache_size_limit
+  print(f"Cache size limit: {TableSizeColumn(limit).value if limit else 'unlimited'}")
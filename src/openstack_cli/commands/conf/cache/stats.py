@@ -0,0 +1,72 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List
+
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.config.ext.cache import CacheItemStats
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn, TableColumnPosition, TableSizeColumn
+from openstack_cli.modules.apputils.terminal.colors import Colors
+from openstack_cli.modules.utils import format_age
+
+__module__ = CommandMetaInfo("stats", "Shows cache usage: hit ratio, size and age of the cached items")
+
+
+def __init__(conf: Configuration):
+  cache = conf.global_cache
+  items: List[CacheItemStats] = sorted(cache.stats(), key=lambda x: x.accessed, reverse=True)
+
+  if not items:
+    print("Cache is empty")
+    return
+
+  current_ns = conf.cache_namespace
+  to = TableOutput(
+    TableColumn("Namespace", 16, inv_ch=Colors.GREEN.wrap_len()),
+    TableColumn("Item", max([len(item.name.rpartition("/")[2]) for item in items])),
+    TableColumn("Size", 10, pos=TableColumnPosition.right),
+    TableColumn("Age", 10, pos=TableColumnPosition.right),
+    TableColumn("Accessed", 10, pos=TableColumnPosition.right),
+    TableColumn("Hits", 6, pos=TableColumnPosition.right),
+    TableColumn("Misses", 6, pos=TableColumnPosition.right),
+    TableColumn("Ratio", 6, pos=TableColumnPosition.right)
+  )
+  to.print_header()
+
+  for item in items:
+    namespace, _, name = item.name.rpartition("/")
+    if namespace == current_ns:
+      namespace = Colors.GREEN.wrap(namespace)
+
+    to.print_row(
+      namespace if namespace else "global",
+      name,
+      TableSizeColumn(item.size).value,
+      format_age(item.created),
+      format_age(item.accessed),
+      str(item.hits),
+      str(item.misses),
+      f"{item.hit_ratio * 100:.0f}%"
+    )
+
+  hits = sum([item.hits for item in items])
+  total = hits + sum([item.misses for item in items])
+  size = sum([item.size for item in items])
+  limit = conf.cache_size_limit
+
+  print()
+  print(f"Items: {len(items)}, hit ratio: {(hits / total * 100) if total else 0:.0f}%, "
+        f"size: {TableSizeColumn(size).value} of {TableSizeColumn(limit).value if limit else 'unlimited'}")
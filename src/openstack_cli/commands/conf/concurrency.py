@@ -0,0 +1,42 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.concurrency import SHARED_EXECUTOR_WORKERS
+
+__module__ = CommandMetaInfo("concurrency", "Show or set limits of parallel API requests for bulk operations")
+__args__ = __module__.arg_builder\
+  .add_argument("min", int, "Initial and the lowest amount of parallel requests", default=0)\
+  .add_argument("max", int, f"The highest amount of parallel requests, up to {SHARED_EXECUTOR_WORKERS}", default=0)
+
+
+def __init__(conf: Configuration, min: int, max: int):
+  _min = min if min > 0 else conf.min_concurrency
+  _max = max if max > 0 else conf.max_concurrency
+
+  if _max > SHARED_EXECUTOR_WORKERS:
+    raise ValueError(f"Max amount of parallel requests could not exceed {SHARED_EXECUTOR_WORKERS}")
+
+  if _min > _max:
+    raise ValueError(f"Min amount of parallel requests ({_min}) is bigger than max one ({_max})")
+
+  if min > 0:
+    conf.min_concurrency = min
+
+  if max > 0:
+    conf.max_concurrency = max
+
+  print(f"Parallel requests: min {conf.min_concurrency}, max {conf.max_concurrency}")
@@ -0,0 +1,35 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+
+__module__ = CommandMetaInfo("retries", "Show or set retry policy of the failed API requests")
+__args__ = __module__.arg_builder\
+  .add_argument("count", int, "Max amount of retries of one request, 0 - do not retry", default=-1)\
+  .add_argument("budget", int, "Max share of retried requests in percents", default=-1)
+
+
+def __init__(conf: Configuration, count: int, budget: int):
+  if budget > 100:
+    raise ValueError("Retry budget should be in range 0..100")
+
+  if count >= 0:
+    conf.api_retries = count
+
+  if budget >= 0:
+    conf.retry_budget = budget
+
+  print(f"Retries per request: {conf.api_retries}, retry budget: {conf.retry_budget}% of requests")
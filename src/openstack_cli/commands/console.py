@@ -0,0 +1,75 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import List
+
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.apputils.terminal.colors import Colors
+from openstack_cli.modules.concurrency import shared_executor
+from openstack_cli.modules.openstack import OpenStack, OpenStackVMInfo
+from openstack_cli.modules.openstack.console_log import ConsoleLogTailer
+
+__module__ = CommandMetaInfo("console", "Shows console log of the cluster nodes")
+__args__ = __module__.arg_builder\
+  .add_default_argument("name", str, "Name of the cluster or vm")\
+  .add_argument("follow", bool, "Keep printing new lines of the log", default=False)\
+  .add_argument("lines", int, "Amount of the last lines to show per node, 0 - whole log", default=20)\
+  .add_argument("interval", int, "Poll interval in seconds for follow mode", default=2)\
+  .add_argument("own", bool, "Display only own clusters", default=False)
+
+PREFIX_COLORS = (Colors.CYAN, Colors.GREEN, Colors.YELLOW, Colors.MAGENTA, Colors.BLUE,
+                 Colors.BRIGHT_CYAN, Colors.BRIGHT_GREEN, Colors.BRIGHT_YELLOW, Colors.BRIGHT_MAGENTA, Colors.BRIGHT_BLUE)
+
+
+def __init__(conf: Configuration, name: str, follow: bool, lines: int, interval: int, own: bool):
+  ostack = OpenStack(conf)
+  clusters = ostack.get_server_by_cluster(name, sort=True, only_owned=own)
+  servers: List[OpenStackVMInfo] = [server for cluster in clusters.values() for server in cluster]
+
+  if not servers:
+    print(f"Query '{name}' returned no match")
+    return
+
+  tailers = [ConsoleLogTailer(ostack, server, lines=lines) for server in servers]
+  name_width = max(len(server.name) for server in servers)
+  prefixes = {
+    t.server.id: PREFIX_COLORS[i % len(PREFIX_COLORS)].wrap(f"{t.server.name:<{name_width}}") for i, t in enumerate(tailers)
+  }
+
+  def __poll(tailer: ConsoleLogTailer) -> List[str]:
+    try:
+      return tailer.poll()
+    except ValueError:  # node is not yet ready to provide the log
+      return []
+
+  executor = shared_executor()
+  try:
+    while True:
+      # polling is concurrent, printing is ordered by node to keep lines of one node together
+      for tailer, new_lines in zip(tailers, executor.map(__poll, tailers)):
+        for line in new_lines:
+          print(f"{prefixes[tailer.server.id]} | {line.rstrip()}")
+
+        if not follow and tailer.pending:  # follow mode prints the line once it is complete
+          print(f"{prefixes[tailer.server.id]} | {tailer.pending.rstrip()}")
+
+      if not follow:
+        break
+
+      time.sleep(max(interval, 1))
+  except KeyboardInterrupt:
+    pass
@@ -13,8 +13,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import List
+
 from openstack_cli.modules.openstack import OpenStack
-from openstack_cli.core.output import Console
+from openstack_cli.modules.openstack.objects import OSFlavor
+from openstack_cli.core.output import Console, OutputFormat, RecordWriter
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn, TableSizeColumn
 from openstack_cli.core.config import Configuration
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
@@ -23,10 +26,12 @@ __module__ = CommandMetaInfo("flavors", "Display available VM resource configura
 __args__ = __module__.arg_builder\
   .add_default_argument("image_name", str, "Image name (alias)", default="")\
   .add_argument("sort_by_name", bool, "Sort the list by name", alias="by-name", default=False)\
-  .add_argument("all", bool, "Show all flavors", default=False)
+  .add_argument("all", bool, "Show all flavors", default=False)\
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 
-def __init__(conf: Configuration, image_name: str, sort_by_name: bool, all: bool):
+def __init__(conf: Configuration, image_name: str, sort_by_name: bool, all: bool, format: str):
+  fmt = OutputFormat.from_str(format)
   sort_keys = {
     True: lambda x: x.name,
     False: lambda x: (x.vcpus, x.ram, x.disk, x.ephemeral_disk)
@@ -44,6 +49,10 @@ def __init__(conf: Configuration, image_name: str, sort_by_name: bool, all: bool
   else:
     flavors = sorted(ostack.flavors, key=sort_keys[sort_by_name])
 
+  if fmt != OutputFormat.table:
+    write_flavors(flavors, fmt, all)
+    return
+
   table = TableOutput(
     TableColumn("Name", 20),
     TableColumn("vCPU", 5),
@@ -68,3 +77,16 @@ def __init__(conf: Configuration, image_name: str, sort_by_name: bool, all: bool
       TableSizeColumn(flavor.ephemeral_disk).value,
       flavor.id
     )
+
+
+def write_flavors(flavors: List[OSFlavor], fmt: OutputFormat, all: bool):
+  """
+  Sizes are written in bytes
+  """
+  fields = ["name", "vcpus", "ram", "sum_disk_size", "disk", "ephemeral_disk", "id"]
+  with RecordWriter(fmt, fields) as writer:
+    for flavor in flavors:
+      if not all and flavor.ephemeral_disk == 0:
+        continue
+
+      writer.write(**{name: getattr(flavor, name) for name in fields})
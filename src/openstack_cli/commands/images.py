@@ -17,6 +17,7 @@
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn, TableSizeColumn
 from openstack_cli.modules.openstack import OpenStack
 from openstack_cli.core.config import Configuration
+from openstack_cli.core.output import OutputFormat, RecordWriter
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
 
 
@@ -25,13 +26,17 @@ __args__ = __module__.arg_builder \
   .add_default_argument("search_pattern", str, "Search query", default="")\
   .add_argument("all", bool, "Display all available images", default=False)\
   .add_argument("snapshots", bool, "Display only snapshots", default=False)\
-  .add_argument("own", bool, "Display only own items", default=False)
+  .add_argument("own", bool, "Display only own items", default=False)\
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 
 
-def __init__(conf: Configuration, search_pattern: str, snapshots: bool, all: bool, own: bool):
+def __init__(conf: Configuration, search_pattern: str, snapshots: bool, all: bool, own: bool, format: str):
   ostack = OpenStack(conf)
-  if snapshots:
+  fmt = OutputFormat.from_str(format)
+  if fmt != OutputFormat.table:
+    write_images(conf, ostack, fmt, search_pattern, snapshots, all, own)
+  elif snapshots:
     show_snap(conf, ostack, search_pattern, own)
   elif all:
     show_all(conf, ostack, search_pattern, own)
@@ -39,6 +44,37 @@ def __init__(conf: Configuration, search_pattern: str, snapshots: bool, all: boo
     show_normal(conf, ostack, search_pattern, own)
 
 
+def write_images(conf: Configuration, ostack: OpenStack, fmt: OutputFormat, search_pattern: str, snapshots: bool,
+                 all: bool, own: bool):
+  """
+  The same selection as the table views, sizes are written in bytes
+  """
+  if not snapshots and not all:
+    with RecordWriter(fmt, ["name", "alias", "os_name", "version", "size", "id"]) as writer:
+      for image in ostack.os_images:
+        if search_pattern and search_pattern.lower() not in image.name.lower():
+          continue
+
+        writer.write(name=image.name, alias=image.alias, os_name=image.os_name, version=image.version,
+                     size=image.size, id=image.base_image.id)
+    return
+
+  user_id = conf.user_id if snapshots and own else None
+  with RecordWriter(fmt, ["id", "name", "size", "status", "image_type", "user_id", "description"]) as writer:
+    for image in ostack.images:
+      if snapshots != bool(image.image_type):  # snapshots only or base images only
+        continue
+
+      if user_id and image.user_id != user_id:
+        continue
+
+      if search_pattern and search_pattern.lower() not in image.name.lower():
+        continue
+
+      writer.write(id=image.id, name=image.name, size=image.size, status=image.status, image_type=image.image_type,
+                   user_id=image.user_id, description=image.description)
+
+
 def show_snap(conf: Configuration, ostack: OpenStack, search_pattern: str, own: bool):
   images = ostack.images
   user_id = conf.user_id
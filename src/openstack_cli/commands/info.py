@@ -18,19 +18,22 @@ from typing import Dict, List
 
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn
 
-from openstack_cli.modules.openstack.objects import ServerPowerState, OpenStackVMInfo
+from openstack_cli.modules.openstack.objects import ServerPowerState, OpenStackVM, OpenStackVMInfo
 from openstack_cli.modules.apputils.terminal.colors import Colors, Symbols
 from openstack_cli.core.config import Configuration
+from openstack_cli.core.output import LiveOutput, OutputFormat, RecordWriter
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
 from openstack_cli.modules.openstack import OpenStack
-from openstack_cli.modules.utils import ValueHolder
+from openstack_cli.modules.utils import ValueHolder, watch_interval
 
 
 __module__ = CommandMetaInfo("info", "Shows the detailed information about requested VMs")
 __args__ = __module__.arg_builder\
   .add_default_argument("search_pattern", str, "Search query", default="") \
   .add_argument("own", bool, "Display only owned by user items", default=False) \
-  .add_argument("showid", bool, "Display instances ID", default=False)
+  .add_argument("showid", bool, "Display instances ID", default=False) \
+  .add_argument("watch", str, "Keep refreshing the list each N seconds, 5 if no value given", default="0") \
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 
 class WidthConst(Enum):
@@ -79,18 +82,57 @@ def print_cluster(servers: Dict[str, List[OpenStackVMInfo]], vh: ValueHolder = N
         _row.append(server.id)
       to.print_row(*_row)
 
-def __init__(conf: Configuration, search_pattern: str, debug: bool, own: bool, showid: bool):
-  vh: ValueHolder = ValueHolder(3)
-  def __fake_filter(s: OpenStackVMInfo):
-    vh.set_if_bigger(WidthConst.max_fqdn_len, len(s.fqdn))
-    vh.set_if_bigger(WidthConst.max_key_len, len(s.key_name))
-    vh.set_if_bigger(WidthConst.max_net_len, len(s.net_name))
-    return False
-
+def write_servers(servers: Dict[str, List[OpenStackVMInfo]], fmt: OutputFormat):
+  fields = ["cluster_name", "name", "fqdn", "ip_address", "key_name", "net_name", "state", "status", "flavor",
+            "owner_id", "created", "id"]
+  with RecordWriter(fmt, fields) as writer:
+    for cluster_name, servers in servers.items():
+      for server in sorted(servers, key=lambda x: x.fqdn):
+        writer.write(
+          cluster_name=cluster_name,
+          name=server.name,
+          fqdn=server.fqdn,
+          ip_address=server.ip_address,
+          key_name=server.key_name,
+          net_name=server.net_name,
+          state=server.state,
+          status=server.status,
+          flavor=server.flavor.name if server.flavor else None,
+          owner_id=server.owner_id,
+          created=server.created,
+          id=server.id
+        )
+
+
+def __init__(conf: Configuration, search_pattern: str, debug: bool, own: bool, showid: bool, watch: str,
+             format: str):
   ostack = OpenStack(conf, debug=debug)
-  clusters = ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own,
-                                          filter_func=__fake_filter)
+  interval = watch_interval(watch)
+  fmt = OutputFormat.from_str(format)
+
+  if fmt != OutputFormat.table:
+    if interval:
+      raise ValueError("watch is supported only by the table output format")
+
+    write_servers(ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own), fmt)
+    return
+
+  def __show(servers: OpenStackVM = None):
+    vh: ValueHolder = ValueHolder(3)
+    def __fake_filter(s: OpenStackVMInfo):
+      vh.set_if_bigger(WidthConst.max_fqdn_len, len(s.fqdn))
+      vh.set_if_bigger(WidthConst.max_key_len, len(s.key_name))
+      vh.set_if_bigger(WidthConst.max_net_len, len(s.net_name))
+      return False
+
+    clusters = ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own,
+                                            filter_func=__fake_filter, servers=servers)
+
+    print_cluster(clusters, vh, ostack, showid=showid)
 
-  print_cluster(clusters, vh, ostack, showid=showid)
+  if interval:
+    LiveOutput().follow(ostack.watch_servers(interval), __show, title=f"Every {interval:g}s")
+  else:
+    __show()
 
 
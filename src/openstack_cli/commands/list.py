@@ -22,14 +22,17 @@ from openstack_cli.modules.apputils.terminal.colors import Colors, Symbols
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
 
 from openstack_cli.core.config import Configuration
-from openstack_cli.modules.utils import ValueHolder
+from openstack_cli.core.output import LiveOutput, OutputFormat, RecordWriter
+from openstack_cli.modules.utils import ValueHolder, watch_interval
 from openstack_cli.modules.openstack import OpenStack
-from openstack_cli.modules.openstack.objects import ServerPowerState, OpenStackVMInfo
+from openstack_cli.modules.openstack.objects import ServerPowerState, OpenStackVM, OpenStackVMInfo
 
 __module__ = CommandMetaInfo("list", "Shows information about available clusters")
 __args__ = __module__.arg_builder\
   .add_default_argument("search_pattern", str, "Search query", default="")\
-  .add_argument("own", bool, "Display only owned by user items", default=False)
+  .add_argument("own", bool, "Display only owned by user items", default=False)\
+  .add_argument("watch", str, "Keep refreshing the list each N seconds, 5 if no value given", default="0")\
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 class WidthConst(Enum):
   max_cluster_name = 0
@@ -51,7 +54,11 @@ def get_lifetime(timestamp: datetime):
   return f"{int(hours)}h {int(minutes)}m" if days == 0 else f"{days} day(s)"
 
 
-def print_cluster(servers: Dict[str, List[OpenStackVMInfo]], vh: ValueHolder = None):
+def print_cluster(servers: Dict[str, List[OpenStackVMInfo]], vh: ValueHolder = None,
+                  cluster_states: Dict[str, Dict[ServerPowerState, int]] = None):
+  """
+  :arg cluster_states nodes state rollup of the servers inventory, used for the clusters displayed in full
+  """
   __run_ico = Symbols.PLAY.color(Colors.GREEN)
   __pause_ico = Symbols.PAUSE.color(Colors.BRIGHT_YELLOW)
   __stop_ico = Symbols.STOP.color(Colors.RED)
@@ -71,8 +78,14 @@ def print_cluster(servers: Dict[str, List[OpenStackVMInfo]], vh: ValueHolder = N
 
   for cluster_name, _servers in servers.items():
     server = _servers[0]
-    num_running: int = len([s for s in _servers if s.state == ServerPowerState.running])
-    num_paused: int = len([s for s in _servers if s.state == ServerPowerState.paused])
+    states = cluster_states.get(cluster_name) if cluster_states else None
+    if not states or sum(states.values()) != len(_servers):  # cluster is partially filtered out
+      states = {}
+      for s in _servers:
+        states[s.state] = states.get(s.state, 0) + 1
+
+    num_running: int = states.get(ServerPowerState.running, 0)
+    num_paused: int = states.get(ServerPowerState.paused, 0)
     num_stopped: int = len(_servers) - num_running - num_paused
 
     to.print_row(
@@ -84,21 +97,58 @@ def print_cluster(servers: Dict[str, List[OpenStackVMInfo]], vh: ValueHolder = N
     )
 
 
-def __init__(conf: Configuration, search_pattern: str, own: bool):
+def write_clusters(servers: Dict[str, List[OpenStackVMInfo]], fmt: OutputFormat):
+  fields = ["cluster_name", "nodes", "running", "paused", "stopped", "flavor", "created"]
+  with RecordWriter(fmt, fields) as writer:
+    for cluster_name, _servers in servers.items():
+      states: Dict[ServerPowerState, int] = {}
+      for s in _servers:
+        states[s.state] = states.get(s.state, 0) + 1
+
+      num_running: int = states.get(ServerPowerState.running, 0)
+      num_paused: int = states.get(ServerPowerState.paused, 0)
+      writer.write(
+        cluster_name=cluster_name,
+        nodes=len(_servers),
+        running=num_running,
+        paused=num_paused,
+        stopped=len(_servers) - num_running - num_paused,
+        flavor=_servers[0].flavor.name,
+        created=_servers[0].created
+      )
+
+
+def __init__(conf: Configuration, search_pattern: str, own: bool, watch: str, format: str):
   ostack = OpenStack(conf)
+  interval = watch_interval(watch)
+  fmt = OutputFormat.from_str(format)
 
-  vh = ValueHolder(2)
-  def __fake_filter(s: OpenStackVMInfo):
-    vh.set_if_bigger(WidthConst.max_cluster_name, len(s.cluster_name))
-    vh.set_if_bigger(WidthConst.max_vm_type_len, len(s.flavor.name))
-    return False
+  if fmt != OutputFormat.table:
+    if interval:
+      raise ValueError("watch is supported only by the table output format")
 
-  clusters = ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own,
-                                          filter_func=__fake_filter)
-
-  if search_pattern and len(clusters) == 0:
-    print(f"Query '{search_pattern}' returned no match")
+    # no widths pre-pass, records are written right after grouping
+    write_clusters(ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own), fmt)
     return
 
-  print_cluster(clusters, vh)
+  def __show(servers: OpenStackVM = None):
+    vh = ValueHolder(2)
+    def __fake_filter(s: OpenStackVMInfo):
+      vh.set_if_bigger(WidthConst.max_cluster_name, len(s.cluster_name))
+      vh.set_if_bigger(WidthConst.max_vm_type_len, len(s.flavor.name))
+      return False
+
+    clusters = ostack.get_server_by_cluster(search_pattern=search_pattern, sort=True, only_owned=own,
+                                            filter_func=__fake_filter, servers=servers)
+
+    if search_pattern and len(clusters) == 0:
+      print(f"Query '{search_pattern}' returned no match")
+      return
+
+    print_cluster(clusters, vh, servers.cluster_states if servers is not None else None)
+
+  if interval:
+    LiveOutput().follow(ostack.watch_servers(interval), __show, title=f"Every {interval:g}s")
+  else:
+    __show()
 
@@ -18,10 +18,13 @@ from typing import List
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn, TableStyle
 from openstack_cli.modules.openstack import OpenStack
 from openstack_cli.core.config import Configuration
+from openstack_cli.core.output import OutputFormat, RecordWriter
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
 
 
 __module__ = CommandMetaInfo("networks", "Shows available networks")
+__args__ = __module__.arg_builder\
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 from openstack_cli.modules.openstack.objects import OSNetworkItem
 
@@ -79,6 +82,30 @@ def print_networks(ostack: OpenStack, select: bool = False) -> OSNetworkItem or
   return None
 
 
-def __init__(conf: Configuration):
+def write_networks(ostack: OpenStack, fmt: OutputFormat):
+  fields = ["name", "network_id", "subnet_id", "availability_zones", "cidr", "gateway_ip", "domain_name",
+            "dns_nameservers", "enable_dhcp", "is_default", "status"]
+  with RecordWriter(fmt, fields) as writer:
+    for net in sorted(ostack.networks, key=lambda x: x.name):
+      writer.write(
+        name=net.name,
+        network_id=net.network_id,
+        subnet_id=net.subnet_id,
+        availability_zones=net.orig_network.availability_zones,
+        cidr=net.cidr,
+        gateway_ip=net.gateway_ip,
+        domain_name=net.domain_name,
+        dns_nameservers=net.dns_nameservers,
+        enable_dhcp=net.enable_dhcp,
+        is_default=net.is_default,
+        status=net.orig_network.status
+      )
+
+
+def __init__(conf: Configuration, format: str):
   ostack = OpenStack(conf)
-  print_networks(ostack)
+  fmt = OutputFormat.from_str(format)
+  if fmt != OutputFormat.table:
+    write_networks(ostack, fmt)
+  else:
+    print_networks(ostack)
@@ -13,21 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
 
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn, TableColumnPosition
 from openstack_cli.modules.apputils.terminal.get_terminal_size import get_terminal_size
 
 from openstack_cli.modules.apputils.terminal.colors import Colors
 from openstack_cli.core.config import Configuration
+from openstack_cli.core.output import OutputFormat, RecordWriter
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
 from openstack_cli.modules.openstack import OpenStack, OpenStackQuotas, OpenStackQuotaType, OpenStackUsers
+from openstack_cli.modules.utils import parse_duration
 
 __module__ = CommandMetaInfo("quota", item_help="Show the allowed resource limits for the project")
 __args__ = __module__.arg_builder\
   .add_argument("details", bool, "Show detailed resource consumption", default=False)\
   .add_argument("graph", bool, "Show Graphical statistic per-user", default=False)\
-  .add_argument("show_clusters", bool, "Show user instances on details page", alias="show-clusters", default=False)
+  .add_argument("show_clusters", bool, "Show user instances on details page", alias="show-clusters", default=False)\
+  .add_argument("history", str, "Show locally recorded usage history for the period, like 30d, 12h or 2w",
+                default="")\
+  .add_argument("format", str, "Output format: table, json, ndjson or csv", default="table")
 
 
 def get_percents(current: float, fmax: float):
@@ -193,30 +200,69 @@ def display_combined_graph(metrics: Dict[str, Dict[OpenStackQuotaType, int]], us
 
   print("\n")
 
-def _get_per_user_stats(ostack: OpenStack) -> Dict[str, Dict[OpenStackQuotaType, int]]:
-  resources = {}
+_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def get_sparkline(samples: List[Tuple[float, float]], since: float, until: float, width: int,
+                  max_value: float = 0) -> str:
+  """
+  Renders samples as one line chart, each column shows the average of samples fall into it.
+  Columns without samples are left empty
+  """
+  columns: List[List[float]] = [[] for _ in range(width)]
+  step = (until - since) / width
+  for ts, value in samples:
+    columns[min(int((ts - since) / step), width - 1)].append(value)
+
+  averages = [sum(col) / len(col) if col else None for col in columns]
+  top = max(max_value, max((v for v in averages if v is not None), default=0))
+  if top <= 0:
+    return "".join(" " if v is None else _SPARK_CHARS[0] for v in averages)
+
+  last = len(_SPARK_CHARS) - 1
+  return "".join(" " if v is None else _SPARK_CHARS[min(int(round(v * last / top)), last)] for v in averages)
+
+
+def _show_history(conf: Configuration, period: str):
+  duration = parse_duration(period)
+  until = time.time()
+  since = until - duration
+  series = conf.quota_history.query(since, until)
 
-  for server in ostack.servers.items:
-    if server.owner_id not in resources:
-      resources[server.owner_id] = {
-        "clusters": {},
-        OpenStackQuotaType.CPU_CORES: 0,
-        OpenStackQuotaType.RAM_MB: 0,
-        OpenStackQuotaType.INSTANCES: 0
-      }
+  print(f"Region {conf.region} usage history for the last {period}\n")
+  if not series:
+    print("No history recorded yet, it is collected each time quotas are requested from the cloud")
+    return
 
-    record = resources[server.owner_id]
+  screen_max_width, _ = get_terminal_size()
+  metrics = [name for name in series.keys() if not name.endswith(".max")]
+  name_width = max(len(name) for name in metrics)
+  stats_width = 32
+  width = max(screen_max_width - name_width - stats_width - 6, 10)
+
+  for name in metrics:
+    samples = series[name]
+    values = [v for _, v in samples]
+    limits = [v for _, v in series.get(f"{name}.max", []) if v > 0]
+    limit = limits[-1] if limits else 0
+
+    stats = f"min {min(values):g} max {max(values):g} last {values[-1]:g}"
+    if limit:
+      stats += f"/{limit:g}"
 
-    record[OpenStackQuotaType.CPU_CORES] += server.flavor.vcpus
-    record[OpenStackQuotaType.INSTANCES] += 1
-    record[OpenStackQuotaType.RAM_MB] += server.flavor.raw.ram
-    if server.cluster_name not in record["clusters"]:
-      record["clusters"][server.cluster_name] = 0
+    line = get_sparkline(samples, since, until, width, limit)
+    print(f"{name:>{name_width}} |{line}| {stats}")
 
-    record["clusters"][server.cluster_name] += 1
-    resources[server.owner_id] = record
+  time_format = "%Y-%m-%d %H:%M"
+  _from, _to = datetime.fromtimestamp(since).strftime(time_format), datetime.fromtimestamp(until).strftime(time_format)
+  if width > len(_from) + len(_to):
+    print(f"{' ' * name_width}  {_from}{_to:>{width - len(_from)}}")
+  else:  # narrow terminal, both dates do not fit under the chart
+    print(f"{' ' * name_width}  {_from} - {_to}")
 
-  return resources
+
+def _get_per_user_stats(ostack: OpenStack) -> Dict[str, Dict[OpenStackQuotaType, int]]:
+  return ostack.servers.user_stats
 
 def _show_graph(ostack: OpenStack, quotas: OpenStackQuotas):
   users = ostack.users
@@ -287,10 +333,39 @@ def _show_details(conf: Configuration, ostack: OpenStack, quotas: OpenStackQuota
    print()
 
 
-def __init__(conf: Configuration, details: bool, show_clusters: bool, graph: bool):
+def _write_quotas(conf: Configuration, quotas: OpenStackQuotas, fmt: OutputFormat):
+  """
+  Unlimited metrics have no max and available values
+  """
+  with RecordWriter(fmt, ["region", "metric", "used", "available", "max", "percents"]) as writer:
+    for metric in quotas:
+      unlimited = metric.max_count < 0
+      writer.write(
+        region=conf.region,
+        metric=metric.name,
+        used=metric.used,
+        available=None if unlimited else metric.available,
+        max=None if unlimited else metric.max_count,
+        percents=None if unlimited else round(get_percents(metric.used, metric.max_count), 2)
+      )
+
+
+def __init__(conf: Configuration, details: bool, show_clusters: bool, graph: bool, history: str, format: str):
+  fmt = OutputFormat.from_str(format)
+  if fmt != OutputFormat.table and (history or graph or details):
+    raise ValueError("history, graph and details are supported only by the table output format")
+
+  if history:  # history is rendered from the local data only, no API calls needed
+    _show_history(conf, history)
+    return
+
   stack = OpenStack(conf)
   limits = stack.quotas
 
+  if fmt != OutputFormat.table:
+    _write_quotas(conf, limits, fmt)
+    return
+
   to = TableOutput(
     TableColumn("Metric", length=limits.max_metric_len, pos=TableColumnPosition.right, sep=":", inv_ch=Colors.RED.wrap_len()),
     TableColumn("Used", length=7, pos=TableColumnPosition.right, sep="|", inv_ch=Colors.RED.wrap_len()),
@@ -17,6 +17,8 @@ from openstack_cli.core.output import StatusOutput, Console
 from openstack_cli.modules.openstack import OpenStack, OpenStackVMInfo, ServerPowerState
 from openstack_cli.core.config import Configuration
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.openstack.api_objects import ComputeServerActionRebootType
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter, is_active
 
 
 __module__ = CommandMetaInfo("reboot", item_help="Reboots the requested VMs")
@@ -30,9 +32,14 @@ def __init__(conf: Configuration, name: str, hard: bool, own: bool):
   ostack = OpenStack(conf)
 
   def __work_unit(value: OpenStackVMInfo) -> bool:
-    return ostack.start_instance(value)
+    return ostack.reboot_instance(value, ComputeServerActionRebootType.hard if hard else ComputeServerActionRebootType.soft)
 
-  so = StatusOutput(__work_unit, pool_size=5, additional_errors=ostack.last_errors)
+  def __is_rebooted(value: OpenStackVMInfo) -> bool:
+    # server is changing the status to REBOOT and back to ACTIVE, so it should be updated after the reboot request
+    return is_active(value) and value.updated is not None and \
+      (updated[value.id] is None or value.updated > updated[value.id])
+
+  so = StatusOutput(__work_unit, additional_errors=ostack.last_errors, retries=2, concurrency=ostack.concurrency)
   servers = ostack.get_server_by_cluster(
     name,
     sort=True,
@@ -47,6 +54,9 @@ def __init__(conf: Configuration, name: str, hard: bool, own: bool):
   if Console.confirm_operation("reboot", servers):
     flatten_servers = [server for server_pair in servers.values() for server in server_pair]
 
-    so.start("Rebooting nodes", objects=flatten_servers)
+    updated = {server.id: server.updated for server in flatten_servers}
+    rebooted = so.start("Rebooting nodes", objects=flatten_servers)
+    StatusOutput(additional_errors=ostack.last_errors)\
+      .track("Waiting for nodes", ServerStatusWaiter(ostack, rebooted, target=__is_rebooted))
   else:
     print("Aborted....")
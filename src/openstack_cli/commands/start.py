@@ -17,6 +17,7 @@ from openstack_cli.core.output import StatusOutput, Console
 from openstack_cli.modules.openstack import OpenStack, OpenStackVMInfo, ServerPowerState
 from openstack_cli.core.config import Configuration
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter, is_active
 
 
 __module__ = CommandMetaInfo("start", "Starts requested VMs")
@@ -31,7 +32,7 @@ def __init__(conf: Configuration, name: str, own: bool):
   def __work_unit(value: OpenStackVMInfo) -> bool:
     return ostack.start_instance(value)
 
-  so = StatusOutput(__work_unit, pool_size=5, additional_errors=ostack.last_errors)
+  so = StatusOutput(__work_unit, additional_errors=ostack.last_errors, retries=2, concurrency=ostack.concurrency)
 
   servers = ostack.get_server_by_cluster(
     name,
@@ -47,6 +48,8 @@ def __init__(conf: Configuration, name: str, own: bool):
   if Console.confirm_operation("start", servers):
     flatten_servers = [server for server_pair in servers.values() for server in server_pair]
 
-    so.start("Starting nodes", objects=flatten_servers)
+    started = so.start("Starting nodes", objects=flatten_servers)
+    StatusOutput(additional_errors=ostack.last_errors)\
+      .track("Waiting for nodes", ServerStatusWaiter(ostack, started, target=is_active))
   else:
     print("Aborted....")
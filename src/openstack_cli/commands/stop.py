@@ -17,6 +17,7 @@ from openstack_cli.core.output import StatusOutput, Console
 from openstack_cli.modules.openstack import OpenStack, OpenStackVMInfo, ServerPowerState
 from openstack_cli.core.config import Configuration
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter, is_stopped
 
 
 __module__ = CommandMetaInfo("stop", item_help="Stops requested VMs")
@@ -31,7 +32,7 @@ def __init__(conf: Configuration, name: str, own: bool):
   def __work_unit(value: OpenStackVMInfo) -> bool:
     return ostack.stop_instance(value)
 
-  so = StatusOutput(__work_unit, pool_size=5, additional_errors=ostack.last_errors)
+  so = StatusOutput(__work_unit, additional_errors=ostack.last_errors, retries=2, concurrency=ostack.concurrency)
 
   servers = ostack.get_server_by_cluster(
     name,
@@ -42,7 +43,9 @@ def __init__(conf: Configuration, name: str, own: bool):
   if Console.confirm_operation("stop", servers):
     flatten_servers = [server for server_pair in servers.values() for server in server_pair]
 
-    so.start("Stopping nodes", objects=flatten_servers)
+    stopped = so.start("Stopping nodes", objects=flatten_servers)
+    StatusOutput(additional_errors=ostack.last_errors)\
+      .track("Waiting for nodes", ServerStatusWaiter(ostack, stopped, target=is_stopped))
   else:
     print("Aborted....")
 
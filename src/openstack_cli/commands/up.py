@@ -12,7 +12,6 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from time import sleep
 from typing import List
 
 from openstack_cli.modules.apputils.terminal.colors import Colors
@@ -23,7 +22,9 @@ from openstack_cli.modules.openstack import OpenStack, OpenStackVMInfo
 from openstack_cli.core.config import Configuration
 from openstack_cli.modules.apputils.terminal import TableOutput, TableColumn
 from openstack_cli.modules.apputils.discovery import CommandMetaInfo
-from openstack_cli.modules.openstack.objects import ServerState, OSImageInfo, OSFlavor
+from openstack_cli.modules.openstack.objects import OSImageInfo, OSFlavor, OpenStackQuotaType
+from openstack_cli.modules.openstack.console_log import ConsoleLogTailer
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter, is_active, is_build_failed
 
 __module__ = CommandMetaInfo("up", "Deploys new cluster")
 __args__ = __module__.arg_builder\
@@ -38,20 +39,6 @@ from openstack_cli.modules.utils import ValueHolder
 
 
 def __init__(conf: Configuration, name: str, count: int, flavor: str, image: str, key: str, password: str):
-
-  def __work_unit(x: OpenStackVMInfo) -> bool:
-    while True:
-      if x.status == ServerState.active:
-        return True
-
-      if x.status not in [ServerState.building, ServerState.build, ServerState.active]:
-        return False
-
-      sleep(2)
-      #  ToDo: short term cache data by reservation_id
-      x = ostack.get_server_by_id(x)
-
-  # ======================================================================
   ostack = OpenStack(conf)
   vh = ValueHolder(2)
 
@@ -107,9 +94,25 @@ def __init__(conf: Configuration, name: str, count: int, flavor: str, image: str
       _key = _default_key if not key else ostack.get_keypair(key, _default_key)
       _pass = conf.default_vm_password if not password else password
 
+  # == check quotas
+  nodes_count: int = len(name) if isinstance(name, list) else count
+  requested = {
+    OpenStackQuotaType.INSTANCES: nodes_count,
+    OpenStackQuotaType.CPU_CORES: img_flavor.vcpus * nodes_count,
+    OpenStackQuotaType.RAM_MB: img_flavor.raw.ram * nodes_count
+  }
+  with Console.status_context("Checking project quotas"):
+    exceeded = ostack.quotas.exceeded(requested)
+
+  if exceeded:
+    for quota in exceeded:
+      Console.print_error(f"Not enough {quota.name} quota: requested {requested[quota.type]}, "
+                          f"available {quota.available} of {quota.max_count}")
+    return
+
   # == create nodes
 
-  so = StatusOutput(__work_unit, pool_size=2, additional_errors=ostack.last_errors)
+  so = StatusOutput(additional_errors=ostack.last_errors)
 
   with Console.status_context("Asking for node creation"):
     servers = ostack.create_instances(
@@ -124,20 +127,12 @@ def __init__(conf: Configuration, name: str, count: int, flavor: str, image: str
       so.check_issues()
       return
 
-  so.start("Creating nodes ", objects=servers)
+  so.track("Creating nodes ", ServerStatusWaiter(ostack, servers, target=is_active, failed=is_build_failed))
 
   # == Configure nodes
   def __work_unit_waiter(x: OpenStackVMInfo) -> bool:
-    tries: int = 0
-    while tries < 200:
-      log = ostack.get_server_console_log(x.id)
-      for l in log:
-        if "finished" in l or "login:" in l:
-          return True
-
-      sleep(2)
-      tries += 1
-    return False
+    tailer = ConsoleLogTailer(ostack, x)
+    return tailer.wait_for(lambda l: "finished" in l or "login:" in l) is not None
 
   so = StatusOutput(__work_unit_waiter, pool_size=5, additional_errors=ostack.last_errors)
   so.start("Configure nodes", servers)
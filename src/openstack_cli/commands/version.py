@@ -14,13 +14,13 @@
 #  limitations under the License.
 
 import os
+import sys
 from calendar import timegm
 from datetime import datetime
 from time import strptime
 from typing import List, Tuple
 
 from openstack_cli.modules.apputils.terminal.colors import Colors
-from openstack_cli.modules.apputils.curl import curl
 from openstack_cli.modules.apputils.json2obj import SerializableObject
 
 from openstack_cli import __app_name__, __app_version__, __my_root_dir__, __properties_file__
@@ -112,6 +112,7 @@ def print_banner(ver: ConfProperties):
 
 
 def get_asset(ver: ConfProperties) -> Tuple[GHRelease, GHAsset]:
+  from openstack_cli.modules.apputils.curl import curl  # network stack is loaded only on the update check
   r = curl(ver.update_src)
   if r.code not in [200, 201]:
     return None, None
@@ -177,7 +178,8 @@ def print_little_banner():
     More details available using "{Colors.YELLOW}version{Colors.RESET}" command
   {Colors.BRIGHT_BLACK}=========================================================================================={Colors.RESET}
   """
-  print(banner, flush=True)
+  # notice goes to stderr as it is printed before the output of any command, including machine-readable one
+  print(banner, file=sys.stderr, flush=True)
 
 
 def __init__():
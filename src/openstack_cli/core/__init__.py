@@ -15,37 +15,128 @@
 
 
 import os
+import sys
+import time
 from openstack_cli import __app_name__ as app_name
 from openstack_cli import commands
 from openstack_cli.core.config import Configuration
 from openstack_cli.core.updates import upgrade_manager, import_upgrade_packs
+from openstack_cli.commands.version import get_current_version
+from openstack_cli.core.agent_commands import AGENT_COMMANDS, AGENT_LOCAL_OPTIONS, AGENT_SERVICE_COMMAND
+from openstack_cli.core.profiling import CommandProfiler
+from openstack_cli.modules.apputils.config.storages.base_storage import user_data_dir
+from openstack_cli.modules.apputils.tracing import tracer
 
 
-def main_entry():
+NO_CONFIGURATION_COMMANDS = (None, "help", "version")
+
+
+def _get_cassette(kwargs: dict):
+  """
+  --record=file.json saves API requests and responses to the file, --replay=file.json serves them back instead
+  of the cloud, --replay-latency=ms adds delay to each replayed response
+
+  :rtype openstack_cli.modules.apputils.curl.cassette.Cassette or None
+  """
+  if "record" not in kwargs and "replay" not in kwargs:
+    return None
+
+  # the transport is imported only when requested, it is too heavy for commands not going to the cloud
+  from openstack_cli.modules.apputils.curl.cassette import Cassette, CassetteMode
+
+  if "record" in kwargs and "replay" in kwargs:
+    raise ValueError("--record and --replay options could not be used together")
 
-  conf: Configuration = Configuration(upgrade_manager=upgrade_manager, app_name=app_name, lazy_init=True)
-  if upgrade_manager.upgrade_required(conf):
-    import_upgrade_packs()
+  if kwargs.get("record"):
+    return Cassette(kwargs["record"], CassetteMode.record)
 
+  if kwargs.get("replay"):
+    try:
+      latency = float(kwargs.get("replay-latency") or 0) / 1000
+    except ValueError:
+      raise ValueError(f"--replay-latency expects milliseconds, got '{kwargs['replay-latency']}'")
+
+    return Cassette(kwargs["replay"], CassetteMode.replay, latency=latency)
+
+  raise ValueError("--record and --replay options require the cassette file name")
+
+
+def main_entry():
+  conf: Configuration or None = None
+  is_up_to_date: bool = False
   is_debug: bool = "debug" in commands.discovery.kwargs_name
+  # --trace[=file.json] records spans of the api requests and exports them in Chrome trace format
+  trace_file: str or None = commands.discovery.kwargs.get("trace")
+  if trace_file is not None:
+    tracer.enable()
+
+  # --profile[=cpu|mem] runs the command under cProfile or tracemalloc, reports are stored to the app folder
+  profile_mode: str or None = commands.discovery.kwargs.get("profile")
+  profiler: CommandProfiler or None = None
+  if profile_mode is not None:
+    try:
+      profiler = CommandProfiler(profile_mode, os.path.join(user_data_dir(appname=app_name), "profiles"),
+                                 commands.discovery.command_name or "none")
+    except ValueError as e:
+      print(f"Error: {str(e)}")
+      return 1
+
+  try:
+    cassette = _get_cassette(commands.discovery.kwargs)
+  except (ValueError, OSError) as e:
+    print(f"Error: {str(e)}")
+    return 1
+
+  record_file: str or None = None
+  replay_file: str or None = None
+  if cassette:
+    from openstack_cli.modules.apputils.curl import use_cassette
+    from openstack_cli.modules.apputils.curl.cassette import CassetteMode
+    use_cassette(cassette)
+    record_file = cassette.path if cassette.mode == CassetteMode.record else None
+    replay_file = cassette.path if cassette.mode == CassetteMode.replay else None
+
+  # read-only commands are served by the agent if it is running, it keeps authenticated session and warm caches
+  if commands.discovery.command_name in AGENT_COMMANDS and \
+    not set(AGENT_LOCAL_OPTIONS) & set(commands.discovery.kwargs_name):
+    from openstack_cli.core.agent import AgentClient
+    exit_code = AgentClient(app_name).execute(commands.discovery.argv)
+    if exit_code is not None:
+      return exit_code
+
+  # commands which are not using the configuration should not pay for opening and checking it
+  if commands.discovery.command_name not in NO_CONFIGURATION_COMMANDS:
+    conf = Configuration(upgrade_manager=upgrade_manager, app_name=app_name, lazy_init=True)
+    is_up_to_date = conf.is_up_to_date(get_current_version().version)
+    if not is_up_to_date and upgrade_manager.upgrade_required(conf):
+      import_upgrade_packs()
+
   if is_debug:
     os.environ["API_DEBUG"] = "True"
+  if profiler:
+    profiler.start()
   try:
     # currently hack to avoid key generating on reset command
     if commands.discovery.command_name == "conf" and commands.discovery.command_arguments[:1] == "reset":
       pass
-    elif commands.discovery.command_name == "version":
+    elif conf is None:
       pass
     else:
-      conf.initialize()
+      conf.initialize(upgrade=not is_up_to_date)
       if conf.check_for_update:
         from openstack_cli.commands.version import print_little_banner
         print_little_banner()
 
-    commands.discovery.start_application(kwargs={
-      "conf": conf,
-      "debug": is_debug
-    })
+    with tracer.span("command", "app", command=commands.discovery.command_name):
+      commands.discovery.start_application(kwargs={
+        "conf": conf,
+        "debug": is_debug,
+        "trace": trace_file,
+        "profile": profile_mode,
+        "record": record_file,
+        "replay": replay_file,
+        "replay-latency": commands.discovery.kwargs.get("replay-latency")
+      })
   except KeyboardInterrupt:
     print("Cancelled by user...")
   except Exception as e:
@@ -53,6 +144,27 @@ def main_entry():
       raise e
     else:
       print(f"Error: {str(e)}")
+  finally:
+    if profiler:
+      print(f"Profile report saved to {profiler.stop()}, raw data: {profiler.raw_path}", file=sys.stderr)
+
+    if conf:
+      conf.flush_caches()
+
+    if cassette:
+      use_cassette(None)
+      cassette.save()
+      if record_file:
+        print(f"Cassette saved to {os.path.abspath(cassette.path)}", file=sys.stderr)
+
+    if tracer.enabled:
+      trace_file = trace_file if trace_file else f"{app_name}-trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+      print(f"Trace saved to {tracer.export(trace_file)}", file=sys.stderr)
+
+    # the command could change configuration or servers, agent should not serve the outdated state
+    if conf and commands.discovery.command_name not in AGENT_COMMANDS + (AGENT_SERVICE_COMMAND,):
+      from openstack_cli.core.agent import AgentClient
+      AgentClient(app_name).invalidate()
 
 
 if __name__ == "__main__":
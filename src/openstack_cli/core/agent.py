@@ -0,0 +1,445 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from io import StringIO, TextIOBase
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from openstack_cli import __app_version__, __my_root_dir__
+from openstack_cli.core.agent_commands import AGENT_COMMANDS
+from openstack_cli.modules.apputils.config.storages.base_storage import user_data_dir
+from openstack_cli.modules.apputils.terminal.get_terminal_size import get_terminal_size
+
+AGENT_PROTOCOL_VERSION = 1
+
+SOCKET_FILE_NAME = "agent.sock"
+LOG_FILE_NAME = "agent.log"
+
+
+def is_agent_supported() -> bool:
+  return hasattr(socket, "AF_UNIX")
+
+
+def agent_socket_path(app_name: str) -> str:
+  return os.path.join(user_data_dir(appname=app_name), SOCKET_FILE_NAME)
+
+
+def agent_fingerprint() -> str:
+  """
+  Client and agent should be the same application build, otherwise the agent could serve outdated code
+  """
+  return f"{AGENT_PROTOCOL_VERSION}:{__app_version__}:{__my_root_dir__}"
+
+
+def _detach_stream(stream):
+  """
+  Points the stream with closed reader to devnull, so the interpreter would not fail flushing it at exit
+  """
+  try:
+    os.dup2(os.open(os.devnull, os.O_WRONLY), stream.fileno())
+  except (OSError, ValueError):  # not a file-backed stream
+    pass
+
+
+class AgentFrame(object):
+  """
+  Agent response is a sequence of frames:
+
+  +----------+------------------+-----------+
+  |   type   |  payload length  |  payload  |
+  +----------+------------------+-----------+
+     1 byte      4 bytes (BE)
+  """
+  STDOUT = b"o"
+  STDERR = b"e"
+  STATUS = b"s"
+  EXIT = b"x"
+  REJECT = b"r"
+
+  __header = struct.Struct(">cI")
+
+  @classmethod
+  def write(cls, conn: socket.socket, frame_type: bytes, payload: bytes = b""):
+    conn.sendall(cls.__header.pack(frame_type, len(payload)) + payload)
+
+  @classmethod
+  def read(cls, f) -> Tuple[bytes or None, bytes]:
+    header = f.read(cls.__header.size)
+    if len(header) < cls.__header.size:
+      return None, b""
+
+    frame_type, size = cls.__header.unpack(header)
+    return frame_type, f.read(size) if size else b""
+
+
+class AgentStream(TextIOBase):
+  """
+  Replacement of stdout/stderr, which sends the command output to the agent client
+  """
+  __buffer_size = 4096
+
+  def __init__(self, conn: socket.socket, frame_type: bytes, tty: bool = True):
+    self.__conn = conn
+    self.__frame_type = frame_type
+    self.__tty = tty
+    self.__buffer: List[str] = []
+    self.__buffered: int = 0
+    self.__broken: bool = False
+
+  @property
+  def encoding(self):
+    return "UTF-8"
+
+  def isatty(self) -> bool:
+    return self.__tty
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, s: str) -> int:
+    self.__buffer.append(s)
+    self.__buffered += len(s)
+    if self.__buffered >= self.__buffer_size:
+      self.flush()
+
+    return len(s)
+
+  def flush(self):
+    if not self.__buffer:
+      return
+
+    data = "".join(self.__buffer).encode("UTF-8")
+    self.__buffer = []
+    self.__buffered = 0
+    if self.__broken:
+      return
+
+    try:
+      AgentFrame.write(self.__conn, self.__frame_type, data)
+    except OSError:  # client gone, let the command to finish silently
+      self.__broken = True
+
+
+class AgentClient(object):
+  def __init__(self, app_name: str, connect_timeout: float = 0.5):
+    self.__socket_path = agent_socket_path(app_name)
+    self.__connect_timeout = connect_timeout
+
+  @property
+  def socket_path(self) -> str:
+    return self.__socket_path
+
+  @property
+  def is_available(self) -> bool:
+    return is_agent_supported() and os.path.exists(self.__socket_path)
+
+  def __send(self, action: str, **kwargs) -> Optional[socket.socket]:
+    if not self.is_available:
+      return None
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+      conn.settimeout(self.__connect_timeout)
+      conn.connect(self.__socket_path)
+      conn.settimeout(None)
+      request = {"action": action, "fingerprint": agent_fingerprint()}
+      request.update(kwargs)
+      conn.sendall(json.dumps(request).encode("UTF-8") + b"\n")
+      return conn
+    except OSError:
+      conn.close()
+      return None
+
+  def __responses(self, conn: socket.socket) -> Iterable[Tuple[bytes, bytes]]:
+    with conn, conn.makefile("rb") as f:
+      while True:
+        frame_type, payload = AgentFrame.read(f)
+        if frame_type is None:
+          return
+        yield frame_type, payload
+
+  def __simple_request(self, action: str) -> Tuple[bytes or None, bytes]:
+    conn = self.__send(action)
+    if not conn:
+      return None, b""
+
+    try:
+      for frame_type, payload in self.__responses(conn):
+        return frame_type, payload
+    except OSError:
+      pass
+
+    return None, b""
+
+  def execute(self, argv: List[str]) -> int or None:
+    """
+    Execute the command by the agent, output is streamed to the current stdout/stderr
+
+    :return exit code of the command or None if the command was not accepted by the agent
+    """
+    size = get_terminal_size()
+    # streams are captured before the request, the agent living in the same process replaces them while executing
+    streams = {AgentFrame.STDOUT: sys.stdout, AgentFrame.STDERR: sys.stderr}
+    conn = self.__send("exec", argv=argv, columns=size.columns, lines=size.lines, tty=sys.stdout.isatty())
+    if not conn:
+      return None
+
+    started = False
+    try:
+      for frame_type, payload in self.__responses(conn):
+        if frame_type == AgentFrame.REJECT:
+          return None
+
+        started = True
+        if frame_type in streams:
+          try:
+            streams[frame_type].write(payload.decode("UTF-8"))
+            streams[frame_type].flush()
+          except BrokenPipeError:  # local reader has gone, like "list | head", nobody to report the error to
+            _detach_stream(streams[frame_type])
+            return 1
+        elif frame_type == AgentFrame.EXIT:
+          return int(payload) if payload else 0
+    except OSError:
+      if not started:
+        return None
+
+    if not started:  # agent closed the connection without answer, it is about to stop
+      return None
+
+    print("Error: connection to the agent has been lost")
+    return 1
+
+  def ping(self) -> dict or None:
+    frame_type, payload = self.__simple_request("ping")
+    if frame_type != AgentFrame.STATUS:
+      return None
+
+    return json.loads(payload.decode("UTF-8"))
+
+  def invalidate(self) -> bool:
+    """
+    Ask the agent to drop the in-memory state, to be called after commands which are changing configuration or servers
+    """
+    return self.__simple_request("invalidate")[0] == AgentFrame.EXIT
+
+  def stop(self) -> bool:
+    return self.__simple_request("stop")[0] == AgentFrame.EXIT
+
+
+class AgentServer(object):
+  """
+  Long-living process, which keeps configuration, authenticated OpenStack session and in-memory inventory ready
+  for the commands forwarded by the AgentClient.
+
+  Commands are executed one at a time, the same way as they would be executed by the application itself
+  """
+  __listen_backlog = 16
+  __accept_timeout = 1
+
+  def __init__(self, socket_path: str, conf_factory: Callable, refresh_interval: int = 60,
+               allowed_commands: Tuple[str, ...] = AGENT_COMMANDS):
+    """
+    :arg conf_factory function returning initialized Configuration, called on start and after any invalidation
+    :arg refresh_interval how often token and servers list should be refreshed in seconds
+    """
+    self.__socket_path = socket_path
+    self.__conf_factory = conf_factory
+    self.__refresh_interval = refresh_interval
+    self.__allowed_commands = allowed_commands
+    self.__lock = threading.RLock()
+    self.__stop_event = threading.Event()
+    self.__conf = None
+    self.__is_dirty: bool = True
+    self.__started: float = time.time()
+    self.__refreshed: float = 0
+    self.__served: int = 0
+
+  def _open_session(self, conf):
+    """
+    Creates OpenStack session shared by all commands executed by the agent
+    """
+    from openstack_cli.modules.openstack import OpenStack
+    OpenStack.unshare()
+    OpenStack(conf).share().keep_alive()
+
+  def _refresh_session(self, conf):
+    from openstack_cli.modules.openstack import OpenStack
+    OpenStack(conf).keep_alive()
+
+  def __load(self):
+    if self.__conf:
+      self.__conf.flush_caches()
+
+    self.__conf = self.__conf_factory()
+    self._open_session(self.__conf)
+    self.__is_dirty = False
+    self.__refreshed = time.time()
+
+  def __refresh(self):
+    with self.__lock:
+      try:
+        if self.__is_dirty:
+          self.__load()
+        else:
+          self._refresh_session(self.__conf)
+          self.__refreshed = time.time()
+
+        if self.__conf:
+          self.__conf.flush_caches()
+      except Exception as e:
+        print(f"Error: unable to refresh the session: {str(e)}")
+
+  def __refresh_loop(self):
+    while not self.__stop_event.wait(self.__refresh_interval):
+      self.__refresh()
+
+  @property
+  def status(self) -> dict:
+    return {
+      "pid": os.getpid(),
+      "started": self.__started,
+      "refreshed": self.__refreshed,
+      "served": self.__served
+    }
+
+  def __execute(self, conn: socket.socket, request: dict) -> int:
+    from openstack_cli import commands
+    from openstack_cli.modules.apputils.discovery import CommandsDiscovery
+
+    tty = bool(request.get("tty", True))
+    out, err = AgentStream(conn, AgentFrame.STDOUT, tty), AgentStream(conn, AgentFrame.STDERR, tty)
+    env = {"COLUMNS": str(request.get("columns", "")), "LINES": str(request.get("lines", ""))}
+
+    with self.__lock:
+      if self.__is_dirty:
+        self.__load()
+
+      std_streams = sys.stdout, sys.stderr, sys.stdin
+      saved_env = {k: os.environ.get(k) for k in env}
+      sys.stdout, sys.stderr, sys.stdin = out, err, StringIO()
+      os.environ.update(env)
+      try:
+        discovery = CommandsDiscovery(commands.__file__, commands.__name__, argv=request["argv"]).collect()
+        discovery.start_application(kwargs={
+          "conf": self.__conf,
+          "debug": False
+        })
+        return 0
+      except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 0
+      except Exception as e:
+        print(f"Error: {str(e)}")
+        return 0
+      finally:
+        out.flush()
+        err.flush()
+        sys.stdout, sys.stderr, sys.stdin = std_streams
+        for k, v in saved_env.items():
+          if v is None:
+            del os.environ[k]
+          else:
+            os.environ[k] = v
+
+        self.__served += 1
+        if self.__conf:
+          self.__conf.flush_caches()
+
+  def __handle(self, conn: socket.socket):
+    try:
+      with conn, conn.makefile("rb") as f:
+        try:
+          request = json.loads(f.readline().decode("UTF-8"))
+        except ValueError:
+          return
+
+        action = request.get("action")
+        argv = request.get("argv")
+        if request.get("fingerprint") != agent_fingerprint():
+          AgentFrame.write(conn, AgentFrame.REJECT)
+        elif action == "ping":
+          AgentFrame.write(conn, AgentFrame.STATUS, json.dumps(self.status).encode("UTF-8"))
+        elif action == "invalidate":
+          self.__is_dirty = True
+          AgentFrame.write(conn, AgentFrame.EXIT)
+        elif action == "stop":
+          self.stop()
+          AgentFrame.write(conn, AgentFrame.EXIT)
+        elif action == "exec" and isinstance(argv, list) and argv[:1] and argv[0] in self.__allowed_commands:
+          AgentFrame.write(conn, AgentFrame.EXIT, str(self.__execute(conn, request)).encode("UTF-8"))
+        else:
+          AgentFrame.write(conn, AgentFrame.REJECT)
+    except OSError:  # client disconnected
+      pass
+
+  def __bind(self) -> socket.socket:
+    if os.path.exists(self.__socket_path):
+      probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+      try:
+        probe.connect(self.__socket_path)
+        raise RuntimeError(f"Agent is already listening on {self.__socket_path}")
+      except OSError:  # stale socket left by killed agent
+        os.remove(self.__socket_path)
+      finally:
+        probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)  # socket gives access to the authenticated session, it should be private
+    try:
+      server.bind(self.__socket_path)
+    finally:
+      os.umask(umask)
+
+    os.chmod(self.__socket_path, 0o600)
+    server.listen(self.__listen_backlog)
+    server.settimeout(self.__accept_timeout)
+    return server
+
+  def serve_forever(self, on_ready: Callable[[], None] = None):
+    self.__stop_event.clear()
+    with self.__lock:
+      self.__load()
+
+    server = self.__bind()
+    threading.Thread(target=self.__refresh_loop, name="agent-refresh", daemon=True).start()
+    if on_ready:
+      on_ready()
+
+    try:
+      while not self.__stop_event.is_set():
+        try:
+          conn, _ = server.accept()
+        except socket.timeout:
+          continue
+
+        conn.settimeout(None)
+        threading.Thread(target=self.__handle, args=(conn,), name="agent-client", daemon=True).start()
+    finally:
+      server.close()
+      if os.path.exists(self.__socket_path):
+        os.remove(self.__socket_path)
+
+      with self.__lock:
+        if self.__conf:
+          self.__conf.flush_caches()
+
+  def stop(self):
+    self.__stop_event.set()
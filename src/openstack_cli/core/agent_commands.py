@@ -0,0 +1,20 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# read-only commands, which could be served by the agent. Interactive commands (ssh, sftp, exec) need local terminal
+AGENT_COMMANDS = ("list", "info", "images", "flavors", "networks", "quota")
+AGENT_SERVICE_COMMAND = "agent"
+# options, which require the command to be executed locally: debug output, long-running commands
+AGENT_LOCAL_OPTIONS = ("debug", "watch", "trace", "profile", "record", "replay")
@@ -16,15 +16,27 @@
 import os
 import json
 import time
+import hashlib
 from typing import List
 
-from openstack_cli.modules.apputils.config import BaseConfiguration, StorageProperty, StorageType, DataCacheExtension
-from openstack_cli.modules.openstack.objects import VMProject
+from openstack_cli.modules.apputils.config import BaseConfiguration, StorageProperty, StorageType, DataCacheExtension, \
+  TimeSeriesExtension
 
 
 class Configuration(BaseConfiguration):
   __OBJECTS_CACHE_TABLE = "cache"
+  __QUOTA_HISTORY_TABLE = "quota_history"
   __cache_invalidation: float = time.mktime(time.gmtime(8 * 3600))  # 8 hours
+  __cache_lifetimes = {
+    "OSFlavor": time.mktime(time.gmtime(24 * 3600)),  # 24 hours
+    "OSNetwork": time.mktime(time.gmtime(24 * 3600)),  # 24 hours
+    "OpenStackQuotas": 60,  # seconds, usage changes with every created or removed server
+  }
+  __cache_size_limit: int = 64 * 1024 * 1024  # 64 Mb
+  __min_concurrency: int = 2
+  __max_concurrency: int = 32
+  __api_retries: int = 3
+  __retry_budget: int = 20  # percents of requests
   _keys_table = "keys"
 
   def __init__(self, storage: StorageType = StorageType.SQL,
@@ -36,11 +48,17 @@ class Configuration(BaseConfiguration):
       upgrade_manager=upgrade_manager
     )
 
+    self.__cache_namespace: str or None = None
     self.add_cache_ext(self.__OBJECTS_CACHE_TABLE, self.__cache_invalidation)
+    for name, lifetime in self.__cache_lifetimes.items():
+      self.get_cache_ext(self.__OBJECTS_CACHE_TABLE).set_lifetime(name, lifetime)
 
     self.__migrate_if_needed()
 
   def __migrate_if_needed(self):
+    if self.stamp:  # stamp is written by versions already using new options format
+      return
+
     if self._options_flags_name_old not in self._storage.get_property_list(self._options_table):
       return
 
@@ -57,10 +75,101 @@ class Configuration(BaseConfiguration):
     self._storage.set_text_property(self._options_table, self._options_flags_name, str(new_val))
     self._storage.delete_property(self._options_table, self._options_flags_name_old)
 
+  @property
+  def cache_namespace(self) -> str:
+    """
+    Identity of the currently configured cloud: auth url, region, project and interface
+    """
+    if self.__cache_namespace is None:
+      identity = "|".join([str(self.os_address), str(self.region), str(self.project.id), self.interface])
+      self.__cache_namespace = hashlib.sha1(identity.encode("UTF-8")).hexdigest()[:16]
+
+    return self.__cache_namespace
+
   @property
   def cache(self) -> DataCacheExtension:
+    """
+    Objects cache of the currently configured cloud, switching cloud, region or project do not
+    invalidate the cache of the others
+    """
+    return self.get_cache_ext(self.__OBJECTS_CACHE_TABLE).namespace(self.cache_namespace)
+
+  @property
+  def quota_history(self) -> TimeSeriesExtension:
+    """
+    Quota usage history of the currently configured cloud
+    """
+    return self.get_timeseries_ext(self.__QUOTA_HISTORY_TABLE).namespace(self.cache_namespace)
+
+  @property
+  def global_cache(self) -> DataCacheExtension:
     return self.get_cache_ext(self.__OBJECTS_CACHE_TABLE)
 
+  @property
+  def cache_size_limit(self) -> int:
+    p = self._storage.get_property(self._options_table, "cache_size_limit", StorageProperty()).value
+    try:
+      return int(p)
+    except ValueError:
+      return self.__cache_size_limit
+
+  @cache_size_limit.setter
+  def cache_size_limit(self, value: int):
+    self._storage.set_text_property(self._options_table, "cache_size_limit", str(value))
+
+  @property
+  def min_concurrency(self) -> int:
+    p = self._storage.get_property(self._options_table, "min_concurrency", StorageProperty()).value
+    try:
+      return int(p)
+    except ValueError:
+      return self.__min_concurrency
+
+  @min_concurrency.setter
+  def min_concurrency(self, value: int):
+    self._storage.set_text_property(self._options_table, "min_concurrency", str(value))
+
+  @property
+  def max_concurrency(self) -> int:
+    p = self._storage.get_property(self._options_table, "max_concurrency", StorageProperty()).value
+    try:
+      return int(p)
+    except ValueError:
+      return self.__max_concurrency
+
+  @max_concurrency.setter
+  def max_concurrency(self, value: int):
+    self._storage.set_text_property(self._options_table, "max_concurrency", str(value))
+
+  @property
+  def api_retries(self) -> int:
+    p = self._storage.get_property(self._options_table, "api_retries", StorageProperty()).value
+    try:
+      return int(p)
+    except ValueError:
+      return self.__api_retries
+
+  @api_retries.setter
+  def api_retries(self, value: int):
+    self._storage.set_text_property(self._options_table, "api_retries", str(value))
+
+  @property
+  def retry_budget(self) -> int:
+    p = self._storage.get_property(self._options_table, "retry_budget", StorageProperty()).value
+    try:
+      return int(p)
+    except ValueError:
+      return self.__retry_budget
+
+  @retry_budget.setter
+  def retry_budget(self, value: int):
+    self._storage.set_text_property(self._options_table, "retry_budget", str(value))
+
+  def flush_caches(self):
+    if self.global_cache.has_pending_stats:
+      self.global_cache.size_limit = self.cache_size_limit
+    super(Configuration, self).flush_caches()
+
   @property
   def os_address(self) -> str:
     return self._storage.get_property(self._options_table, "os_address", StorageProperty()).value
@@ -68,6 +177,7 @@ class Configuration(BaseConfiguration):
   @os_address.setter
   def os_address(self, value: str):
     self._storage.set_text_property(self._options_table, "os_address", value)
+    self.__cache_namespace = None
 
   @property
   def os_login(self) -> str:
@@ -129,7 +239,12 @@ class Configuration(BaseConfiguration):
     return [VMKeypairItemValue(serialized_obj=k.value) for k in items if k.value]
 
   @property
-  def project(self) -> VMProject:
+  def project(self):
+    """
+    :rtype openstack_cli.modules.openstack.objects.VMProject
+    """
+    from openstack_cli.modules.openstack.objects import VMProject
+
     p = self._storage.get_property(self._options_table, "project_data").value
     if p:
       return VMProject(serialized_obj=p)
@@ -137,8 +252,12 @@ class Configuration(BaseConfiguration):
     return VMProject()
 
   @project.setter
-  def project(self, value: VMProject):
+  def project(self, value):
+    """
+    :type value openstack_cli.modules.openstack.objects.VMProject
+    """
     self._storage.set_text_property(self._options_table, "project_data", value.serialize(), encrypted=True)
+    self.__cache_namespace = None
 
   @property
   def default_network(self):
@@ -188,8 +307,8 @@ class Configuration(BaseConfiguration):
 
   @property
   def check_for_update(self) -> bool:
-    if not self.cache.exists("UpdateClass"):
-      self.cache.set("UpdateClass", "Aha-ha, here we are!")
+    if time.time() - self.stamp.get("update_check", 0) >= self.__cache_invalidation:
+      self._update_stamp(update_check=time.time())
       return True
 
     return False
@@ -209,6 +328,7 @@ class Configuration(BaseConfiguration):
   @region.setter
   def region(self, value):
     self._storage.set_text_property(self._options_table, "region", value, encrypted=True)
+    self.__cache_namespace = None
 
   @property
   def supported_os_names(self) -> List[str]:
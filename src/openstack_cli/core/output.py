@@ -13,19 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import json
 import os
+import re
 import sys
+import time
 
+from datetime import datetime
+from enum import Enum
 from io import StringIO
-from concurrent.futures._base import Future, CancelledError
-from concurrent.futures.thread import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
 from contextlib import ContextDecorator
 from getpass import getpass
-from typing import Callable, List, Dict, TypeVar
+from typing import Callable, Deque, List, Dict, Iterable, Tuple, TypeVar, TextIO
 
 from openstack_cli.modules.apputils.terminal.colors import Colors, Symbols
+from openstack_cli.modules.concurrency import ConcurrencyController, shared_executor
 from openstack_cli.modules.openstack import OpenStackVMInfo, JSONValueError
 from openstack_cli.modules.openstack.api_objects import ApiErrorResponse
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter
 from openstack_cli.modules.apputils.progressbar import ProgressBar, ProgressBarOptions, CharacterStyles, get_terminal_size
 
 
@@ -33,14 +41,24 @@ T = TypeVar('T')
 
 
 class StatusOutput(object):
-  def __init__(self, f: Callable[[], bool] or None = None, pool_size: int = 5, additional_errors: Callable = None):
+  __heartbeat_interval = 1
+
+  def __init__(self, f: Callable[[], bool] or None = None, pool_size: int = 5, additional_errors: Callable = None,
+               timeout: float = None, retries: int = 0, concurrency: ConcurrencyController = None):
     """
     :param f: function to execute
-    :param pool_size: size of pool wor executing f
+    :param pool_size: max amount of f executed at the same time, ignored if concurrency is set
     :param additional_errors: ref to function with no args and return type List[str]
+    :param timeout: max time of single f execution in seconds, the task is considered as failed after that, but
+                    still counted against the concurrency limit until f returns
+    :param retries: how many times to re-try failed task
+    :param concurrency: adaptive limit of f executed at the same time
     """
     self.__callable: Callable[[None], bool] = f
-    self.__pool_size = pool_size
+    self.__pool_size = max(pool_size, 1)
+    self.__timeout = timeout
+    self.__retries = retries
+    self.__concurrency = concurrency
     self.__additional_errors: Callable = additional_errors
     self.__errors = []
     self.__out = []
@@ -114,65 +132,307 @@ class StatusOutput(object):
         print(dino[i])
     print("///////// END")
 
-  def start(self, title: str, objects: List[object]):
+  def __progress_bar(self, title: str, stdout) -> ProgressBar:
+    p_options: ProgressBarOptions = ProgressBarOptions(
+      progress_format="{begin_line}{text}:  [{percents_done:>3}% {filled}{empty} {elapsed}] {status}  | {value}/{max} {end_line}",
+      character_style=CharacterStyles.squared
+    )
+    return ProgressBar(title, width=15, options=p_options, stdout=stdout)
+
+  def track(self, title: str, waiter: ServerStatusWaiter):
     """
-    :return tuple of intercepted stdout and stdin
+    Show progress of the servers transition to the state awaited by the waiter
     """
-    total_tasks: int = len(objects)
-    failed_tasks: int = 0
     ok_tasks: int = 0
+    failed_tasks: int = 0
     status_pattern: str = f"{{:3d}} {Symbols.CHECK.green()} | {{:3d}} {Symbols.CROSS.red()}"
+    p: ProgressBar = self.__progress_bar(title, sys.stdout)
+    p.start(waiter.total)
+
+    def _on_done(server: OpenStackVMInfo, is_ok: bool):
+      nonlocal ok_tasks, failed_tasks
+      if is_ok:
+        ok_tasks += 1
+      else:
+        failed_tasks += 1
+        self.__errors.append(f"{server.name}: ended in {server.status.value} state")
+      p.progress(ok_tasks + failed_tasks, status_pattern.format(ok_tasks, failed_tasks))
 
-    with ThreadPoolExecutor(max_workers=self.__pool_size) as e:
-      futures: List[Future] = [e.submit(self.__callable, obj) for obj in objects]
-      stdin, stderr, stdout = sys.stdin, sys.stderr, sys.stdout
-      sys.stdin, sys.stderr, sys.stdout = mystdin, mystderr, mystdout = StringIO(), StringIO(), StringIO()
-      i: int = 0
-      done_indexes: List[int] = []
-      p_options: ProgressBarOptions = ProgressBarOptions(
-        progress_format="{begin_line}{text}:  [{percents_done:>3}% {filled}{empty} {elapsed}] {status}  | {value}/{max} {end_line}",
-        character_style=CharacterStyles.squared
+    try:
+      waiter.wait(
+        on_done=_on_done,
+        on_tick=lambda: p.progress(ok_tasks + failed_tasks, status_pattern.format(ok_tasks, failed_tasks))
       )
-      p: ProgressBar = ProgressBar(title, width=15, options=p_options, stdout=stdout)
-      p.start(total_tasks)
+    except Exception as e:
+      self.__errors += str(e).split(os.linesep)
+    finally:
+      p.stop()
+      self.check_issues()
+
+  def start(self, title: str, objects: List[T]) -> List[T]:
+    """
+    Execute f for each of the objects using shared executor, showing progress
+
+    :return objects processed successfully
+    """
+    total_tasks: int = len(objects)
+    failed_tasks: int = 0
+    ok_tasks: int = 0
+    succeeded: List[T] = []
+    status_pattern: str = f"{{:3d}} {Symbols.CHECK.green()} | {{:3d}} {Symbols.CROSS.red()}"
 
-      try:
-        while len(done_indexes) < len(futures):
-          if i >= len(futures):
-            i = 0
+    executor = shared_executor()
+    queue: Deque[Tuple[int, int]] = deque((i, 0) for i in range(total_tasks))  # object index, attempt
+    running: Dict[Future, Tuple[int, int, float]] = {}  # future: object index, attempt, deadline
+    abandoned: List[Future] = []  # timed out tasks, still occupying the executor threads
+
+    stdin, stderr, stdout = sys.stdin, sys.stderr, sys.stdout
+    sys.stdin, sys.stderr, sys.stdout = mystdin, mystderr, mystdout = StringIO(), StringIO(), StringIO()
+    p: ProgressBar = self.__progress_bar(title, stdout)
+    p.start(total_tasks)
+
+    def _limit() -> int:
+      if not self.__concurrency:
+        return self.__pool_size
+
+      return 0 if self.__concurrency.pause else self.__concurrency.limit
+
+    def _schedule():
+      while queue and len(running) + len(abandoned) < _limit():
+        _i, _attempt = queue.popleft()
+        _deadline = time.monotonic() + self.__timeout if self.__timeout else 0
+        running[executor.submit(self.__callable, objects[_i])] = (_i, _attempt, _deadline)
+
+    def _complete(_i: int, _attempt: int, is_ok: bool, error: str or None = None):
+      nonlocal ok_tasks, failed_tasks
+      if is_ok:
+        ok_tasks += 1
+        succeeded.append(objects[_i])
+      elif _attempt < self.__retries:
+        queue.append((_i, _attempt + 1))
+      else:
+        failed_tasks += 1
+        if error:
+          print(f"Error: {error}", file=mystderr)
 
-          if i in done_indexes:
-            i += 1
+    try:
+      _schedule()
+      last_state: Tuple[int, int] or None = None
+      last_update: float = 0
+      while running or queue:
+        deadlines = [d for _, _, d in running.values() if d]
+        wait_timeout = self.__heartbeat_interval
+        if deadlines:
+          wait_timeout = max(min(wait_timeout, min(deadlines) - time.monotonic()), 0)
+
+        if running or abandoned:
+          done, _ = wait(list(running.keys()) + abandoned, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+        else:  # scheduling is paused by the server
+          time.sleep(min(wait_timeout, self.__concurrency.pause))
+          done = set()
+        abandoned[:] = [future for future in abandoned if not future.done()]
+        for future in done:
+          if future not in running:  # result of the timed out task is ignored
             continue
+          i, attempt, _ = running.pop(future)
+          try:
+            _complete(i, attempt, future.result() is True)
+          except (CancelledError, Exception) as e:
+            _complete(i, attempt, False, str(e))
+
+        now = time.monotonic()
+        for future, (i, attempt, deadline) in list(running.items()):
+          if deadline and now > deadline:
+            del running[future]
+            # thread could not be interrupted, it is counted against the limit till it returns, so hung tasks
+            # and their retries could not take over the shared executor
+            if not future.cancel():
+              abandoned.append(future)
+            _complete(i, attempt, False, f"task timed out after {self.__timeout}s")
+
+        _schedule()
+        # re-draw only if counters changed, elapsed time is refreshed once per heartbeat
+        if last_state != (ok_tasks, failed_tasks) or now - last_update >= self.__heartbeat_interval:
+          last_state, last_update = (ok_tasks, failed_tasks), now
+          p.progress(ok_tasks + failed_tasks, status_pattern.format(ok_tasks, failed_tasks))
+    except Exception as e:
+      print(str(e), file=mystderr)
+    finally:
+      sys.stdin, sys.stderr, sys.stdout = stdin, stderr, stdout
+      p.stop()
+
+      mystdout.seek(0, 0)
+      for line in mystdout.readlines():
+        print(line, end='')
+
+      self.__errors = [line.strip() for line in mystderr.getvalue().split("\n") if line.strip()]
+      self.check_issues()
+
+    return succeeded
+
+
+class LiveOutput(object):
+  """
+  Keeps output of the render function on the same place of the screen, re-drawing only lines changed since
+  the previous render
+  """
+  __ansi_escape = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+  __cursor_up = "\x1b[{}F"
+  __cursor_down = "\x1b[{}E"
+  __clear_line = "\x1b[2K"
+  __clear_to_end = "\x1b[J"
+  __clear_screen = "\x1b[H\x1b[2J"
+
+  def __init__(self):
+    self.__lines: List[str] = []
+
+  def __height(self, line: str, width: int) -> int:
+    visible = len(self.__ansi_escape.sub("", line))
+    return (visible - 1) // width + 1 if visible else 1
+
+  def __diff(self, lines: List[str], width: int) -> List[str]:
+    out: List[str] = [self.__cursor_up.format(sum(self.__height(l, width) for l in self.__lines))]
+    for i, line in enumerate(lines):
+      if i < len(self.__lines) and self.__lines[i] == line:
+        out.append(self.__cursor_down.format(self.__height(line, width)))
+      elif i < len(self.__lines) and self.__height(line, width) == self.__height(self.__lines[i], width) == 1:
+        out.append(f"{self.__clear_line}{line}\n")
+      else:  # the rest of the output is shifted, re-draw it completely
+        out.append(self.__clear_to_end)
+        out.extend(f"{l}\n" for l in lines[i:])
+        return out
+
+    if len(self.__lines) > len(lines):
+      out.append(self.__clear_to_end)
+
+    return out
+
+  def render(self, f: Callable[[], None]):
+    buff = StringIO()
+    stdout = sys.stdout
+    sys.stdout = buff
+    try:
+      f()
+    finally:
+      sys.stdout = stdout
+
+    lines = buff.getvalue().splitlines()
+    if not sys.stdout.isatty():
+      out = [f"{l}\n" for l in lines]
+    elif not self.__lines:
+      out = [f"{l}\n" for l in lines]
+    else:
+      width, height = get_terminal_size()
+      if sum(self.__height(l, width) for l in self.__lines) >= height:  # part of the output scrolled out the screen
+        out = [self.__clear_screen] + [f"{l}\n" for l in lines]
+      else:
+        out = self.__diff(lines, width)
+
+    self.__lines = lines
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+  def follow(self, items: Iterable[T], f: Callable[[T], None], title: str = ""):
+    """
+    Re-draws output of function f for each item, until items are exhausted or cancelled by user
+    """
+    def _render(item: T):
+      if title:
+        print(f"{Colors.BRIGHT_BLACK}{title}, updated at {datetime.now().strftime('%H:%M:%S')}{Colors.RESET}")
+      f(item)
+
+    try:
+      for _item in items:
+        self.render(lambda: _render(_item))
+    except KeyboardInterrupt:
+      pass
+
+
+class OutputFormat(Enum):
+  table = "table"
+  json = "json"
+  ndjson = "ndjson"
+  csv = "csv"
+
+  @classmethod
+  def from_str(cls, value: str):
+    """
+    :rtype OutputFormat
+    """
+    try:
+      return cls(value.lower()) if value else cls.table
+    except ValueError:
+      raise ValueError(f"format should be one of: {', '.join(f.value for f in cls)}, got '{value}'")
+
+
+class RecordWriter(object):
+  """
+  Writes records in the machine-readable format as soon as they are produced. Unlike TableOutput no column
+  widths are needed, so the data could be streamed without the measuring pre-pass.
+
+  Values are written as is, except datetime (ISO 8601), Enum (name) and lists (comma separated in csv)
+  """
+
+  def __init__(self, fmt: OutputFormat, fields: List[str], stream: TextIO = None):
+    """
+    :arg fmt any format except the table one
+    :arg fields record fields in order of output, used as csv header
+    :arg stream output stream, sys.stdout if not set
+    """
+    if fmt == OutputFormat.table:
+      raise ValueError("Table output could not be written as records")
+
+    self.__fmt = fmt
+    self.__fields = fields
+    self.__stream = stream if stream else sys.stdout
+    self.__count: int = 0
+    self.__csv = csv.writer(self.__stream, lineterminator="\n") if fmt == OutputFormat.csv else None
+
+    if self.__csv:
+      self.__csv.writerow(fields)
+      self.__stream.flush()
+
+  @property
+  def count(self) -> int:
+    return self.__count
+
+  def __value(self, value):
+    if isinstance(value, datetime):
+      return value.isoformat()
+    if isinstance(value, Enum):
+      return value.name
+    if self.__csv and isinstance(value, (list, tuple)):
+      return ",".join(str(v) for v in value)
+    return value
+
+  def write(self, **values):
+    """
+    Writes one record, fields not passed are written as null (empty in csv)
+    """
+    record = [self.__value(values.get(name)) for name in self.__fields]
+    if self.__csv:
+      self.__csv.writerow(["" if v is None else v for v in record])
+    else:
+      line = json.dumps(dict(zip(self.__fields, record)), ensure_ascii=False)
+      if self.__fmt == OutputFormat.json:
+        line = f"{',' if self.__count else '['}\n  {line}"
+      else:
+        line = f"{line}\n"
+      self.__stream.write(line)
+
+    self.__count += 1
+    self.__stream.flush()
+
+  def close(self):
+    if self.__fmt == OutputFormat.json:
+      self.__stream.write("\n]\n" if self.__count else "[]\n")
+      self.__stream.flush()
+
+  def __enter__(self):
+    return self
 
-          if futures[i].done():
-            try:
-              if futures[i].result(timeout=0.0) is True:
-                ok_tasks += 1
-              else:
-                failed_tasks += 1
-              done_indexes.append(i)
-            except TimeoutError:
-              pass
-            except (CancelledError, Exception) as e:
-              print(f"Error: {str(e)}", file=mystderr)
-              done_indexes.append(i)
-              failed_tasks += 1
-          i += 1
-
-          p.progress(ok_tasks+failed_tasks, status_pattern.format(ok_tasks, failed_tasks))
-      except Exception as e:
-        self.__errors += str(e).split(os.linesep)
-      finally:
-        sys.stdin, sys.stderr, sys.stdout = stdin, stderr, stdout
-        p.stop()
-
-        mystdout.seek(0, 0)
-        for line in mystdout.readlines():
-          print(line, end='')
-
-        self.__errors = [line.strip() for line in mystderr.getvalue().split("\n") if line.strip()]
-        self.check_issues()
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.close()
 
 
 class Console(object):
@@ -0,0 +1,158 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import threading
+import time
+from enum import Enum
+from typing import List
+
+
+class ProfileMode(Enum):
+  cpu = "cpu"
+  mem = "mem"
+
+
+class CommandProfiler(object):
+  """
+  Runs the command under cProfile (cpu) or tracemalloc (mem).
+
+  Threads started after the profiling start, like the shared executor workers, are profiled as well, the cpu
+  report is merged from all of them. Threads started before are not profiled, except python 3.12+, where the
+  profiler sees all threads
+
+  Writes the sorted text report together with the raw data, which could be loaded later by pstats.Stats or
+  tracemalloc.Snapshot.load for the deeper analysis
+  """
+  __report_lines: int = 50
+  __traceback_depth: int = 10
+
+  def __init__(self, mode: str, directory: str, name: str):
+    """
+    :arg mode "cpu", "mem" or empty string for cpu
+    :arg directory folder to store reports in, created if not exists
+    :arg name name of the profiled command, used as the reports file name prefix
+    """
+    try:
+      self.__mode: ProfileMode = ProfileMode(mode) if mode else ProfileMode.cpu
+    except ValueError:
+      raise ValueError(f"profile mode should be one of: {', '.join(m.value for m in ProfileMode)}, got '{mode}'")
+
+    self.__directory: str = directory
+    self.__name: str = name
+    self.__profile = None
+    self.__thread_profiles: List[object] = []
+    self.__lock = threading.Lock()
+    self.__report_path: str or None = None
+    self.__raw_path: str or None = None
+
+  @property
+  def mode(self) -> ProfileMode:
+    return self.__mode
+
+  @property
+  def report_path(self) -> str or None:
+    return self.__report_path
+
+  @property
+  def raw_path(self) -> str or None:
+    return self.__raw_path
+
+  def start(self):
+    if self.__mode == ProfileMode.cpu:
+      import cProfile
+      self.__profile = cProfile.Profile()
+      self.__profile.enable()
+      if sys.version_info < (3, 12):  # since 3.12 cProfile is built on sys.monitoring, which covers all threads
+        threading.setprofile(self.__profile_thread)
+    else:
+      import tracemalloc
+      tracemalloc.start(self.__traceback_depth)
+
+  def __profile_thread(self, frame, event, arg):
+    """
+    Profile hook of the new thread, called once: replaced by the own profiler of the thread
+    """
+    import cProfile
+    profile = cProfile.Profile()
+    with self.__lock:
+      self.__thread_profiles.append(profile)
+    profile.enable()
+
+  def stop(self) -> str:
+    """
+    :return path to the written report
+    """
+    os.makedirs(self.__directory, exist_ok=True)
+    base_name = os.path.join(self.__directory, f"{self.__name}-{time.strftime('%Y%m%d-%H%M%S')}-{self.__mode.value}")
+    self.__report_path = f"{base_name}.txt"
+
+    if self.__mode == ProfileMode.cpu:
+      self.__stop_cpu(base_name)
+    else:
+      self.__stop_mem(base_name)
+
+    return self.__report_path
+
+  def __stop_cpu(self, base_name: str):
+    import pstats
+    self.__profile.disable()
+    threading.setprofile(None)
+    with self.__lock:
+      profiles = [self.__profile] + self.__thread_profiles
+
+    self.__raw_path = f"{base_name}.prof"
+    with open(self.__report_path, "w", encoding="UTF-8") as f:
+      stats = pstats.Stats(*profiles, stream=f)
+      stats.dump_stats(self.__raw_path)
+      f.write(f"Profiled threads: main and {len(profiles) - 1} started by the command\n")
+      stats.strip_dirs()
+      for sort_key in ("cumulative", "tottime"):
+        f.write(f"Top {self.__report_lines} functions by {sort_key} time\n")
+        stats.sort_stats(sort_key).print_stats(self.__report_lines)
+
+  def __stop_mem(self, base_name: str):
+    import tracemalloc
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+      tracemalloc.Filter(False, tracemalloc.__file__),
+      tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+      tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    self.__raw_path = f"{base_name}.snapshot"
+    snapshot.dump(self.__raw_path)
+
+    with open(self.__report_path, "w", encoding="UTF-8") as f:
+      f.write(f"Allocated at exit: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB\n\n")
+      f.write(f"Top {self.__report_lines} lines by allocated memory\n")
+      for stat in snapshot.statistics("lineno")[:self.__report_lines]:
+        f.write(f"{stat}\n")
+
+      f.write("\nTop 10 allocation tracebacks\n")
+      for stat in snapshot.statistics("traceback")[:10]:
+        f.write(f"\n{stat}\n")
+        for line in stat.traceback.format():
+          f.write(f"{line}\n")
+
+  def __enter__(self) -> "CommandProfiler":
+    self.start()
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.stop()
+    return False
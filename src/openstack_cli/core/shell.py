@@ -16,20 +16,21 @@
 import sys
 import time
 import signal
-import paramiko
 
 from socket import socket
 
 from threading import Thread
 from typing import TextIO
+
 from openstack_cli.modules.apputils.terminal.get_terminal_size import get_terminal_size
 from openstack_cli.modules.apputils.terminal.getch import getch as _getch, FUNC_KEYS, NCODE_KEYS, VTKEYS
 
+# paramiko types are referenced by name only, the module itself is imported by the ssh command on connect
 
 F12MENU = False
 SIGINT = False
 
-def _f12_commands(channel: paramiko.Channel):
+def _f12_commands(channel: "paramiko.Channel"):
   global F12MENU
   global SIGINT
   _k = _getch()
@@ -42,7 +43,7 @@ def _f12_commands(channel: paramiko.Channel):
   elif _k == (99,):  # C:
     SIGINT = True
   elif _k == (105,): # I
-    t: paramiko.Transport = channel.get_transport()
+    t: "paramiko.Transport" = channel.get_transport()
     sock: socket = t.sock
     localname, peername = sock.getsockname(), sock.getpeername()
     local = localname if localname else ("unknown", 0)
@@ -61,7 +62,7 @@ Preffered:
     return chr(7)
 
 
-def getch(channel: paramiko.Channel):
+def getch(channel: "paramiko.Channel"):
   global SIGINT
 
   if SIGINT:
@@ -90,11 +91,11 @@ def _sigint(signum, frame):
   SIGINT = True
 
 
-def __buffered_reader(stdread: paramiko.ChannelFile, stdwrite: TextIO):
+def __buffered_reader(stdread: "paramiko.ChannelFile", stdwrite: TextIO):
   global SIGINT
   import select
   import time
-  channel: paramiko.Channel = stdread.channel
+  channel: "paramiko.Channel" = stdread.channel
   while not SIGINT and not channel.exit_status_ready():
     if channel.recv_ready():
       r, w, x = select.select([channel], [], [], 0.0)
@@ -107,7 +108,7 @@ def __buffered_reader(stdread: paramiko.ChannelFile, stdwrite: TextIO):
   SIGINT = True
 
 
-def __input_handler(stdin: TextIO, rstdin: TextIO, channel: paramiko.Channel):
+def __input_handler(stdin: TextIO, rstdin: TextIO, channel: "paramiko.Channel"):
   global SIGINT
   while not SIGINT:
     buff = getch(channel)
@@ -118,7 +119,7 @@ def __input_handler(stdin: TextIO, rstdin: TextIO, channel: paramiko.Channel):
       rstdin.write(buff)
 
 
-def __window_size_change_handler(channel: paramiko.Channel):
+def __window_size_change_handler(channel: "paramiko.Channel"):
   width, height = get_terminal_size()
   while not SIGINT:
     time.sleep(1)
@@ -128,10 +129,10 @@ def __window_size_change_handler(channel: paramiko.Channel):
       channel.resize_pty(width=width, height=height)
 
 
-def shell(channel: paramiko.Channel):
-  stdin: paramiko.ChannelFile = channel.makefile_stdin("wb")
-  stdout: paramiko.ChannelFile = channel.makefile("r")
-  stderr: paramiko.ChannelFile = channel.makefile_stderr("r")
+def shell(channel: "paramiko.Channel"):
+  stdin: "paramiko.ChannelFile" = channel.makefile_stdin("wb")
+  stdout: "paramiko.ChannelFile" = channel.makefile("r")
+  stderr: "paramiko.ChannelFile" = channel.makefile_stderr("r")
   print("Tip: F12 + I to show connection info, F12+C to close connection")
 
   stdoutReader = Thread(target=__buffered_reader, name="stdoutReader", args=(stdout, sys.stdout))
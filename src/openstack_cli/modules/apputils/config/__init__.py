@@ -16,11 +16,12 @@
 import sys
 import time
 from enum import Enum
-from typing import  Dict, List
+from typing import  Dict, List, Optional
 
-from .ext import DataCacheExtension, OptionsExtension
+from .ext import DataCacheExtension, OptionsExtension, TimeSeriesExtension
 from .storages import StorageType
 from .storages.base_storage import BaseStorage, StorageProperty, StoragePropertyType
+from .storages.file_lock import FileLock
 
 
 class BaseConfiguration(object):
@@ -28,6 +29,7 @@ class BaseConfiguration(object):
   _options_flags_name_old = "options"
   _options_flags_name = "config_options"
   _options_table = "general"
+  _stamp_name = "startup_stamp"
 
   class ConfigOptions(Enum):
     CONF_INITIALIZED = 0
@@ -43,30 +45,68 @@ class BaseConfiguration(object):
 
     self.__upgrade_manager = upgrade_manager if upgrade_manager else UpgradeManager()
     self.__storage: BaseStorage = storage.value(app_name=app_name, lazy=lazy_init)
-    self.__options = OptionsExtension(self.__storage, self._options_table, self._options_flags_name, self.ConfigOptions)
+    self.__options = OptionsExtension(self.__storage, self._options_table, self._options_flags_name, self.ConfigOptions,
+                                      on_change=lambda value: self._update_stamp(options=value))
     self.__caches: Dict = {}
+    self.__series: Dict[str, TimeSeriesExtension] = {}
+    self.__stamp: Optional[dict] = None
 
-  def initialize(self):
+  def initialize(self, upgrade: bool = True):
     """
+    :arg upgrade run upgrade catalogs, could be skipped if configuration is known to be up to date (see is_up_to_date)
     :rtype BaseConfiguration
     """
+    _ = self.stamp  # preloads options, saving the separate read
     if self.is_conf_initialized:
       self._storage.initialize_key()
-      try:
-        assert self._test_encrypted_property == "test"
-      except ValueError as e:
-        print(f"Error: {str(e)}")
-        sys.exit(-1)
-
-      self.__upgrade_manager.upgrade(self, self._storage)
+      if not self._storage.is_key_persisted:  # key generated from the master password, verify it
+        try:
+          assert self._test_encrypted_property == "test"
+        except ValueError as e:
+          print(f"Error: {str(e)}")
+          sys.exit(-1)
+
+      if upgrade:
+        self.__upgrade_manager.upgrade(self, self._storage)
+        self._update_stamp(db_version=self.version, options=self.__options.value)
     else:
       self.__upgrade_manager.init_config(self, self._storage)
+      self._update_stamp(db_version=self.version, options=self.__options.value)
 
     return self
 
-  def add_cache_ext(self, name: str, cache_lifetime: float = __cache_invalidation):
+  @property
+  def stamp(self) -> dict:
+    """
+    Start-up stamp: the single record holding everything required to start the application - schema version,
+    options bitfield and other application-defined values
+    """
+    if self.__stamp is None:
+      p = self._storage.get_property(self._options_table, self._stamp_name, StorageProperty())
+      self.__stamp = p.value if isinstance(p.value, dict) else {}
+      if "options" in self.__stamp:
+        self.__options.preload(self.__stamp["options"])
+
+    return self.__stamp
+
+  def _update_stamp(self, **kwargs):
+    self.stamp.update(kwargs)
+    self._storage.set_property(
+      self._options_table,
+      StorageProperty(self._stamp_name, StoragePropertyType.json, self.__stamp)
+    )
+
+  def is_up_to_date(self, version: float) -> bool:
+    """
+    Check if configuration schema matches application version without running upgrade catalogs
+
+    :arg version current version of the application, dev builds (0.0) are never considered up to date
+    """
+    return version != 0.0 and self.stamp.get("db_version") == version
+
+  def add_cache_ext(self, name: str, cache_lifetime: float = __cache_invalidation, size_limit: int = 0):
     if name not in self.__caches:
-      self.__caches[name] = DataCacheExtension(self.__storage, name, cache_lifetime)
+      self.__caches[name] = DataCacheExtension(self.__storage, name, cache_lifetime, size_limit=size_limit)
 
   def get_cache_ext(self, name: str) -> DataCacheExtension:
     if name not in self.__caches:
@@ -78,10 +118,34 @@ class BaseConfiguration(object):
   def list_cache_ext(self) -> List[str]:
     return list(self.__caches.keys())
 
+  def get_timeseries_ext(self, name: str) -> TimeSeriesExtension:
+    if name not in self.__series:
+      self.__series[name] = TimeSeriesExtension(self.__storage, name)
+
+    return self.__series[name]
+
+  def flush_caches(self):
+    for cache in self.__caches.values():
+      cache.flush()
+
   @property
   def _storage(self) -> BaseStorage:
     return self.__storage
 
+  @property
+  def configuration_dir(self) -> str:
+    return self.__storage.configuration_dir
+
+  @property
+  def is_key_persisted(self) -> bool:
+    return self.__storage.is_key_persisted
+
+  def lock(self, name: str) -> FileLock:
+    """
+    Inter-process lock, to be used around operations which should be performed only by one running instance
+    """
+    return self.__storage.lock(name)
+
   @property
   def is_conf_initialized(self):
     return self.__options.get(self.ConfigOptions.CONF_INITIALIZED)
@@ -125,7 +189,9 @@ class BaseConfiguration(object):
   @version.setter
   def version(self, version: float):
     self._storage.set_property("general", StorageProperty(name="db_version", value=str(version)))
+    self._update_stamp(db_version=version)
 
   def reset(self):
     self._storage.reset()
+    self.__stamp = None
 
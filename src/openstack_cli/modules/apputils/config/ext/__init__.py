@@ -16,3 +16,4 @@
 
 from .cache import DataCacheExtension
 from .options import OptionsExtension
+from .timeseries import TimeSeriesExtension
@@ -25,51 +25,250 @@
 #
 #
 
+import json
 import time
-from typing import ClassVar
+from typing import ClassVar, Dict, List
 
-from ..storages.base_storage import BaseStorage, StorageProperty
+from ..storages.base_storage import BaseStorage, StorageProperty, StoragePropertyType
+from ...tracing import span
+
+
+class CacheItemStats(object):
+  def __init__(self, name: str, size: int = 0, created: float = 0.0, accessed: float = 0.0, hits: int = 0,
+               misses: int = 0):
+    self.name: str = name
+    self.size: int = size
+    self.created: float = created
+    self.accessed: float = accessed
+    self.hits: int = hits
+    self.misses: int = misses
+
+  @property
+  def hit_ratio(self) -> float:
+    total = self.hits + self.misses
+    return self.hits / total if total else 0.0
+
+  def merge(self, other: 'CacheItemStats') -> 'CacheItemStats':
+    """
+    Apply collected in-memory delta to persisted stats
+    """
+    if other.created:
+      self.size = other.size
+      self.created = other.created
+
+    self.accessed = max(self.accessed, other.accessed)
+    self.hits += other.hits
+    self.misses += other.misses
+    return self
+
+  def serialize(self) -> dict:
+    return {
+      "size": self.size,
+      "created": self.created,
+      "accessed": self.accessed,
+      "hits": self.hits,
+      "misses": self.misses
+    }
+
+  @classmethod
+  def from_property(cls, p: StorageProperty) -> 'CacheItemStats':
+    value = p.value if isinstance(p.value, dict) else {}
+    return cls(p.name, **{k: v for k, v in value.items() if k in ("size", "created", "accessed", "hits", "misses")})
 
 
 class DataCacheExtension(object):
-  def __init__(self, _storage: BaseStorage,  table_name: str, cache_lifetime: float):  # seconds
+  __namespace_separator: str = "/"
+  __compacted_property: str = "$compacted"
+  __compact_interval: float = 7 * 24 * 3600  # 7 days
+
+  def __init__(self, _storage: BaseStorage,  table_name: str, cache_lifetime: float,  # seconds
+               namespace: str or None = None, size_limit: int = 0):
+    """
+    :arg namespace isolates cached items of this instance from items of other namespaces within the same table
+    :arg size_limit max amount of bytes to keep in the cache, least recently used items evicted first. 0 - unlimited
+    """
     self._storage: BaseStorage = _storage
     self.__cache_table_name: str = table_name
+    self.__stats_table_name: str = f"{table_name}_stats"
     self.__cache_lifetime: float = cache_lifetime
+    self.__namespace: str or None = namespace
+    self.__lifetimes: Dict[str, float] = {}
+    self.__namespaces: Dict[str, DataCacheExtension] = {}
+    self.__stats: Dict[str, CacheItemStats] = {}  # not yet flushed stats, shared across namespaces
+    self.size_limit: int = size_limit
+
+  @property
+  def name(self) -> str or None:
+    return self.__namespace
+
+  def namespace(self, name: str) -> 'DataCacheExtension':
+    """
+    Returns view of the cache, where all items are stored under provided namespace and do not
+    collide with the same items of another namespace
+    """
+    if name not in self.__namespaces:
+      ext = DataCacheExtension(self._storage, self.__cache_table_name, self.__cache_lifetime, namespace=name)
+      ext.__lifetimes = self.__lifetimes
+      ext.__stats = self.__stats
+      self.__namespaces[name] = ext
+
+    return self.__namespaces[name]
+
+  def set_lifetime(self, clazz: ClassVar or str, cache_lifetime: float):
+    """
+    Override cache lifetime for the item, applied to all namespaces of the cache
+    """
+    self.__lifetimes[self.__item_name(clazz)] = cache_lifetime
+
+  def __item_name(self, clazz: ClassVar or str) -> str:
+    return clazz if isinstance(clazz, str) else clazz.__name__
+
+  def __key(self, clazz: ClassVar or str) -> str:
+    clazz = self.__item_name(clazz)
+    return f"{self.__namespace}{self.__namespace_separator}{clazz}" if self.__namespace else clazz
+
+  def __is_expired(self, clazz: ClassVar or str, p: StorageProperty) -> bool:
+    if not p.updated:
+      return False
+
+    lifetime = self.__lifetimes.get(self.__item_name(clazz), self.__cache_lifetime)
+    return time.time() - p.updated >= lifetime
+
+  def __track(self, key: str, hit: bool or None = None, size: int or None = None):
+    item = self.__stats.setdefault(key, CacheItemStats(key))
+    item.accessed = time.time()
+
+    if hit is True:
+      item.hits += 1
+    elif hit is False:
+      item.misses += 1
+
+    if size is not None:
+      item.size = size
+      item.created = item.accessed
+
+  @property
+  def keys(self) -> List[str]:
+    """
+    Item names stored under current namespace
+    """
+    names = self._storage.get_property_list(self.__cache_table_name)
+    if not self.__namespace:
+      return names
+
+    prefix = f"{self.__namespace}{self.__namespace_separator}"
+    return [name[len(prefix):] for name in names if name.startswith(prefix)]
 
   def invalidate_all(self):
-    self._storage.reset_properties_update_time(self.__cache_table_name)
+    if not self.__namespace:
+      self._storage.reset_properties_update_time(self.__cache_table_name)
+      return
+
+    for name in self.keys:
+      self.invalidate_property(name)
 
   def invalidate_property(self, name: StorageProperty or str):
-    self._storage.reset_property_update_time(self.__cache_table_name, name)
+    if isinstance(name, StorageProperty):
+      name = name.name
+    self._storage.reset_property_update_time(self.__cache_table_name, self.__key(name))
 
   def exists(self, clazz: ClassVar or str) -> bool:
-    if not isinstance(clazz, str):
-      clazz = clazz.__name__
+    key = self.__key(clazz)
+    with span("cache.read", "cache", key=key):
+      p: StorageProperty = self._storage.get_property(self.__cache_table_name, key)
 
-    p: StorageProperty = self._storage.get_property(self.__cache_table_name, clazz)
+    if self.__is_expired(clazz, p) or p.value in ('', {}):
+      self.__track(key, hit=False)
+      return False
 
-    if p.updated:
-      time_delta: float = time.time() - p.updated
-      if time_delta >= self.__cache_lifetime:
-        return False
-    return p.value not in ('', {})
+    self.__track(key)
+    return True
 
   def get(self, clazz: ClassVar or str) -> str or dict or None:
-    if not isinstance(clazz, str):
-      clazz = clazz.__name__
+    key = self.__key(clazz)
+    with span("cache.read", "cache", key=key):
+      p: StorageProperty = self._storage.get_property(self.__cache_table_name, key)
 
-    p: StorageProperty = self._storage.get_property(self.__cache_table_name, clazz)
-
-    if p.updated:
-      time_delta: float = time.time() - p.updated
-      if time_delta >= self.__cache_lifetime:
-        return None
+    if self.__is_expired(clazz, p):
+      self.__track(key, hit=False)
+      return None
 
+    self.__track(key, hit=p.value not in ('', {}))
     return p.value
 
   def set(self, clazz: ClassVar or str, v: str or dict, encrypted: bool = True):
-    if not isinstance(clazz, str):
-      clazz = clazz.__name__
+    key = self.__key(clazz)
+    with span("cache.write", "cache", key=key):
+      self._storage.set_text_property(self.__cache_table_name, key, v, encrypted=encrypted)
+    self.__track(key, size=len((v if isinstance(v, str) else json.dumps(v)).encode("UTF-8")))
+
+  def stats(self) -> List[CacheItemStats]:
+    """
+    Persisted usage statistic of the cached items including not yet flushed one
+    """
+    items: Dict[str, CacheItemStats] = {
+      p.name: CacheItemStats.from_property(p)
+      for p in self._storage.get_properties(self.__stats_table_name) if p.name != self.__compacted_property
+    }
+    for key, delta in self.__stats.items():
+      items[key] = items[key].merge(delta) if key in items else CacheItemStats(key).merge(delta)
+
+    cached_keys = set(self._storage.get_property_list(self.__cache_table_name))
+    return [item for item in items.values() if item.name in cached_keys]
+
+  @property
+  def has_pending_stats(self) -> bool:
+    return len(self.__stats) > 0
+
+  def flush(self):
+    """
+    Persist collected usage statistic, evict least recently used items above the size limit and
+    compact the storage from time to time
+    """
+    if not self.has_pending_stats:
+      return
+
+    grown = False
+    items: List[StorageProperty] = []
+    for key, delta in self.__stats.items():
+      p = self._storage.get_property(self.__stats_table_name, key)
+      item = CacheItemStats.from_property(p).merge(delta) if p.name else CacheItemStats(key).merge(delta)
+      grown = grown or bool(delta.created)
+      items.append(StorageProperty(key, StoragePropertyType.json, item.serialize()))
+
+    self._storage.set_properties(self.__stats_table_name, items)
+
+    self.__stats.clear()
+
+    evicted = self.evict() if grown and self.size_limit else 0
+    last_compacted = self._storage.get_property(self.__stats_table_name, self.__compacted_property, None)
+
+    if last_compacted is None:
+      self.__set_compacted()
+    elif evicted or time.time() - last_compacted.updated >= self.__compact_interval:
+      self._storage.compact()
+      self.__set_compacted()
+
+  def __set_compacted(self):
+    self._storage.set_text_property(self.__stats_table_name, self.__compacted_property, str(time.time()))
+
+  def evict(self) -> int:
+    """
+    Remove least recently used items until cache fits into the size limit
+
+    :return amount of evicted items
+    """
+    items = sorted(self.stats(), key=lambda x: x.accessed)
+    total_size = sum([item.size for item in items])
+    evicted = 0
+
+    for item in items:
+      if total_size <= self.size_limit:
+        break
+
+      self._storage.delete_property(self.__cache_table_name, item.name)
+      self._storage.delete_property(self.__stats_table_name, item.name)
+      total_size -= item.size
+      evicted += 1
 
-    self._storage.set_text_property(self.__cache_table_name, clazz, v, encrypted=encrypted)
+    return evicted
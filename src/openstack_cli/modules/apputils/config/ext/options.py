@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 from enum import Enum
-from typing import Dict
+from typing import Callable, Dict
 
 
 from ..storages.base_storage import BaseStorage, StorageProperty, StoragePropertyType
@@ -35,8 +35,12 @@ class OptionsExtension(object):
   """
 
   def __init__(self, storage: BaseStorage, table_name: str, holder_prop_name: str, properties: Enum,
-               encrypted: bool = False):
+               encrypted: bool = False, on_change: Callable[[int], None] = None):
+    """
+    :arg on_change callback receiving new bitfield value each time it is saved
+    """
     self._storage = storage
+    self.__on_change: Callable[[int], None] or None = on_change
     self.__encrypted: bool = encrypted
     self.__table_name: str = table_name
     self.__property_name = holder_prop_name
@@ -63,6 +67,22 @@ class OptionsExtension(object):
       StorageProperty(self.__property_name, StoragePropertyType.text, str(self.__bitfield)),
       encrypted=self.__encrypted
     )
+    if self.__on_change:
+      self.__on_change(self.__bitfield)
+
+  def preload(self, value: int):
+    """
+    Use already known bitfield value instead of reading it from the storage
+    """
+    self.__bitfield = value
+    self.__loaded = True
+
+  @property
+  def value(self) -> int:
+    if not self.__loaded:
+      self.__load_value()
+
+    return self.__bitfield
 
   def __gen_bitmask(self, width: int) -> int:
     if width == 1:
@@ -0,0 +1,117 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from typing import Dict, List, Tuple
+
+from ..storages.base_storage import BaseStorage
+
+
+class TimeSeriesExtension(object):
+  """
+  Metrics history with automatic downsampling.
+
+  Raw samples older than raw_retention are replaced by hourly averages, hourly ones older than hourly_retention
+  by daily averages, daily samples are kept forever. So the history of the long period stays small and is
+  read by one range query over the time-ordered table.
+
+  Downsampling on append runs at most once per hour, the last aggregated hour is kept in the "<table>_state"
+  properties table
+  """
+  RAW: int = 0
+  HOURLY: int = 3600
+  DAILY: int = 24 * 3600
+  __namespace_separator: str = "/"
+  __state_table_suffix: str = "_state"
+  __downsampled_property: str = "downsampled"
+
+  def __init__(self, _storage: BaseStorage, table_name: str, namespace: str or None = None,
+               raw_retention: float = 2 * 24 * 3600, hourly_retention: float = 30 * 24 * 3600):
+    """
+    :arg namespace isolates metrics of this instance from metrics of other namespaces within the same table
+    :arg raw_retention seconds to keep samples as they were recorded
+    :arg hourly_retention seconds to keep hourly averages
+    """
+    self._storage: BaseStorage = _storage
+    self.__table_name: str = table_name
+    self.__namespace: str or None = namespace
+    self.__raw_retention: float = raw_retention
+    self.__hourly_retention: float = hourly_retention
+    self.__namespaces: Dict[str, TimeSeriesExtension] = {}
+
+  @property
+  def name(self) -> str or None:
+    return self.__namespace
+
+  def namespace(self, name: str) -> 'TimeSeriesExtension':
+    if name not in self.__namespaces:
+      self.__namespaces[name] = TimeSeriesExtension(self._storage, self.__table_name, name, self.__raw_retention,
+                                                    self.__hourly_retention)
+
+    return self.__namespaces[name]
+
+  @property
+  def __prefix(self) -> str:
+    return f"{self.__namespace}{self.__namespace_separator}" if self.__namespace else ""
+
+  def append(self, values: Dict[str, float], timestamp: float or None = None):
+    """
+    Record values of the metrics taken at the same time
+    """
+    timestamp = timestamp if timestamp is not None else time.time()
+    prefix = self.__prefix
+    self._storage.append_series(
+      self.__table_name,
+      [(timestamp, self.RAW, f"{prefix}{name}", float(value)) for name, value in values.items()]
+    )
+    self.__downsample_if_due(timestamp)
+
+  def __raw_cutoff(self, now: float) -> float:
+    # cut-off is aligned to the bucket size, so the bucket is always aggregated at once
+    return (now - self.__raw_retention) // self.HOURLY * self.HOURLY
+
+  def __downsample_if_due(self, now: float):
+    """
+    Cut-offs are moving by whole hours (days for the hourly samples), so nothing new could be aggregated
+    until the raw cut-off moves to the next hour
+    """
+    state_table = f"{self.__table_name}{self.__state_table_suffix}"
+    raw_cutoff = self.__raw_cutoff(now)
+    downsampled = self._storage.get_property(state_table, self.__downsampled_property).value
+    if downsampled and float(downsampled) >= raw_cutoff:
+      return
+
+    self.downsample(now)
+    self._storage.set_text_property(state_table, self.__downsampled_property, raw_cutoff)
+
+  def downsample(self, now: float or None = None):
+    now = now if now is not None else time.time()
+    raw_cutoff = self.__raw_cutoff(now)
+    hourly_cutoff = (now - self.__hourly_retention) // self.DAILY * self.DAILY
+
+    self._storage.downsample_series(self.__table_name, self.RAW, self.HOURLY, raw_cutoff)
+    self._storage.downsample_series(self.__table_name, self.HOURLY, self.DAILY, hourly_cutoff)
+
+  def query(self, since: float, until: float or None = None) -> Dict[str, List[Tuple[float, float]]]:
+    """
+    :return {metric name: [(timestamp, value)]} ordered by time, with samples of all resolutions
+    """
+    until = until if until is not None else time.time() + 1
+    prefix = self.__prefix
+    result: Dict[str, List[Tuple[float, float]]] = {}
+    for ts, _, metric, value in self._storage.get_series(self.__table_name, since, until, prefix):
+      result.setdefault(metric[len(prefix):], []).append((ts, value))
+
+    return result
@@ -31,14 +31,51 @@ import os
 import time
 from enum import Enum
 from getpass import getpass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from cryptography.fernet import InvalidToken, Fernet
+from .file_lock import FileLock
 
 SECRET_FILE_NAME = "user.key"
 CONFIGURATION_STORAGE_FILE_NAME = "configuration.db"
 
 
+def detect_system() -> str:
+  if sys.platform.startswith('java'):
+    import platform
+    os_name = platform.java_ver()[3][0]
+    if os_name.startswith('Windows'):
+      return 'win32'
+    elif os_name.startswith('Mac'):
+      return 'darwin'
+    else:
+      return 'linux2'
+
+  return sys.platform
+
+
+def user_data_dir(system: str = None, appname: str = None, version: str = None) -> str:
+  """
+  Location of the application configuration folder, could be used without creation of the storage object
+  """
+  if system is None:
+    system = detect_system()
+
+  if system == "win32":
+    path = os.path.normpath(os.getenv("LOCALAPPDATA", None))
+  elif system == 'darwin':
+    path = os.path.expanduser('~/Library/Application Support/')
+  else:
+    path = os.getenv('XDG_DATA_HOME', os.path.expanduser("~/.local/share"))
+
+  if appname:
+    path = os.path.join(path, appname)
+
+  if appname and version:
+    path = os.path.join(path, version)
+
+  return path
+
+
 class StoragePropertyType(Enum):
   text = "text"
   encrypted = "encrypted"
@@ -126,10 +163,11 @@ class BaseStorage(object):
     :arg app_name name of the folder to use for storage
     :arg lazy initialize crypto key right away on object creation or demand manuall  `initialize_key` call
     """
-    self._fernet: Optional[Fernet] = None
+    self._fernet: Optional["Fernet"] = None  # cryptography is imported on demand, it is quite heavy
     self._lazy: bool = lazy
     self._system: str = None
     self.__config_dir: str = None
+    self.__locks: Dict[str, FileLock] = {}
 
     self.__detect_system()
     self.__prepare_config_dir(app_name)
@@ -139,17 +177,7 @@ class BaseStorage(object):
       self.initialize_key()
 
   def __detect_system(self):
-    if sys.platform.startswith('java'):
-      import platform
-      os_name = platform.java_ver()[3][0]
-      if os_name.startswith('Windows'):
-        self._system: str = 'win32'
-      elif os_name.startswith('Mac'):
-        self._system: str = 'darwin'
-      else:
-        self._system: str = 'linux2'
-    else:
-      self._system: str = sys.platform
+    self._system: str = detect_system()
 
   def __prepare_config_dir(self, app_name: str):
     self.__config_dir: str = self.__user_data_dir(appname=app_name, version=None)
@@ -158,6 +186,8 @@ class BaseStorage(object):
       os.makedirs(self.__config_dir, exist_ok=True)
 
   def initialize_key(self):
+    from cryptography.fernet import Fernet
+
     persist = os.path.exists(self.secret_file_path)
     key = self._load_secret_key(persist=persist)
     self._fernet: Optional[Fernet] = Fernet(key) if key else None
@@ -225,6 +255,7 @@ class BaseStorage(object):
 
   def _decrypt(self, value: str) -> str:
     if self._fernet:
+      from cryptography.fernet import InvalidToken
       try:
         return self._fernet.decrypt(value).decode("utf-8")
       except InvalidToken:
@@ -232,25 +263,16 @@ class BaseStorage(object):
     return value
 
   def __user_data_dir(self, appname: str = None, version: str = None) -> str:
-    if self._system == "win32":
-      path = os.path.normpath(os.getenv("LOCALAPPDATA", None))
-    elif self._system == 'darwin':
-      path = os.path.expanduser('~/Library/Application Support/')
-    else:
-      path = os.getenv('XDG_DATA_HOME', os.path.expanduser("~/.local/share"))
-
-    if appname:
-      path = os.path.join(path, appname)
-
-    if appname and version:
-      path = os.path.join(path, version)
-
-    return path
+    return user_data_dir(self._system, appname, version)
 
   @property
   def configuration_dir(self) -> str:
     return self.__config_dir
 
+  @property
+  def is_key_persisted(self) -> bool:
+    return os.path.exists(self.secret_file_path)
+
   @property
   def secret_file_path(self) -> str:
     return os.path.join(self.__config_dir, SECRET_FILE_NAME)
@@ -259,6 +281,15 @@ class BaseStorage(object):
   def configuration_file_path(self) -> str:
     return os.path.join(self.__config_dir, CONFIGURATION_STORAGE_FILE_NAME)
 
+  def lock(self, name: str) -> FileLock:
+    """
+    Advisory lock shared by all application instances using the same configuration directory
+    """
+    if name not in self.__locks:
+      self.__locks[name] = FileLock(os.path.join(self.__config_dir, f"{name}.lock"))
+
+    return self.__locks[name]
+
   def reset(self):
     raise NotImplementedError()
 
@@ -273,6 +304,12 @@ class BaseStorage(object):
   def execute_script(self, ddl: str) -> None:
     raise NotImplementedError()
 
+  def compact(self) -> None:
+    """
+    Reclaim space left after removed properties
+    """
+    raise NotImplementedError()
+
   def reset_property_update_time(self, table: str, name: str or StorageProperty):
     raise NotImplementedError()
 
@@ -291,6 +328,12 @@ class BaseStorage(object):
   def set_property(self, table: str, prop: StorageProperty, encrypted: bool = False):
     raise NotImplementedError()
 
+  def set_properties(self, table: str, props: List[StorageProperty], encrypted: bool = False):
+    """
+    Store several properties at once, with the single commit
+    """
+    raise NotImplementedError()
+
   def set_text_property(self, table: str, name: str, value, encrypted: bool = False):
     raise NotImplementedError()
 
@@ -299,3 +342,24 @@ class BaseStorage(object):
 
   def delete_property(self, table: str, name: str) -> bool:
     raise NotImplementedError()
+
+  def append_series(self, table: str, samples: List[Tuple[float, int, str, float]]):
+    """
+    :arg samples list of (timestamp, resolution in seconds, metric name, value), sample with the same timestamp,
+                 resolution and metric replaces existing one
+    """
+    raise NotImplementedError()
+
+  def get_series(self, table: str, since: float, until: float, prefix: str = "") -> List[Tuple[float, int, str, float]]:
+    """
+    :return samples of metrics starting with prefix within [since, until) time range, ordered by time
+    """
+    raise NotImplementedError()
+
+  def downsample_series(self, table: str, resolution: int, bucket: int, older_than: float) -> int:
+    """
+    Replace samples of given resolution older than the time with averages per bucket
+
+    :return amount of removed samples
+    """
+    raise NotImplementedError()
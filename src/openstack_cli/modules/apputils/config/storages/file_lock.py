@@ -0,0 +1,102 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  Github: https://github.com/hapylestat/apputils
+#
+#
+
+
+import os
+import sys
+import threading
+import time
+
+if sys.platform == "win32":
+  import msvcrt
+
+  def _lock_file(f):
+    f.seek(0)
+    while True:
+      try:
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        return
+      except OSError:  # LK_LOCK gives up after 10 attempts
+        time.sleep(0.1)
+
+  def _unlock_file(f):
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+  import fcntl
+
+  def _lock_file(f):
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+  def _unlock_file(f):
+    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class FileLock(object):
+  """
+  Advisory inter-process lock backed by the lock file, re-entrant within the same process
+
+  Example:
+
+    with FileLock("/tmp/my.lock"):
+      do_exclusive_work()
+  """
+
+  def __init__(self, path: str):
+    self.__path: str = path
+    self.__thread_lock = threading.RLock()
+    self.__depth: int = 0
+    self.__f = None
+
+  @property
+  def path(self) -> str:
+    return self.__path
+
+  def acquire(self):
+    self.__thread_lock.acquire()
+    if self.__depth == 0:
+      try:
+        self.__f = open(self.__path, "a+")
+        _lock_file(self.__f)
+      except Exception:
+        if self.__f:
+          self.__f.close()
+          self.__f = None
+        self.__thread_lock.release()
+        raise
+
+    self.__depth += 1
+
+  def release(self):
+    self.__depth -= 1
+    if self.__depth == 0:
+      try:
+        _unlock_file(self.__f)
+      finally:
+        self.__f.close()
+        self.__f = None
+
+    self.__thread_lock.release()
+
+  def __enter__(self):
+    self.acquire()
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.release()
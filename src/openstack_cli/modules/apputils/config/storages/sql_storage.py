@@ -22,19 +22,30 @@ import os
 import json
 import time
 
-from typing import List, Callable
+from typing import List, Callable, Tuple
 from .base_storage import BaseStorage, StoragePropertyType, StorageProperty
 
 
 class SQLStorage(BaseStorage):
   __tables: List[str] = None
+  __busy_timeout: float = 30  # seconds to wait for the lock held by other process
 
   def __init__(self, app_name: str = "apputils", lazy: bool = False):
     super(SQLStorage, self).__init__(app_name, lazy)
 
-    self._db_connection: sqlite3.Connection = sqlite3.connect(self.configuration_file_path, check_same_thread=False)
+    self._db_connection: sqlite3.Connection = self.__connect()
     self.__tables: List[str] = self.__get_table_list()
 
+  def __connect(self) -> sqlite3.Connection:
+    """
+    WAL journal allows readers to proceed while other process is writing, writers are waiting for each other up to
+    the busy timeout instead of failing with "database is locked"
+    """
+    connection = sqlite3.connect(self.configuration_file_path, timeout=self.__busy_timeout, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL;")
+    connection.execute("PRAGMA synchronous=NORMAL;")
+    return connection
+
   def reset(self):
     if self._db_connection:
       self._db_connection.close()
@@ -42,10 +53,11 @@ class SQLStorage(BaseStorage):
     if os.path.exists(self.secret_file_path):
       os.remove(self.secret_file_path)
 
-    if os.path.exists(self.configuration_file_path):
-      os.remove(self.configuration_file_path)
+    for suffix in ("", "-wal", "-shm"):
+      if os.path.exists(f"{self.configuration_file_path}{suffix}"):
+        os.remove(f"{self.configuration_file_path}{suffix}")
 
-    self._db_connection = sqlite3.connect(self.configuration_file_path, check_same_thread=False)
+    self._db_connection = self.__connect()
 
   def _query(self,
              sql: str = None,
@@ -91,14 +103,70 @@ class SQLStorage(BaseStorage):
   def execute_script(self, ddl: str) -> None:
     self._query(f=lambda cur: cur.executescript(ddl))
 
+  def compact(self) -> None:
+    self._db_connection.commit()
+    self._query("VACUUM;")
+
   def _create_property_table(self, table: str):
+    # table could be already created by another application instance in the meantime
     sql = f"""
-    DROP TABLE IF EXISTS {table};
-    create table {table}(name TEXT UNIQUE, type TEXT, updated REAL DEFAULT 0, store CLOB);
+    create table if not exists {table}(name TEXT UNIQUE, type TEXT, updated REAL DEFAULT 0, store CLOB);
     """
     self.execute_script(sql)
     self._db_connection.commit()
-    self.__tables.append(table)
+    if table not in self.__tables:
+      self.__tables.append(table)
+
+  def _create_series_table(self, table: str):
+    # clustered by time, so time range queries are reading continuous part of the table
+    sql = f"""
+    create table if not exists {table}(
+      ts REAL NOT NULL, resolution INTEGER NOT NULL, metric TEXT NOT NULL, value REAL,
+      PRIMARY KEY (ts, resolution, metric)
+    ) WITHOUT ROWID;
+    """
+    self.execute_script(sql)
+    self._db_connection.commit()
+    if table not in self.__tables:
+      self.__tables.append(table)
+
+  def append_series(self, table: str, samples: List[Tuple[float, int, str, float]]):
+    if table not in self.__tables:
+      self._create_series_table(table)
+
+    self._query(
+      f=lambda cur: cur.executemany(
+        f"insert or replace into {table} (ts, resolution, metric, value) values (?,?,?,?);", samples
+      ),
+      commit=True
+    )
+
+  def get_series(self, table: str, since: float, until: float, prefix: str = "") -> List[Tuple[float, int, str, float]]:
+    if table not in self.__tables:  # could be created by another process after the table list was read
+      self._create_series_table(table)
+
+    sql = f"select ts, resolution, metric, value from {table} where ts >= ? and ts < ?"
+    args = [since, until]
+    if prefix:
+      # range condition instead of "like" keeps the query sargable for any prefix characters
+      sql += " and metric >= ? and metric < ?"
+      args += [prefix, prefix + "\uffff"]
+
+    return self._query(f"{sql} order by ts;", args)
+
+  def downsample_series(self, table: str, resolution: int, bucket: int, older_than: float) -> int:
+    if table not in self.__tables:
+      self._create_series_table(table)
+
+    args = [resolution, older_than]
+    self._query(f"""
+    insert or replace into {table} (ts, resolution, metric, value)
+      select cast(ts / {bucket:d} as integer) * {bucket:d}, {bucket:d}, metric, avg(value) from {table}
+      where resolution = ? and ts < ? group by 1, metric;
+    """, args)
+    removed = self._query(f"delete from {table} where resolution = ? and ts < ?;", args, f=lambda cur: cur.rowcount,
+                          commit=True)
+    return removed
 
   def reset_property_update_time(self, table: str, name: str or StorageProperty):
     if isinstance(name, StorageProperty):
@@ -156,26 +224,40 @@ class SQLStorage(BaseStorage):
 
     return self.__transform_property_value(name, p_type, p_updated, p_value)
 
-  def set_property(self, table: str, prop: StorageProperty, encrypted: bool = False):
-    if table not in self.__get_table_list():
-      self._create_property_table(table)
-
+  def __property_args(self, prop: StorageProperty, encrypted: bool, updated: float) -> list:
     if not encrypted and prop.property_type == StoragePropertyType.encrypted:
       encrypted = True
 
     if encrypted:
       prop.property_type = StoragePropertyType.encrypted
 
-    args = [
+    return [
       self._encrypt(prop.str_value) if encrypted else prop.str_value,
       prop.property_type.value,
-      time.time(),
+      updated,
       prop.name
     ]
-    if self.property_existed(table, prop.name):
-      self._query(f"update {table} set store=?, type=?, updated=? where name=?;", args, commit=True)
-    else:
-      self._query(f"insert into {table} (store, type, updated, name) values (?,?,?,?);", args, commit=True)
+
+  def set_property(self, table: str, prop: StorageProperty, encrypted: bool = False):
+    if table not in self.__get_table_list():
+      self._create_property_table(table)
+
+    args = self.__property_args(prop, encrypted, time.time())
+    self._query(f"insert or replace into {table} (store, type, updated, name) values (?,?,?,?);", args, commit=True)
+
+  def set_properties(self, table: str, props: List[StorageProperty], encrypted: bool = False):
+    if not props:
+      return
+
+    if table not in self.__get_table_list():
+      self._create_property_table(table)
+
+    updated = time.time()
+    args = [self.__property_args(prop, encrypted, updated) for prop in props]
+    self._query(
+      f=lambda cur: cur.executemany(f"insert or replace into {table} (store, type, updated, name) values (?,?,?,?);", args),
+      commit=True
+    )
 
   def delete_property(self, table: str, name: str) -> bool:
     if table not in self.__tables:
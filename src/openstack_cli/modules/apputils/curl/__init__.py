@@ -20,23 +20,38 @@
 import json
 import base64
 import gzip
+import random
+import threading
+import time
 import zlib
 import re
 from datetime import datetime, timezone
-from asyncio.events import AbstractEventLoop
 from enum import Enum
 
 from typing import Dict, Tuple, List
-from http.client import HTTPResponse
+from http.client import HTTPException, HTTPResponse
 from urllib.request import HTTPPasswordMgrWithDefaultRealm, HTTPBasicAuthHandler, Request, build_opener
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 from io import BytesIO
+
+from ..tracing import span
 try:
   from urllib.request import URLError, HTTPError
 except ImportError:
   from urllib.error import URLError, HTTPError
 
 
+_cassette: "Cassette" or None = None
+
+
+def use_cassette(cassette: "Cassette" or None):
+  """
+  Route all requests through the cassette, which records them or serves from the recorded file. None disables it
+  """
+  global _cassette
+  _cassette = cassette
+
+
 class CurlRequestType(Enum):
   GET = "GET"
   POST = "POST"
@@ -102,10 +117,16 @@ class CURLResponse(object):
     self._director_result = director_open_result
 
     if not self._is_stream:
-      self._content = director_open_result.read()
+      with span("download", "http") as s:
+        self._content = director_open_result.read()
+        s.set(size=len(self._content))
 
   def __decode_response(self, data: bytes or str) -> str:
     data = self.__decode_compressed(data)
+    with span("decode", "http"):
+      return self.__decode_charset(data)
+
+  def __decode_charset(self, data: bytes or str) -> str:
     if isinstance(data, bytes) and "Content-Type" in self._headers and "charset" in self._headers["Content-Type"]:
       charset = list(filter(lambda x: "charset" in x, self._headers["Content-Type"].split(';')))
       if len(charset) > 0:
@@ -120,11 +141,16 @@ class CURLResponse(object):
 
   def __decode_compressed(self, data: bytes or str):
     if isinstance(data, bytes) and "Content-Encoding" in self._headers:
+      with span("decompress", "http", encoding=self._headers["Content-Encoding"]):
+        return self.__decompress(data)
+
+    return data
 
-      if "gzip" in self._headers["Content-Encoding"] or 'x-gzip' in self._headers["Content-Encoding"]:
-        data = gzip.GzipFile(fileobj=BytesIO(data)).read()
-      elif "deflate" in self._headers["Content-Encoding"]:
-        data = zlib.decompress(data)
+  def __decompress(self, data: bytes) -> bytes:
+    if "gzip" in self._headers["Content-Encoding"] or 'x-gzip' in self._headers["Content-Encoding"]:
+      data = gzip.GzipFile(fileobj=BytesIO(data)).read()
+    elif "deflate" in self._headers["Content-Encoding"]:
+      data = zlib.decompress(data)
 
     return data
 
@@ -166,8 +192,10 @@ class CURLResponse(object):
 
     :rtype dict
     """
+    content = self.content
     try:
-      return json.loads(self.content)
+      with span("json", "http", size=len(content)):
+        return json.loads(content)
     except ValueError:
       return None
 
@@ -223,6 +251,163 @@ class CURLAuth(object):
     return {"Authorization": f"Basic {token}"}
 
 
+class CircuitBreakerOpenError(TimeoutError):
+  """
+  Endpoint is considered as unavailable, request was not sent
+  """
+  pass
+
+
+class CircuitBreaker(object):
+  """
+  Fails requests to the endpoint fast after the series of failures.
+
+  After failure_threshold consecutive failures the circuit opens and requests are rejected for reset_timeout
+  seconds, after that single probe request is allowed: success closes the circuit, failure opens it again
+  """
+
+  def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+    self.__name = name
+    self.__failure_threshold = failure_threshold
+    self.__reset_timeout = reset_timeout
+    self.__failures: int = 0
+    self.__opened_at: float = 0
+    self.__probe_in_progress: bool = False
+    self.__lock = threading.Lock()
+
+  @property
+  def name(self) -> str:
+    return self.__name
+
+  @property
+  def is_open(self) -> bool:
+    return self.__failures >= self.__failure_threshold
+
+  def acquire(self):
+    """
+    :raises CircuitBreakerOpenError if request should not be sent
+    """
+    with self.__lock:
+      if not self.is_open:
+        return
+
+      retry_in = self.__opened_at + self.__reset_timeout - time.monotonic()
+      if retry_in <= 0 and not self.__probe_in_progress:
+        self.__probe_in_progress = True
+        return
+
+    raise CircuitBreakerOpenError(f"{self.__name} is unavailable after {self.__failures} failed requests, "
+                                  f"next attempt in {max(retry_in, 0):.0f}s")
+
+  def record(self, is_success: bool):
+    with self.__lock:
+      self.__probe_in_progress = False
+      if is_success:
+        self.__failures = 0
+        return
+
+      self.__failures += 1
+      if self.is_open:
+        self.__opened_at = time.monotonic()
+
+
+class RetryPolicy(object):
+  """
+  Retries idempotent requests failed with connection error or 5xx response, using exponential backoff with
+  full jitter.
+
+  Retry budget limits amount of retries to the budget_ratio of all requests (with burst of max_budget retries),
+  so a failing endpoint would not be overloaded by retries. Each endpoint (scheme and host) gets own
+  CircuitBreaker
+  """
+
+  def __init__(self, retries: int = 3,
+               backoff: float = 0.2,
+               max_backoff: float = 5,
+               budget_ratio: float = 0.2,
+               max_budget: int = 10,
+               retry_codes: Tuple[int, ...] = (500, 502, 503, 504),
+               methods: Tuple[CurlRequestType, ...] = (CurlRequestType.GET, CurlRequestType.PUT, CurlRequestType.DELETE),
+               failure_threshold: int = 5,
+               reset_timeout: float = 30):
+    """
+    :arg retries max amount of retries of one request
+    :arg backoff base delay before the first retry in seconds, doubles with each next one
+    :arg max_backoff max delay between retries, Retry-After bigger than that stops retries
+    :arg budget_ratio share of requests allowed to be retried
+    :arg max_budget max amount of retries available at once
+    :arg retry_codes response codes to retry
+    :arg methods idempotent request types which could be safely retried
+    :arg failure_threshold amount of consecutive failures opening the endpoint circuit
+    :arg reset_timeout time to keep the circuit opened before the probe request
+    """
+    self.__retries = retries
+    self.__backoff = backoff
+    self.__max_backoff = max_backoff
+    self.__budget_ratio = budget_ratio
+    self.__max_budget = max_budget
+    self.__retry_codes = retry_codes
+    self.__methods = methods
+    self.__failure_threshold = failure_threshold
+    self.__reset_timeout = reset_timeout
+    self.__budget: float = max_budget
+    self.__breakers: Dict[str, CircuitBreaker] = {}
+    self.__lock = threading.Lock()
+
+  @property
+  def retries(self) -> int:
+    return self.__retries
+
+  @property
+  def budget(self) -> float:
+    return self.__budget
+
+  @property
+  def breakers(self) -> List[CircuitBreaker]:
+    return list(self.__breakers.values())
+
+  def breaker(self, url: str) -> CircuitBreaker:
+    _url = urlsplit(url)
+    name = f"{_url.scheme}://{_url.netloc}"
+    with self.__lock:
+      if name not in self.__breakers:
+        self.__breakers[name] = CircuitBreaker(name, self.__failure_threshold, self.__reset_timeout)
+
+      return self.__breakers[name]
+
+  def is_failure(self, code: int) -> bool:
+    return code >= 500
+
+  def on_request(self):
+    with self.__lock:
+      self.__budget = min(self.__budget + self.__budget_ratio, self.__max_budget)
+
+  def retry_delay(self, req_type: CurlRequestType, attempt: int, code: int = 0, retry_after: str = None) -> float:
+    """
+    Decide whether request should be retried, consuming retry budget
+
+    :arg attempt number of the failed attempt, starting from 0
+    :arg code response code, 0 for connection errors
+    :arg retry_after Retry-After response header
+    :return delay before the next attempt in seconds, or -1 if request should not be retried
+    """
+    if req_type not in self.__methods or attempt >= self.__retries or (code and code not in self.__retry_codes):
+      return -1
+
+    delay = random.uniform(0, min(self.__backoff * 2 ** attempt, self.__max_backoff))
+    if retry_after and retry_after.strip().isdigit():
+      if int(retry_after) > self.__max_backoff:
+        return -1
+      delay = max(delay, int(retry_after))
+
+    with self.__lock:
+      if self.__budget < 1:
+        return -1
+      self.__budget -= 1
+
+    return delay
+
+
 # ToDo: refactor this part
 def __encode_str(data) -> bytes:
   return bytes(data, encoding='utf8')
@@ -256,20 +441,21 @@ def __parse_content(data) -> Tuple[bytes, Dict[str, str]]:
   return response_data, response_headers
 
 
-async def curl_async(loop: AbstractEventLoop, url: str, params: Dict[str, str] = None, auth: CURLAuth = None,
+async def curl_async(loop: "asyncio.AbstractEventLoop", url: str, params: Dict[str, str] = None, auth: CURLAuth = None,
                      req_type: CurlRequestType = CurlRequestType.GET, data: str or bytes or dict = None,
                      headers: Dict[str, str] = None, cookies: List[CURLCookie] = None,
-                     timeout: int = None, use_gzip: bool = True, use_stream: bool = False) -> CURLResponse:
+                     timeout: int = None, use_gzip: bool = True, use_stream: bool = False,
+                     retry: RetryPolicy = None) -> CURLResponse:
   return await loop.run_in_executor(
     None,
-    lambda: curl(url, params, auth, req_type, data, headers, cookies, timeout, use_gzip, use_stream)
+    lambda: curl(url, params, auth, req_type, data, headers, cookies, timeout, use_gzip, use_stream, retry)
   )
 
 
 def curl(url: str, params: Dict[str, str] = None, auth: CURLAuth = None,
          req_type: CurlRequestType = CurlRequestType.GET, data: str or bytes or dict = None,
          headers: Dict[str, str] = None, cookies: List[CURLCookie] = None, timeout: int = None, use_gzip: bool = True,
-         use_stream: bool = False) -> CURLResponse:
+         use_stream: bool = False, retry: RetryPolicy = None) -> CURLResponse:
   """
   Make request to web resource
 
@@ -283,7 +469,9 @@ def curl(url: str, params: Dict[str, str] = None, auth: CURLAuth = None,
   :param timeout: Request timeout
   :param use_gzip: Accept gzip and deflate response from the server
   :param use_stream: Do not parse content of response ans stream it via raw property
+  :param retry: Retry policy for the failed requests and circuit breaker of the endpoint
   :return Response object
+  :raises TimeoutError if the endpoint is not reachable (CircuitBreakerOpenError if its circuit is opened)
   """
   post_req = [CurlRequestType.POST, CurlRequestType.PUT]
   get_req = [CurlRequestType.GET, CurlRequestType.DELETE]
@@ -335,13 +523,56 @@ def curl(url: str, params: Dict[str, str] = None, auth: CURLAuth = None,
   req = Request(url, **req_args)
   req.get_method = lambda: req_type.value
 
-  try:
-    if timeout is not None:
-      return CURLResponse(director.open(req, timeout=timeout), is_stream=use_stream)
-    else:
-      return CURLResponse(director.open(req), is_stream=use_stream)
-  except URLError or HTTPError as e:
-    if isinstance(e, HTTPError):
-      return CURLResponse(e, is_stream=use_stream)
+  if retry is None:
+    return __open(director, req, timeout, use_stream)
+
+  breaker = retry.breaker(url)
+  retry.on_request()
+  attempt = 0
+  while True:
+    breaker.acquire()
+    is_success = False
+    try:
+      r = __open(director, req, timeout, use_stream)
+      is_success = not retry.is_failure(r.code)
+    except TimeoutError:
+      delay = retry.retry_delay(req_type, attempt)
+      if delay < 0:
+        raise
     else:
-      raise TimeoutError
+      delay = retry.retry_delay(req_type, attempt, r.code, r.headers.get("Retry-After")) if not is_success else -1
+      if delay < 0:
+        return r
+
+      if use_stream:
+        r.raw.close()
+    finally:  # any outcome should be recorded, otherwise half-open circuit would wait for the probe forever
+      breaker.record(is_success)
+
+    attempt += 1
+    time.sleep(delay)
+
+
+def __open(director, req: Request, timeout: int or None, use_stream: bool) -> CURLResponse:
+  try:
+    if _cassette is not None:
+      return CURLResponse(_cassette.open(req, lambda: __director_open(director, req, timeout)), is_stream=use_stream)
+
+    return CURLResponse(__director_open(director, req, timeout), is_stream=use_stream)
+  except TimeoutError:
+    raise
+  except (HTTPException, OSError) as e:  # connection reset or incomplete body while reading the response
+    raise TimeoutError(str(e)) from e
+
+
+def __director_open(director, req: Request, timeout: int or None) -> HTTPResponse or HTTPError:
+  try:
+    # connection, sending of the request and waiting for the response headers
+    with span("ttfb", "http", method=req.get_method(), host=req.host) as s:
+      result = director.open(req, timeout=timeout) if timeout is not None else director.open(req)
+      s.set(code=result.getcode())
+    return result
+  except HTTPError as e:
+    return e
+  except (URLError, HTTPException, OSError) as e:  # connection refused/reset, socket timeout
+    raise TimeoutError(str(e.reason) if isinstance(e, URLError) else str(e)) from e
@@ -0,0 +1,254 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Github: https://github.com/hapylestat/apputils
+#
+#
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+import zlib
+from enum import Enum
+from http.client import HTTPMessage
+from io import BytesIO
+from typing import Callable, Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.request import Request
+
+
+REDACTED = "<redacted>"
+
+
+class CassetteMode(Enum):
+  record = "record"
+  replay = "replay"
+
+
+class CassetteMissError(LookupError):
+  pass
+
+
+class RecordedResponse(object):
+  """
+  Response served from the cassette, implements the part of HTTPResponse interface used by CURLResponse
+  """
+
+  def __init__(self, code: int, headers: List[Tuple[str, str]], body: bytes):
+    self.__code: int = code
+    self.__headers: HTTPMessage = HTTPMessage()
+    for name, value in headers:
+      self.__headers[name] = value
+    self.__body: BytesIO = BytesIO(body)
+
+  def getcode(self) -> int:
+    return self.__code
+
+  def info(self) -> HTTPMessage:
+    return self.__headers
+
+  def read(self, amt: int = -1) -> bytes:
+    return self.__body.read(amt)
+
+  def close(self):
+    pass
+
+
+class Cassette(object):
+  """
+  Records request/response pairs of the curl transport to the file and serves them back.
+
+  Requests are matched by method and url (volatile query params excluded), repeated requests are served in
+  the recorded order and the last recorded response is repeated once they are exhausted, so polling loops
+  end at the final recorded state.
+
+  Authentication headers and secret fields of JSON bodies are redacted before saving. Compressed responses
+  are stored decompressed (to be redacted) and compressed back on replay, so decompression cost is preserved.
+  """
+  VERSION: int = 1
+  REDACTED_HEADERS: Tuple[str, ...] = ("x-auth-token", "x-subject-token", "authorization", "cookie", "set-cookie")
+  REDACTED_FIELDS: Tuple[str, ...] = ("password", "secret", "private_key", "adminPass")
+  IGNORED_PARAMS: Tuple[str, ...] = ("changes-since",)
+
+  def __init__(self, path: str, mode: CassetteMode, latency: float = 0):
+    """
+    :arg path cassette file
+    :arg latency seconds to wait before serving each replayed response, emulates the network round trip
+    """
+    self.__path: str = path
+    self.__mode: CassetteMode = mode
+    self.__latency: float = latency
+    self.__lock = threading.Lock()
+    self.__interactions: List[dict] = []
+    self.__replay_queue: Dict[str, List[dict]] = {}
+    self.__replay_position: Dict[str, int] = {}
+
+    if mode == CassetteMode.replay:
+      self.__load()
+
+  @property
+  def mode(self) -> CassetteMode:
+    return self.__mode
+
+  @property
+  def path(self) -> str:
+    return self.__path
+
+  @property
+  def interactions(self) -> List[dict]:
+    return list(self.__interactions)
+
+  @classmethod
+  def _request_key(cls, method: str, url: str) -> str:
+    scheme, netloc, path, query, _ = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in cls.IGNORED_PARAMS])
+    return f"{method} {urlunsplit((scheme, netloc, path, query, ''))}"
+
+  @classmethod
+  def _redact_json(cls, obj):
+    if isinstance(obj, dict):
+      return {k: REDACTED if k in cls.REDACTED_FIELDS and isinstance(v, str) else cls._redact_json(v)
+              for k, v in obj.items()}
+    elif isinstance(obj, list):
+      return [cls._redact_json(v) for v in obj]
+
+    return obj
+
+  @classmethod
+  def _redact_body(cls, body: bytes) -> bytes:
+    try:
+      return json.dumps(cls._redact_json(json.loads(body))).encode("UTF-8")
+    except (ValueError, UnicodeDecodeError):
+      return body
+
+  @classmethod
+  def _redact_headers(cls, headers: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return [(k, REDACTED if k.lower() in cls.REDACTED_HEADERS else v) for k, v in headers]
+
+  @staticmethod
+  def __encode_body(body: bytes) -> dict:
+    try:
+      return {"text": body.decode("UTF-8")}
+    except UnicodeDecodeError:
+      return {"base64": base64.b64encode(body).decode("ascii")}
+
+  @staticmethod
+  def __decode_body(body: dict) -> bytes:
+    return base64.b64decode(body["base64"]) if "base64" in body else body.get("text", "").encode("UTF-8")
+
+  def __load(self):
+    if not os.path.exists(self.__path):
+      raise FileNotFoundError(f"Cassette file '{self.__path}' not found")
+
+    with open(self.__path, "r", encoding="UTF-8") as f:
+      data = json.load(f)
+
+    if data.get("version") != self.VERSION:
+      raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+
+    for item in data["interactions"]:
+      response = item["response"]
+      body = self.__decode_body(response["body"])
+      encoding = response.get("encoding")
+      if encoding == "gzip":
+        body = gzip.compress(body)
+      elif encoding == "deflate":
+        body = zlib.compress(body)
+
+      headers = [(k, v) for k, v in response["headers"] if k.lower() != "content-length"]
+      headers.append(("Content-Length", str(len(body))))
+      if encoding:
+        headers.append(("Content-Encoding", encoding))
+
+      # compression is done once on load, replay is serving ready to use bytes
+      item["_replay"] = (response["code"], headers, body)
+      self.__interactions.append(item)
+      self.__replay_queue.setdefault(self._request_key(item["request"]["method"], item["request"]["url"]), []) \
+        .append(item)
+
+  def __replay(self, req: Request) -> RecordedResponse:
+    key = self._request_key(req.get_method(), req.full_url)
+    with self.__lock:
+      if key not in self.__replay_queue:
+        raise CassetteMissError(f"No recorded response for the request: {key}")
+
+      queue = self.__replay_queue[key]
+      position = self.__replay_position.get(key, 0)
+      self.__replay_position[key] = position + 1
+      item = queue[min(position, len(queue) - 1)]
+
+    if self.__latency:
+      time.sleep(self.__latency)
+
+    return RecordedResponse(*item["_replay"])
+
+  def __record(self, req: Request, director_open: Callable) -> RecordedResponse:
+    started = time.perf_counter()
+    result = director_open()
+    body: bytes = result.read()
+    elapsed = time.perf_counter() - started
+    result.close()
+
+    headers = list(result.info().items())
+    encoding = next((v for k, v in headers if k.lower() == "content-encoding"), None)
+    if encoding and ("gzip" in encoding or "deflate" in encoding):
+      body = gzip.decompress(body) if "gzip" in encoding else zlib.decompress(body)
+      encoding = "gzip" if "gzip" in encoding else "deflate"
+    else:
+      encoding = None
+
+    stored_headers = [(k, v) for k, v in headers if k.lower() not in ("content-encoding", "content-length")]
+    item = {
+      "request": {
+        "method": req.get_method(),
+        "url": req.full_url,
+        "headers": self._redact_headers(req.header_items()),
+        "body": self.__encode_body(self._redact_body(req.data)) if isinstance(req.data, bytes) else None
+      },
+      "response": {
+        "code": result.getcode(),
+        "headers": self._redact_headers(stored_headers),
+        "encoding": encoding,
+        "body": self.__encode_body(self._redact_body(body))
+      },
+      "elapsed": round(elapsed, 6)
+    }
+    with self.__lock:
+      self.__interactions.append(item)
+
+    # the caller receives the original, not redacted response
+    response_headers = stored_headers + [("Content-Length", str(len(body)))]
+    return RecordedResponse(result.getcode(), response_headers, body)
+
+  def open(self, req: Request, director_open: Callable) -> RecordedResponse:
+    """
+    :arg director_open makes the real request, returns HTTPResponse or HTTPError
+    """
+    if self.__mode == CassetteMode.replay:
+      return self.__replay(req)
+
+    return self.__record(req, director_open)
+
+  def save(self):
+    if self.__mode != CassetteMode.record:
+      return
+
+    directory = os.path.dirname(os.path.abspath(self.__path))
+    os.makedirs(directory, exist_ok=True)
+    with open(self.__path, "w", encoding="UTF-8") as f:
+      json.dump({"version": self.VERSION, "interactions": self.__interactions}, f, indent=1)
@@ -17,9 +17,11 @@
 #
 #
 
+import hashlib
+import json
 import os
 import sys
-from typing import List, Iterable, Tuple
+from typing import Dict, List, Iterable, Tuple
 
 from .arguments import CommandLineOptions
 from .commands import CommandMetaInfo, NoCommandException, CommandArgumentException, \
@@ -27,16 +29,26 @@ from .commands import CommandMetaInfo, NoCommandException, CommandArgumentExcept
 
 
 class CommandsDiscovery(object):
+  __manifest_version: int = 1
+  __manifest_file_name: str = "commands.manifest.json"
+
   def __init__(self,
                discovery_location_path: str,
                module_class_path: str,
                file_pattern: str = "",
-               module_main_fname: str = "__init__"):
-
+               module_main_fname: str = "__init__",
+               use_manifest: bool = True,
+               argv: List[str] or None = None):
+    """
+    :arg use_manifest keep commands meta information in the manifest file, which allows to skip import of all
+                      command modules on start. Manifest is re-generated on any change of the command modules
+    :arg argv application arguments to use instead of sys.argv
+    """
     self._discovery_location_path = discovery_location_path
+    self._use_manifest = use_manifest
     self._module_main_fname = module_main_fname
     self._file_pattern = file_pattern
-    self._options: CommandLineOptions = CommandLineOptions()
+    self._options: CommandLineOptions = CommandLineOptions(argv)
 
     if os.path.isfile(self._discovery_location_path):
       self._search_dir = os.path.dirname(os.path.abspath(self._discovery_location_path))
@@ -65,10 +77,64 @@ class CommandsDiscovery(object):
       # command, file/dir name, is_dir, full_name
       yield name.partition(".")[0], name, is_dir, full_name
 
+  @property
+  def manifest_path(self) -> str:
+    return os.path.join(self._search_dir, "__pycache__", self.__manifest_file_name)
+
+  def __fingerprint(self) -> str:
+    h = hashlib.sha1(f"{self.__manifest_version}:{self._module_class_path}:{self._file_pattern}".encode("UTF-8"))
+    for root, dirs, files in os.walk(self._search_dir):
+      dirs[:] = sorted([d for d in dirs if d != "__pycache__"])
+      for name in sorted(files):
+        if not name.endswith(".py"):
+          continue
+        st = os.stat(os.path.join(root, name))
+        h.update(f"{os.path.relpath(os.path.join(root, name), self._search_dir)}:{st.st_mtime_ns}:{st.st_size};"
+                 .encode("UTF-8"))
+
+    return h.hexdigest()
+
+  def __load_manifest(self, fingerprint: str) -> bool:
+    try:
+      with open(self.manifest_path, "r", encoding="UTF-8") as f:
+        manifest = json.load(f)
+
+      if manifest["fingerprint"] != fingerprint:
+        return False
+
+      self._modules.load(manifest["commands"])
+      return True
+    except (IOError, ValueError, KeyError, TypeError):
+      self._modules = CommandModules(entry_point=self._module_main_fname)
+      return False
+
+  def __save_manifest(self, fingerprint: str):
+    try:
+      data = json.dumps({"fingerprint": fingerprint, "commands": self._modules.serialize()})
+      os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+      tmp_path = f"{self.manifest_path}.{os.getpid()}"
+      with open(tmp_path, "w", encoding="UTF-8") as f:
+        f.write(data)
+      os.replace(tmp_path, self.manifest_path)
+    except (IOError, TypeError, ValueError):  # read-only location or not serializable meta
+      pass
+
   def collect(self):
     """
     :rtype CommandsDiscovery
     """
+    fingerprint = self.__fingerprint() if self._use_manifest else None
+    if fingerprint and self.__load_manifest(fingerprint):
+      return self
+
+    self.__import_modules()
+
+    if fingerprint:
+      self.__save_manifest(fingerprint)
+
+    return self
+
+  def __import_modules(self):
     for command, name, is_dir, full_name in self.__collect_modules(self._search_dir, self._file_pattern):
       if command in self._modules:
         continue
@@ -83,8 +149,6 @@ class CommandsDiscovery(object):
             sub_commands.append(_command)
       self._modules.add(self._module_class_path, command, sub_commands)
 
-    return self
-
   def __inject_help_command(self):
     from .help import generate_help
     meta = CommandMetaInfo("help", "this command")
@@ -105,10 +169,18 @@ class CommandsDiscovery(object):
   def command_arguments(self) -> List[str]:
     return self._options.args[1:] if self._options.args else []
 
+  @property
+  def argv(self) -> List[str]:
+    return self._options.argv
+
   @property
   def kwargs_name(self) -> List[str]:
     return list(self._options.kwargs.keys())
 
+  @property
+  def kwargs(self) -> Dict[str, str]:
+    return dict(self._options.kwargs)
+
   def _get_command(self, injected_args: dict = None, fail_on_unknown: bool = False) -> List[CommandModule]:
     if not self._options.args:
       raise NoCommandException(None, "No command passed, unable to continue")
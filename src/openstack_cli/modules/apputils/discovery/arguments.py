@@ -19,12 +19,16 @@
 
 import os
 import sys
+from typing import List
 
 
 class CommandLineOptions(object):
 
-  def __init__(self):
-    self.__argv = sys.argv[1:]
+  def __init__(self, argv: List[str] or None = None):
+    """
+    :arg argv list of the arguments to parse without the application name, by default sys.argv is used
+    """
+    self.__argv = sys.argv[1:] if argv is None else list(argv)
     self.__file_path = os.path.abspath(sys.argv[0])
     self.__filename = os.path.basename(self.__file_path)
     self.__directory = os.path.dirname(self.__file_path)
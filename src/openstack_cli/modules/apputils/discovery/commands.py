@@ -18,6 +18,7 @@
 #
 
 from collections import OrderedDict
+from importlib import import_module
 from typing import Dict, Callable, List, get_origin, Optional
 
 
@@ -58,6 +59,8 @@ class CommandArgumentItem(object):
 
 
 class CommandArgumentsBuilder:
+  __types: Dict[str, type] = {t.__name__: t for t in (int, str, float, list, bool)}
+
   def __init__(self):
     self._args: Dict[str, CommandArgumentItem] = {}
     self._alias_args: Dict[str, CommandArgumentItem] = {}
@@ -155,6 +158,34 @@ class CommandArgumentsBuilder:
   def get_default_argument(self, index: int) -> CommandArgumentItem:
     return list(self._default_args.values())[index]
 
+  def serialize(self) -> dict:
+    def _item(item: CommandArgumentItem) -> list:
+      return [item.name, item.value_type.__name__ if item.value_type else None, item.item_help, item.default, item.alias]
+
+    return {
+      "args": [_item(item) for item in self._args.values()],
+      "alias_args": [_item(item) for item in self._alias_args.values()],
+      "default_args": [_item(item) for item in self._default_args.values()],
+      "default_arg_flag_used": self.__is_default_arg_flag_used
+    }
+
+  @classmethod
+  def from_serialized(cls, data: dict):
+    """
+    Restore builder state as is, without re-applying validation rules
+
+    :rtype CommandArgumentsBuilder
+    """
+    def _item(name: str, value_type: str or None, item_help: str, default: object, alias: str):
+      return CommandArgumentItem(name, cls.__types[value_type] if value_type else None, item_help, default, alias)
+
+    builder = cls()
+    builder._args.update({item[0]: _item(*item) for item in data["args"]})
+    builder._alias_args.update({item[4]: _item(*item) for item in data["alias_args"]})
+    builder._default_args.update({item[0]: _item(*item) for item in data["default_args"]})
+    builder.__is_default_arg_flag_used = data["default_arg_flag_used"]
+    return builder
+
 
 class CommandMetaInfo(object):
   def __init__(self,
@@ -213,6 +244,25 @@ class CommandMetaInfo(object):
   def arg_builder(self) -> CommandArgumentsBuilder:
     return self._arguments
 
+  def serialize(self) -> dict:
+    return {
+      "name": self._name,
+      "help": self._help,
+      "default_sub_command": self._default_sub_command,
+      "exec_with_child": self._exec_with_child,
+      "options": self._kwargs,
+      "arguments": self._arguments.serialize()
+    }
+
+  @classmethod
+  def from_serialized(cls, data: dict):
+    """
+    :rtype CommandMetaInfo
+    """
+    meta = cls(data["name"], data["help"], data["default_sub_command"], data["exec_with_child"], **data["options"])
+    meta._arguments = CommandArgumentsBuilder.from_serialized(data["arguments"])
+    return meta
+
   @classmethod
   def __convert_value_to_type(cls, value: str, _type: type):
     if _type is list and isinstance(value, str):
@@ -293,15 +343,21 @@ class CommandMetaInfo(object):
 
 
 class CommandModule(object):
-  def __init__(self, meta_info: CommandMetaInfo, classpath: str, import_name: str, entry_point: Callable, parent=None):
+  def __init__(self, meta_info: CommandMetaInfo, classpath: str, import_name: str, entry_point: Callable or str,
+               parent=None, entry_point_args: tuple = None):
     """
+    :arg entry_point command function or name of the function in the classpath module, which would be imported
+                     only on the command execution
+    :arg entry_point_args names of the entry point arguments, required if entry point is not imported yet
     :type parent CommandModule
     """
     self.__name = meta_info.name
     self.__classpath = classpath
     self.__import_name = import_name
     self.__meta_info = meta_info
-    self.__entry_point: Callable = entry_point
+    self.__entry_point: Callable or None = None if isinstance(entry_point, str) else entry_point
+    self.__entry_point_name: str = entry_point if isinstance(entry_point, str) else entry_point.__name__
+    self.__entry_point_args: tuple or None = tuple(entry_point_args) if entry_point_args is not None else None
     self.__args = None
     self.__sub_commands: Dict[str, CommandModule] = {}
     self.__parent = parent
@@ -334,7 +390,7 @@ class CommandModule(object):
       if len(f_args) - len(set(f_args) & injected_args) != len(set(args.keys()) & set(f_args)):
         raise CommandArgumentException("Function \"{}\" from module {} doesn't implement all arguments in the"
                                        " signature or implements unknown definition".format(
-                                        self.__entry_point.__name__, self.__classpath
+                                        self.__entry_point_name, self.__classpath
                                        ))
     else:
       args = {
@@ -393,9 +449,47 @@ class CommandModule(object):
   def meta_info(self) -> CommandMetaInfo:
     return self.__meta_info
 
+  @property
+  def entry_point(self) -> Callable:
+    if self.__entry_point is None:
+      m = import_module(self.__classpath)
+      self.__entry_point = m.__dict__[self.__entry_point_name]
+
+    return self.__entry_point
+
   @property
   def entry_point_args(self) -> tuple:
-    return self.__entry_point.__code__.co_varnames[:self.__entry_point.__code__.co_argcount]
+    if self.__entry_point_args is None:
+      self.__entry_point_args = self.entry_point.__code__.co_varnames[:self.entry_point.__code__.co_argcount]
+
+    return self.__entry_point_args
+
+  def serialize(self) -> dict:
+    return {
+      "classpath": self.__classpath,
+      "import_name": self.__import_name,
+      "entry_point": self.__entry_point_name,
+      "entry_point_args": list(self.entry_point_args),
+      "meta_info": self.__meta_info.serialize(),
+      "sub_commands": [cmd.serialize() for cmd in self.__sub_commands.values()]
+    }
+
+  @classmethod
+  def from_serialized(cls, data: dict, parent=None):
+    """
+    :type parent CommandModule
+    :rtype CommandModule
+    """
+    command_module = cls(
+      meta_info=CommandMetaInfo.from_serialized(data["meta_info"]),
+      classpath=data["classpath"],
+      import_name=data["import_name"],
+      entry_point=data["entry_point"],
+      parent=parent,
+      entry_point_args=data["entry_point_args"]
+    )
+    command_module.add_subcommand([cls.from_serialized(sub, command_module) for sub in data["sub_commands"]])
+    return command_module
 
   def filter_injected_arguments(self, injected_arguments: dict = None) -> dict or None:
     if not injected_arguments:
@@ -415,10 +509,10 @@ class CommandModule(object):
     return all_args
 
   def execute(self,  injected_args: dict = None):
-    self.__entry_point(**self.__get_args(self.__args, injected_args))
+    self.entry_point(**self.__get_args(self.__args, injected_args))
 
   async def execute_async(self, injected_args: dict = None):
-    await self.__entry_point(**self.__get_args(self.__args, injected_args))
+    await self.entry_point(**self.__get_args(self.__args, injected_args))
 
   def __str__(self):
     return f"Module: {self.__import_name}, Meta: {self.meta_info.name}, Sub Commands: {len(self.__sub_commands)}"
@@ -533,3 +627,13 @@ Conflicting command definitions detected:
     if not module:
       return
     self.__modules[module.meta_info.name] = module
+
+  def serialize(self) -> List[dict]:
+    return [cmd.serialize() for cmd in self.__modules.values()]
+
+  def load(self, data: List[dict]):
+    """
+    Restore commands from serialized form, command modules would be imported on execution
+    """
+    for item in data:
+      self.inject(CommandModule.from_serialized(item))
@@ -125,12 +125,14 @@ class _ProgressBarTiming(object):
 
 
 class ProgressBar(object):
-  def __init__(self, text: str, width: int, options: ProgressBarOptions = ProgressBarOptions(), stdout=sys.stdout):
+  def __init__(self, text: str, width: int, options: ProgressBarOptions = ProgressBarOptions(), stdout=sys.stdout,
+               max_fps: int = 15):
     """
     Create ProgressBar object
 
     :argument text Text of the ProgressBar
     :argument options Format of progress Bar
+    :argument max_fps Max amount of frames written per second, intermediate updates are dropped. 0 - no limit
     """
     self._text: str = text
     self._status_msg: str = ""
@@ -146,6 +148,10 @@ class ProgressBar(object):
     self._infinite_width: int = 1
     self.__stdout = stdout
     self._status: ProgressBarStatus = ProgressBarStatus.stopped
+    self._frame_interval: float = 1.0 / max_fps if max_fps > 0 else 0
+    self._last_frame: str or None = None
+    self._last_frame_time: float = 0
+    self._rendered_status_msg: str = ""
 
   @property
   def value(self):
@@ -180,7 +186,7 @@ class ProgressBar(object):
     self._max = max_val
     self._fill_empty()
     self._value = 0
-    self.progress(0)
+    self.progress(0, force=True)
     self._status = ProgressBarStatus.started
 
   def _calc_percent_done(self, value: float):
@@ -196,24 +202,11 @@ class ProgressBar(object):
     data = " " * (self._console_width - len(self._begin_line_character))
     self.__stdout.write(self._begin_line_character + data)
     self.__stdout.flush()
+    self._last_frame = None
 
-  def progress(self, value, new_status=None):
-    """
-    :type value int
-    :type new_status str
-    """
-    space_fillers = 0
-
-    if new_status is not None:
-      # if new text is shorter, then we need fill previously used place
-      space_fillers = len(self._status_msg) - len(new_status) if self._status_msg and len(self._status_msg) - len(new_status) > 0 else 0
-      self._status_msg = new_status
-
-    if not self._infinite_mode and value > self._max:
-      self._infinite_mode = True
-      self._fill_empty()
-
-    self._timer.tick(value)
+  def _render(self, value) -> str:
+    # if new text is shorter than the one on the screen, then we need fill previously used place
+    space_fillers = max(len(self._rendered_status_msg) - len(self._status_msg), 0)
 
     if not self._infinite_mode:
       percent_done = self._calc_percent_done(value)
@@ -240,7 +233,37 @@ class ProgressBar(object):
       "elapsed": self._timer.time_gone
     }
 
-    self.__stdout.write(safe_format(self._options.progress_format, **kwargs))
+    return safe_format(self._options.progress_format, **kwargs)
+
+  def progress(self, value, new_status=None, force=False):
+    """
+    Update progress value. The line is re-drawn not often than max_fps allows and only if it is changed
+
+    :arg force draw the frame ignoring fps limit
+    :type value int
+    :type new_status str
+    :type force bool
+    """
+    if new_status is not None:
+      self._status_msg = new_status
+
+    if not self._infinite_mode and value > self._max:
+      self._infinite_mode = True
+      self._fill_empty()
+      force = True
+
+    self._timer.tick(value)
+
+    now = time.monotonic()
+    if not force and now - self._last_frame_time < self._frame_interval:
+      return
+
+    frame = self._render(value)
+    if frame == self._last_frame:
+      return
+
+    self._last_frame, self._last_frame_time, self._rendered_status_msg = frame, now, self._status_msg
+    self.__stdout.write(frame)
     self.__stdout.flush()
 
   def progress_inc(self, step=1, new_status=None):
@@ -255,7 +278,7 @@ class ProgressBar(object):
     self._status = ProgressBarStatus.stopped
     self._max = 1
     self._value = 0
-    self.progress(0)
+    self.progress(0, force=True)
 
   def stop(self, hide_progress=False, new_status=None):
     """
@@ -279,7 +302,7 @@ class ProgressBar(object):
       }
       self.__stdout.write("{begin_line}{text}{sep}{new_status}{fill_space}".format(**kwargs))
     else:
-      self.progress(int(self._max), new_status=new_status)
+      self.progress(int(self._max), new_status=new_status, force=True)
 
     self.__stdout.write(os.linesep)
 
@@ -0,0 +1,171 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List
+
+
+class Span(object):
+  """
+  Measures the time of the code block, is recorded by the tracer on exit
+  """
+  __slots__ = ("_tracer", "name", "category", "args", "_start")
+
+  def __init__(self, tracer: "Tracer", name: str, category: str, args: dict):
+    self._tracer = tracer
+    self.name = name
+    self.category = category
+    self.args = args
+    self._start = 0.0
+
+  def set(self, **args) -> "Span":
+    self.args.update(args)
+    return self
+
+  def __enter__(self) -> "Span":
+    self._start = time.perf_counter()
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    if exc_type is not None:
+      self.args["error"] = exc_type.__name__
+
+    self._tracer.add(self.name, self.category, self._start, time.perf_counter() - self._start, self.args)
+    return False
+
+
+class _NoopSpan(object):
+  """
+  Returned when tracing is disabled, so the traced code costs one call and one attribute check
+  """
+  __slots__ = ()
+
+  def set(self, **args) -> "_NoopSpan":
+    return self
+
+  def __enter__(self) -> "_NoopSpan":
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer(object):
+  """
+  Collects spans of all threads and exports them in Chrome trace event format,
+  which could be opened by chrome://tracing or https://ui.perfetto.dev
+  """
+
+  def __init__(self):
+    self.__enabled: bool = False
+    self.__origin: float = time.perf_counter()
+    self.__events: List[dict] = []
+    self.__threads: Dict[int, str] = {}
+
+  @property
+  def enabled(self) -> bool:
+    return self.__enabled
+
+  def enable(self):
+    if not self.__enabled:
+      self.__origin = time.perf_counter()
+    self.__enabled = True
+
+  def disable(self):
+    self.__enabled = False
+
+  def reset(self):
+    self.__events = []
+    self.__threads = {}
+    self.__origin = time.perf_counter()
+
+  def span(self, name: str, category: str = "app", **args) -> Span or _NoopSpan:
+    if not self.__enabled:
+      return _NOOP_SPAN
+
+    return Span(self, name, category, args)
+
+  def add(self, name: str, category: str, start: float, duration: float, args: dict = None):
+    """
+    Record already measured span
+
+    :arg start value of time.perf_counter() at the beginning of the span
+    :arg duration span length in seconds
+    """
+    if not self.__enabled:
+      return
+
+    tid = threading.get_ident()
+    if tid not in self.__threads:
+      self.__threads[tid] = threading.current_thread().name
+
+    # list.append is atomic, no lock required for the threads of the shared executor
+    self.__events.append({
+      "name": name,
+      "cat": category,
+      "ph": "X",
+      "ts": round((start - self.__origin) * 1e6, 3),
+      "dur": round(duration * 1e6, 3),
+      "pid": os.getpid(),
+      "tid": tid,
+      "args": args or {}
+    })
+
+  @property
+  def events(self) -> List[dict]:
+    return list(self.__events)
+
+  def to_chrome_trace(self) -> dict:
+    pid = os.getpid()
+    metadata = [
+      {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+      for tid, name in self.__threads.items()
+    ]
+    return {
+      "traceEvents": metadata + sorted(self.__events, key=lambda x: x["ts"]),
+      "displayTimeUnit": "ms"
+    }
+
+  def export(self, file_name: str) -> str:
+    """
+    :return absolute path to the written trace
+    """
+    file_name = os.path.abspath(file_name)
+    with open(file_name, "w", encoding="UTF-8") as f:
+      json.dump(self.to_chrome_trace(), f, default=str)
+
+    return file_name
+
+
+tracer = Tracer()
+
+
+def span(name: str, category: str = "app", **args) -> Span or _NoopSpan:
+  """
+  Span of the global tracer, usage:
+
+  with span("json", "http") as s:
+    s.set(size=len(data))
+  """
+  if not tracer.enabled:
+    return _NOOP_SPAN
+
+  return Span(tracer, name, category, args)
@@ -0,0 +1,153 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Optional
+
+SHARED_EXECUTOR_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def shared_executor() -> ThreadPoolExecutor:
+  """
+  Process-wide thread pool for API bound tasks, created on the first use.
+
+  Callers should bound own concurrency (see StatusOutput pool_size) instead of creating separate pools,
+  tasks submitted to the executor should not block waiting for other tasks of the same executor
+  """
+  global _executor
+  if _executor is None:
+    with _executor_lock:
+      if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SHARED_EXECUTOR_WORKERS, thread_name_prefix="oscli")
+
+  return _executor
+
+
+def parse_retry_after(value: str or None) -> float:
+  """
+  :arg value Retry-After header value, amount of seconds or HTTP date
+  :return amount of seconds to wait, 0 if header is absent or malformed
+  """
+  if not value:
+    return 0
+
+  value = value.strip()
+  if value.isdigit():
+    return float(value)
+
+  from email.utils import parsedate_to_datetime
+  try:
+    return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+  except (TypeError, ValueError):
+    return 0
+
+
+class ConcurrencyController(object):
+  """
+  Additive increase/multiplicative decrease (AIMD) limit of parallel API requests.
+
+  The limit doubles each round trip till the first congestion signal (slow start) and grows by one per
+  round trip after it. Throttling responses (429, 503), timeouts or latency spikes halve the limit, Retry-After
+  header pauses scheduling of new tasks. Requests started before the last decrease do not decrease the limit
+  again, as they were sent with the old limit.
+  """
+  THROTTLE_CODES = (429, 503)
+  TIMEOUT_CODE = 0
+
+  def __init__(self, min_limit: int = 2, max_limit: int = SHARED_EXECUTOR_WORKERS, latency_tolerance: float = 3.0,
+               warm_up_samples: int = 5):
+    """
+    :arg min_limit initial and the lowest limit
+    :arg max_limit the highest limit, capped by the shared executor size
+    :arg latency_tolerance request latency this many times bigger than the baseline one is treated as a spike
+    :arg warm_up_samples amount of successful requests needed to establish the baseline latency
+    """
+    self.__min_limit = max(min_limit, 1)
+    self.__max_limit = max(min(max_limit, SHARED_EXECUTOR_WORKERS), self.__min_limit)
+    self.__latency_tolerance = latency_tolerance
+    self.__warm_up_samples = warm_up_samples
+    self.__window: float = self.__min_limit
+    self.__slow_start: bool = True
+    self.__baseline: float = 0
+    self.__samples: int = 0
+    self.__last_decrease: float = 0
+    self.__paused_till: float = 0
+    self.__lock = threading.Lock()
+
+  @property
+  def limit(self) -> int:
+    return int(self.__window)
+
+  @property
+  def min_limit(self) -> int:
+    return self.__min_limit
+
+  @property
+  def max_limit(self) -> int:
+    return self.__max_limit
+
+  @property
+  def pause(self) -> float:
+    """
+    :return amount of seconds to wait before scheduling new tasks
+    """
+    return max(self.__paused_till - time.monotonic(), 0)
+
+  def __decrease(self, now: float, started: float):
+    self.__slow_start = False
+    if started < self.__last_decrease:
+      return
+
+    self.__window = max(self.__window / 2, self.__min_limit)
+    self.__last_decrease = now
+
+  def __increase(self):
+    step = 1 if self.__slow_start else 1 / self.__window
+    self.__window = min(self.__window + step, self.__max_limit)
+
+  def observe(self, code: int, latency: float, retry_after: float = 0):
+    """
+    Feed the result of the finished request
+
+    :arg code HTTP response code, TIMEOUT_CODE if request timed out
+    :arg latency request duration in seconds
+    :arg retry_after amount of seconds server asked to wait
+    """
+    now = time.monotonic()
+    started = now - latency
+    with self.__lock:
+      if retry_after:
+        self.__paused_till = max(self.__paused_till, now + retry_after)
+
+      if code in self.THROTTLE_CODES or code == self.TIMEOUT_CODE:
+        self.__decrease(now, started)
+        return
+
+      if self.__samples >= self.__warm_up_samples and latency > self.__baseline * self.__latency_tolerance:
+        self.__decrease(now, started)
+        return
+
+      # moving average keeps baseline following slow changes of the cloud latency
+      self.__samples += 1
+      alpha = 1 / min(self.__samples, 10)
+      self.__baseline += (latency - self.__baseline) * alpha
+
+      if code < 400:
+        self.__increase()
@@ -18,16 +18,20 @@ import json
 import os
 import re
 import sys
+import threading
 import time
+from datetime import datetime
 from enum import Enum
-from inspect import FrameInfo
 from json import JSONDecodeError
+from types import FrameType
 from typing import Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
-from openstack_cli.modules.apputils.curl import CURLResponse, CurlRequestType, curl
+from openstack_cli.modules.apputils.curl import CURLResponse, CurlRequestType, RetryPolicy, curl
 from openstack_cli.modules.apputils.progressbar import CharacterStyles, ProgressBar, ProgressBarFormat, \
   ProgressBarOptions
 from openstack_cli.modules.apputils.terminal.colors import Colors
+from openstack_cli.modules.apputils.tracing import span, tracer
+from openstack_cli.modules.concurrency import ConcurrencyController, parse_retry_after, shared_executor
 from openstack_cli.modules.openstack.api_objects import APIProjects, ComputeFlavorItem, ComputeFlavors, ComputeLimits, \
   ComputeServerActionRebootType, ComputeServerActions, ComputeServerInfo, ComputeServers, DiskImageInfo, DiskImages, \
   LoginResponse, NetworkItem, NetworkLimits, Networks, Region, RegionItem, Subnets, Token, VMCreateResponse, \
@@ -61,11 +65,23 @@ class LocalCacheType(Enum):
 
 
 class OpenStack(object):
+  __shared_instance: Optional["OpenStack"] = None
+
+  def __new__(cls, conf, debug: bool = False):
+    shared = OpenStack.__shared_instance
+    # long-living processes are re-using one authenticated instance with warm caches across commands
+    if shared is not None and shared._conf is conf and type(shared) is cls:
+      return shared
+
+    return super(OpenStack, cls).__new__(cls)
 
   def __init__(self, conf, debug: bool = False):
     """
     :type conf openstack_cli.core.config.Configuration
     """
+    if self is OpenStack.__shared_instance:
+      return
+
     self.__last_errors: List[str] = []
     self.__login_api = f"{conf.os_address}/v3"
     self._conf = conf
@@ -79,6 +95,11 @@ class OpenStack(object):
     self.__networks_cache: Optional[OSNetwork] = None
     self.__debug = debug or os.getenv("API_DEBUG", False) == "True"
     self.__local_cache: Dict[LocalCacheType, object] = {}
+    self.__request_observers: List[Callable[[int, float, float], None]] = []
+    self.__concurrency: Optional[ConcurrencyController] = None
+    self.__retry_policy: Optional[RetryPolicy] = None
+    self.__quotas_lock = threading.Lock()
+    self.__quotas_invalidated: bool = False
 
     pattern_str = f"[\\W\\s]*(?P<name>{'|'.join(conf.supported_os_names)})(\\s|\\-|\\_)(?P<ver>[\\d\\.]+\\s*[\\w]*).*$"
     self.__os_image_pattern = re.compile(pattern_str, re.IGNORECASE)
@@ -108,20 +129,27 @@ class OpenStack(object):
           try:
             self._conf.add_key(server_key)
           except ValueError:
-            print(f"Key {server_key.name} is present locally but have wrong hash, replacing with server key")
+            print(f"Key {server_key.name} is present locally but have wrong hash, replacing with server key",
+                  file=sys.stderr)
             self._conf.delete_key(server_key.name)
             self._conf.add_key(server_key)
 
       self._conf.cache.set(VMKeypairItemValue, "this super cache")
 
     def __cached_network():
-      self.__networks_cache = OSNetwork(serialized_obj=self._conf.cache.get(OSNetwork))
+      raw = self._conf.cache.get(OSNetwork)
+      with span("decode", "decode", object=OSNetwork.__name__):
+        self.__networks_cache = OSNetwork(serialized_obj=raw)
 
     def __cached_images():
-      self.__cache_images = {k: DiskImageInfo(serialized_obj=v) for k, v in json.loads(self._conf.cache.get(DiskImageInfo)).items()}
+      raw = self._conf.cache.get(DiskImageInfo)
+      with span("decode", "decode", object=DiskImageInfo.__name__):
+        self.__cache_images = {k: DiskImageInfo(serialized_obj=v) for k, v in json.loads(raw).items()}
 
     def __cached_flavors():
-      self.__flavors_cache = {k: OSFlavor(serialized_obj=v) for k, v in json.loads(self._conf.cache.get(OSFlavor)).items()}
+      raw = self._conf.cache.get(OSFlavor)
+      with span("decode", "decode", object=OSFlavor.__name__):
+        self.__flavors_cache = {k: OSFlavor(serialized_obj=v) for k, v in json.loads(raw).items()}
 
     def __cached_ssh_keys():
       return True
@@ -145,19 +173,27 @@ class OpenStack(object):
       }
     }
 
-    need_recache: bool = False in [self._conf.cache.exists(obj) for obj in _cached_objects]
-    if need_recache and not self.__debug:
-      p = ProgressBar("Syncing to the server data",20,
-        ProgressBarOptions(CharacterStyles.simple, ProgressBarFormat.PROGRESS_FORMAT_STATUS)
-      )
-      p.start(len(_cached_objects))
-      for cache_item, funcs in _cached_objects.items():
-        p.progress_inc(1, cache_item.__name__)
-        funcs[self._conf.cache.exists(cache_item)]()
-      p.stop(hide_progress=True)
+    def __sync_objects(need_recache: bool):
+      if need_recache and not self.__debug:
+        # stderr keeps stdout clean for the machine-readable output, like "list --format json"
+        p = ProgressBar("Syncing to the server data",20,
+          ProgressBarOptions(CharacterStyles.simple, ProgressBarFormat.PROGRESS_FORMAT_STATUS), stdout=sys.stderr
+        )
+        p.start(len(_cached_objects))
+        for cache_item, funcs in _cached_objects.items():
+          p.progress_inc(1, cache_item.__name__)
+          funcs[self._conf.cache.exists(cache_item)]()
+        p.stop(hide_progress=True)
+      else:
+        for cache_item, funcs in _cached_objects.items():
+          funcs[self._conf.cache.exists(cache_item)]()
+
+    if False in [self._conf.cache.exists(obj) for obj in _cached_objects]:
+      # only one instance re-syncing the data, the rest are waiting and re-using the result
+      with self._conf.lock("cache_sync"):
+        __sync_objects(False in [self._conf.cache.exists(obj) for obj in _cached_objects])
     else:
-      for cache_item, funcs in _cached_objects.items():
-        funcs[self._conf.cache.exists(cache_item)]()
+      __sync_objects(False)
 
     if not self.__users_cache:
       self.users
@@ -189,9 +225,19 @@ class OpenStack(object):
     return True
 
   def __auth(self, _type: AuthRequestType = AuthRequestType.SCOPED) -> bool:
-    if self._conf.auth_token and self.__check_token():
+    auth_token = self._conf.auth_token
+    if auth_token and self.__check_token():
       return True
 
+    # single-flight re-authentication: only one instance is requesting new token, the rest re-use it
+    with self._conf.lock("auth"):
+      refreshed_token = self._conf.auth_token
+      if refreshed_token and refreshed_token != auth_token and self.__check_token():
+        return True
+
+      return self.__login(_type)
+
+  def __login(self, _type: AuthRequestType) -> bool:
     if _type == AuthRequestType.UNSCOPED:
       data = AuthRequestBuilder.unscoped_login(self._conf.os_login, self._conf.os_password)
     elif _type == AuthRequestType.SCOPED and self._conf.project.id:
@@ -262,12 +308,104 @@ class OpenStack(object):
       self.__last_errors.append("Login failed, some exception happen")
       return False
 
-  def __get_origin_frame(self, base_f_name: str) -> List[FrameInfo]:
-    import inspect
-    _frames = inspect.stack()
-    for i in range(0, len(_frames)):
-      if _frames[i].function == base_f_name:
-        return [_frames[i+3], _frames[i+2], _frames[i+1]]
+  def share(self):
+    """
+    Make the instance to be returned by any further OpenStack() call made with the same configuration object
+
+    :rtype OpenStack
+    """
+    OpenStack.__shared_instance = self
+    return self
+
+  @classmethod
+  def unshare(cls):
+    OpenStack.__shared_instance = None
+
+  def keep_alive(self, refresh_servers: bool = True) -> bool:
+    """
+    Keep the authentication token and in-memory inventory fresh, to be called periodically by long-living instances
+    """
+    if self.__is_auth and self.__check_token():
+      if self._conf.region:
+        self.__init_after_auth__()  # re-syncs expired cache items only
+    elif not self.login():
+      return False
+
+    if refresh_servers:
+      self.get_servers(invalidate_cache=True)
+
+    return True
+
+  def add_request_observer(self, observer: Callable[[int, float, float], None]):
+    """
+    :arg observer called after each API request with response code (0 on timeout), latency in seconds and
+                  amount of seconds requested by Retry-After header
+    """
+    self.__request_observers.append(observer)
+
+  def remove_request_observer(self, observer: Callable[[int, float, float], None]):
+    if observer in self.__request_observers:
+      self.__request_observers.remove(observer)
+
+  def __notify_request_observers(self, code: int, latency: float, retry_after: str or None = None):
+    if not self.__request_observers:
+      return
+
+    _retry_after = parse_retry_after(retry_after)
+    for observer in self.__request_observers:
+      observer(code, latency, _retry_after)
+
+  @property
+  def concurrency(self) -> ConcurrencyController:
+    """
+    Limit of parallel API requests for bulk operations, adapts to the cloud response codes and latency
+    """
+    if self.__concurrency is None:
+      self.__concurrency = ConcurrencyController(self._conf.min_concurrency, self._conf.max_concurrency)
+      self.add_request_observer(self.__concurrency.observe)
+
+    return self.__concurrency
+
+  @property
+  def retry_policy(self) -> RetryPolicy:
+    """
+    Retries of the failed idempotent API requests and circuit breakers of the API endpoints
+    """
+    if self.__retry_policy is None:
+      self.__retry_policy = RetryPolicy(retries=self._conf.api_retries, budget_ratio=self._conf.retry_budget / 100)
+
+    return self.__retry_policy
+
+  @staticmethod
+  def __get_origin_frames(depth: int = 3) -> List[FrameType]:
+    """
+    :return callers of the API request method, the most distant first
+    """
+    # walking frames costs O(depth), while inspect.stack() reads the source lines of the whole stack
+    frame = sys._getframe(3)  # __get_origin_frames <- __print_request_debug <- _request* <- caller
+    frames: List[FrameType] = []
+    while frame and len(frames) < depth:
+      frames.append(frame)
+      frame = frame.f_back
+
+    return frames[::-1]
+
+  def __print_request_debug(self, req_type: CurlRequestType, endpoint: EndpointTypes, relative_uri: str,
+                            t_start: int):
+    from openstack_cli.core.output import Console
+    _t_sec = (time.time_ns() - t_start) / 1000000000
+    _f_caller = self.__get_origin_frames()
+
+    _chunks = [
+      f"[{_t_sec:.2f}s]",
+      f"[{req_type.value}]",
+      f"[{endpoint.value}]",
+      f" {relative_uri}; ",
+      str(Colors.RESET),
+      f"{Colors.BRIGHT_BLACK}{os.path.basename(_f_caller[0].f_code.co_filename)}{Colors.RESET}: ",
+      f"{Colors.BRIGHT_BLACK}->{Colors.RESET}".join([f"{f.f_code.co_name}:{f.f_lineno}" for f in _f_caller])
+    ]
+    Console.print_debug("".join(_chunks))
 
   def _request_simple(self,
                       endpoint: EndpointTypes,
@@ -289,30 +427,17 @@ class OpenStack(object):
     if self.__debug:
       _t_start = time.time_ns()
 
-    r = None
-    try:
-      return curl(url, req_type=req_type, params=params, headers=headers, data=data)
-    except TimeoutError:
-      self.__last_errors.append("Timeout exception on API request")
-      return None
-    finally:
-      if self.__debug:
-        from openstack_cli.core.output import Console
-        _t_delta = time.time_ns() - _t_start
-        _t_sec = _t_delta / 1000000000
-        _params = ",".join([f"{k}={v}" for k, v in params.items()]) if params else "None"
-        _f_caller = self.__get_origin_frame(self._request_simple.__name__)
-
-        _chunks = [
-          f"[{_t_sec:.2f}s]",
-          f"[{req_type.value}]",
-          f"[{endpoint.value}]",
-          f" {relative_uri}; ",
-          str(Colors.RESET),
-          f"{Colors.BRIGHT_BLACK}{os.path.basename(_f_caller[0].filename)}{Colors.RESET}: ",
-          f"{Colors.BRIGHT_BLACK}->{Colors.RESET}".join([f"{f.function}:{f.lineno}" for f in _f_caller])
-        ]
-        Console.print_debug("".join(_chunks))
+    with span("request", "api", method=req_type.value, endpoint=endpoint.value, uri=relative_uri) as _span:
+      try:
+        r = curl(url, req_type=req_type, params=params, headers=headers, data=data, retry=self.retry_policy)
+        _span.set(code=r.code)
+        return r
+      except TimeoutError as e:
+        self.__last_errors.append(f"Timeout exception on API request: {e}" if str(e) else "Timeout exception on API request")
+        return None
+      finally:
+        if self.__debug:
+          self.__print_request_debug(req_type, endpoint, relative_uri, _t_start)
 
   def _request(self,
                endpoint: EndpointTypes,
@@ -339,29 +464,23 @@ class OpenStack(object):
     }
 
     r = None
-    try:
-      r = curl(url, req_type=req_type, params=params, headers=headers, data=data)
-    except TimeoutError:
-      self.__last_errors.append("Timeout exception on API request")
-      return
-    finally:
-      if self.__debug:
-        from openstack_cli.core.output import Console
-        _t_delta = time.time_ns() - _t_start
-        _t_sec = _t_delta / 1000000000
-        _params = ",".join([f"{k}={v}" for k, v in params.items()]) if params else "None"
-        _f_caller = self.__get_origin_frame(self._request.__name__)
-
-        _chunks = [
-          f"[{_t_sec:.2f}s]",
-          f"[{req_type.value}]",
-          f"[{endpoint.value}]",
-          f" {relative_uri}; ",
-          str(Colors.RESET),
-          f"{Colors.BRIGHT_BLACK}{os.path.basename(_f_caller[0].filename)}{Colors.RESET}: ",
-          f"{Colors.BRIGHT_BLACK}->{Colors.RESET}".join([f"{f.function}:{f.lineno}" for f in _f_caller])
-        ]
-        Console.print_debug("".join(_chunks))
+    _t_request = time.monotonic()
+    with span("request", "api", method=req_type.value, endpoint=endpoint.value, uri=relative_uri) as _span:
+      if tracer.enabled:
+        _caller = sys._getframe(1)
+        _span.set(caller=f"{_caller.f_code.co_name}:{_caller.f_lineno}")
+
+      try:
+        r = curl(url, req_type=req_type, params=params, headers=headers, data=data, retry=self.retry_policy)
+        _span.set(code=r.code)
+        self.__notify_request_observers(r.code, time.monotonic() - _t_request, r.headers.get("Retry-After"))
+      except TimeoutError as e:
+        self.__notify_request_observers(ConcurrencyController.TIMEOUT_CODE, time.monotonic() - _t_request)
+        self.__last_errors.append(f"Timeout exception on API request: {e}" if str(e) else "Timeout exception on API request")
+        return
+      finally:
+        if self.__debug:
+          self.__print_request_debug(req_type, endpoint, relative_uri, _t_start)
 
     if r.code not in [200, 201, 202, 204]:
       # if not data:
@@ -429,15 +548,15 @@ class OpenStack(object):
       "limit": "1000"
     }
 
-    images = DiskImages(
-      serialized_obj=self._request(
-        EndpointTypes.image,
-        "/images",
-        is_json=True,
-        page_collection_name="images",
-        params=params
-      )
-    ).images
+    images_raw = self._request(
+      EndpointTypes.image,
+      "/images",
+      is_json=True,
+      page_collection_name="images",
+      params=params
+    )
+    with span("decode", "decode", object=DiskImages.__name__):
+      images = DiskImages(serialized_obj=images_raw).images
 
     _cached_images = {}
     _cached = {}
@@ -513,21 +632,63 @@ class OpenStack(object):
 
     return None
 
-  @property
-  def quotas(self) -> OpenStackQuotas:
-    limits_obj = ComputeLimits(self._request(EndpointTypes.compute, "/limits")).limits.absolute
+  def __get_compute_limits(self):
+    return ComputeLimits(self._request(EndpointTypes.compute, "/limits")).limits.absolute
 
-    network_obj = NetworkLimits(serialized_obj=self._request(
+  def __get_network_limits(self):
+    return NetworkLimits(serialized_obj=self._request(
       EndpointTypes.network,
       f"/quotas/{self.__endpoints.project_id}/details.json",
       is_json=True
     )).quota
-    # volume = VolumeV3Limits(
-    #   serialized_obj=self.__request(
-    #     EndpointTypes.volumev3,
-    #     f"/os-quota-sets/{self.__endpoints.project_id}", params={"usage": "True"}, is_json=True
-    #   )
-    # )
+
+  def __get_volume_limits(self):
+    if not self.__endpoints.get_endpoint(EndpointTypes.volumev3):  # block storage is not provided by the cloud
+      return None
+
+    try:
+      return VolumeV3Limits(serialized_obj=self._request(
+        EndpointTypes.volumev3,
+        f"/os-quota-sets/{self.__endpoints.project_id}",
+        params={"usage": "True"},
+        is_json=True
+      )).quota_set
+    except ValueError:
+      return None
+
+  def __invalidate_quotas(self):
+    # called per created or removed server, concurrently, one storage write per batch is enough
+    with self.__quotas_lock:
+      if not self.__quotas_invalidated:
+        self._conf.cache.invalidate_property(OpenStackQuotas.__name__)
+        self.__quotas_invalidated = True
+
+  def __record_quotas(self, quotas: OpenStackQuotas):
+    values: Dict[str, float] = {}
+    for item in quotas:
+      values[item.type.name] = item.used
+      values[f"{item.type.name}.max"] = item.max_count
+
+    try:
+      self._conf.quota_history.append(values)
+    except Exception as e:  # history is optional, it should never break the command
+      print(f"Warning: unable to record quota history: {e}", file=sys.stderr)
+
+  @property
+  def quotas(self) -> OpenStackQuotas:
+    if self._conf.cache.exists(OpenStackQuotas):
+      return OpenStackQuotas.deserialize(self._conf.cache.get(OpenStackQuotas))
+
+    if not self.__is_auth and not self.login():
+      raise RuntimeError("Not Authorised")
+
+    # services are independent, so the total latency is the latency of the slowest one
+    executor = shared_executor()
+    f_limits = executor.submit(self.__get_compute_limits)
+    f_network = executor.submit(self.__get_network_limits)
+    f_volume = executor.submit(self.__get_volume_limits)
+    limits_obj, network_obj, volume_obj = f_limits.result(), f_network.result(), f_volume.result()
+
     quotas = OpenStackQuotas()
     quotas.add(OpenStackQuotaType.CPU_CORES, limits_obj.maxTotalCores, limits_obj.totalCoresUsed)
     quotas.add(OpenStackQuotaType.RAM_GB, limits_obj.maxTotalRAMSize / 1024, limits_obj.totalRAMUsed / 1024)
@@ -536,6 +697,14 @@ class OpenStack(object):
     quotas.add(OpenStackQuotaType.KEYPAIRS, limits_obj.maxTotalKeypairs, 0)
     quotas.add(OpenStackQuotaType.SERVER_GROUPS, limits_obj.maxServerGroups, limits_obj.totalServerGroupsUsed)
     quotas.add(OpenStackQuotaType.RAM_MB, limits_obj.maxTotalRAMSize, limits_obj.totalRAMUsed)
+    if volume_obj and volume_obj.volumes and volume_obj.gigabytes:
+      quotas.add(OpenStackQuotaType.VOLUMES, volume_obj.volumes.limit, volume_obj.volumes.in_use)
+      quotas.add(OpenStackQuotaType.VOLUME_GB, volume_obj.gigabytes.limit, volume_obj.gigabytes.in_use)
+
+    self._conf.cache.set(OpenStackQuotas, quotas.serialize())
+    self.__record_quotas(quotas)
+    with self.__quotas_lock:
+      self.__quotas_invalidated = False
 
     return quotas
 
@@ -557,10 +726,11 @@ class OpenStack(object):
 
     __flavors_cache = {}
     _cache = {}
-    for flavor in ComputeFlavors(serialized_obj=flavors_raw).flavors:
-      _flavor = OSFlavor.get(flavor)
-      self.__flavors_cache[_flavor.id] = _flavor
-      _cache[_flavor.id] = _flavor.serialize()
+    with span("decode", "decode", object=ComputeFlavors.__name__):
+      for flavor in ComputeFlavors(serialized_obj=flavors_raw).flavors:
+        _flavor = OSFlavor.get(flavor)
+        self.__flavors_cache[_flavor.id] = _flavor
+        _cache[_flavor.id] = _flavor.serialize()
 
     self._conf.cache.set(OSFlavor, _cache)
 
@@ -617,13 +787,47 @@ class OpenStack(object):
       params=params,
       page_collection_name="servers"
     )
-    servers = ComputeServers(serialized_obj=servers_raw).servers
-    obj = OpenStackVM(servers, self.__cache_images, self.__flavors_cache, self.__networks_cache, self.__users_cache)
+    with span("decode", "decode", object=ComputeServers.__name__):
+      servers = ComputeServers(serialized_obj=servers_raw).servers
+      obj = OpenStackVM(servers, self.__cache_images, self.__flavors_cache, self.__networks_cache, self.__users_cache)
     if arguments:  # do no cache custom requests
       return obj
     else:
       return self.__set_local_cache(LocalCacheType.SERVERS, obj)
 
+  def watch_servers(self, interval: float) -> Iterable[OpenStackVM]:
+    """
+    Yields actual servers inventory every `interval` seconds. Only the first request fetches full list,
+    the following are asking only for servers changed since the previous one
+    """
+    servers: OpenStackVM = self.get_servers(invalidate_cache=True)
+    since = self.__changes_since(servers.items)
+
+    while True:
+      yield servers
+      time.sleep(interval)
+
+      changes = self.get_servers(arguments={"changes-since": since}).items
+      for server in changes:
+        if server.status in (ServerState.deleted, ServerState.soft_deleted):
+          servers.remove(server.id)
+        else:
+          servers.update(server)
+
+      since = self.__changes_since(changes, since)
+
+  @staticmethod
+  def __changes_since(servers: Iterable[OpenStackVMInfo], since: str = None) -> str:
+    # server time is used as reference point, as local clock could drift from the cloud one
+    updated = [s.updated for s in servers if s.updated]
+    if updated:
+      return max(updated).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    if since:
+      return since
+
+    return datetime.utcfromtimestamp(time.time() - 60).strftime("%Y-%m-%dT%H:%M:%SZ")
+
   def get_server_by_id(self, _id: str or OpenStackVMInfo) -> OpenStackVMInfo:
     if isinstance(_id, OpenStackVMInfo):
       _id = _id.id
@@ -651,21 +855,24 @@ class OpenStack(object):
     params = {
       "limit": "1000"
     }
-    networks = Networks(serialized_obj=self._request(
+    networks_raw = self._request(
       EndpointTypes.network,
       "/networks",
       is_json=True,
       params=params,
       page_collection_name="networks"
-    )).networks
-    subnets = Subnets(serialized_obj=self._request(
+    )
+    subnets_raw = self._request(
       EndpointTypes.network,
       "/subnets",
       is_json=True,
       params=params,
       page_collection_name="subnets"
-    )).subnets
-    self.__networks_cache = OSNetwork().parse(networks, subnets)
+    )
+    with span("decode", "decode", object=OSNetwork.__name__):
+      networks = Networks(serialized_obj=networks_raw).networks
+      subnets = Subnets(serialized_obj=subnets_raw).subnets
+      self.__networks_cache = OSNetwork().parse(networks, subnets)
     self._conf.cache.set(OSNetwork, self.__networks_cache.serialize())
     return self.__networks_cache
 
@@ -675,17 +882,19 @@ class OpenStack(object):
                             filter_func: Callable[[OpenStackVMInfo], bool] = None,
                             no_cache: bool = False,
                             only_owned: bool = False,
+                            servers: Iterable[OpenStackVMInfo] = None
                             ) -> Dict[str, List[OpenStackVMInfo]]:
     """
     :param search_pattern: vm search pattern list
     :param sort: sort resulting list
     :param no_cache: force real server query, do not try to use cache
     :param filter_func: if return true - item would be filtered, false not
+    :param servers: group given servers list instead of querying it
     """
     _servers: Dict[str, List[OpenStackVMInfo]] = {}
     user_id = self._conf.user_id
     # if no cached queries available, execute limited query
-    if no_cache or self.__get_local_cache(LocalCacheType.SERVERS) is None:
+    if servers is None and (no_cache or self.__get_local_cache(LocalCacheType.SERVERS) is None):
       servers = self.get_servers(arguments={
         "name": f"^{search_pattern}.*"
       }).items
@@ -702,7 +911,7 @@ class OpenStack(object):
 
         _servers[server.cluster_name].append(server)
     else:  # if we already requested the full list, no need for another call
-      for server in self.servers:
+      for server in self.servers if servers is None else servers:
         _sname = server.cluster_name.lower()[:len(search_pattern)]
         if search_pattern and search_pattern.lower() != _sname:
           continue
@@ -729,23 +938,19 @@ class OpenStack(object):
                              grep_by: str = None,
                              last_lines: int = 0
                              ) -> List[str]:
+    """
+    :param last_lines: amount of the last lines to request, 0 - whole log
+    """
     if isinstance(server_id, OpenStackVMInfo):
       server_id = server_id.id
 
-    params = None
-    if last_lines:
-      params = {
-        "length": last_lines
-      }
-
     r = self._request(
       EndpointTypes.compute,
       f"/servers/{server_id}/action",
       req_type=CurlRequestType.POST,
-      params=params,
       data={
         "os-getConsoleOutput": {
-          "length": None
+          "length": last_lines if last_lines else None
         }
       },
       is_json=True
@@ -781,6 +986,8 @@ class OpenStack(object):
         f"/servers/{server_id}",
         req_type=CurlRequestType.DELETE
       )
+      if r is not None:
+        self.__invalidate_quotas()
       return r is not None
     except ValueError as e:
       return False
@@ -931,9 +1138,7 @@ echo "@users@: ${{USERS}}"
     if len(cluster_names) > 1:  # we can create eighter bulk of cluster with one request or with different request
       count: int = 1
 
-    created_servers: List[OpenStackVMInfo] = []
-
-    for cluster_name in cluster_names:
+    def __create(cluster_name: str) -> VMCreateResponse or None:
       builder = VMCreateBuilder(cluster_name) \
         .set_admin_pass(password) \
         .set_image(image.base_image) \
@@ -946,7 +1151,6 @@ echo "@users@: ${{USERS}}"
       if ssh_key:
         builder.set_key_name(ssh_key.name)
 
-      r = None
       try:
         r = self._request(
           EndpointTypes.compute,
@@ -957,12 +1161,26 @@ echo "@users@: ${{USERS}}"
         )
       except ValueError as e:
         self.__last_errors.append(str(e))
-        return []
+        return None
 
-      if (response := VMCreateResponse(serialized_obj=r)) and response.reservation_id:
-        servers = self.get_servers({"reservation_id": response.reservation_id})
-        created_servers.extend(list(servers.items))
-      else:
-        created_servers.append(self.get_server_by_id(response.server.id))
+      return VMCreateResponse(serialized_obj=r) if r is not None else None
+
+    # requests are independent, so they are sent at the same time
+    responses = [r for r in shared_executor().map(__create, cluster_names) if r]
+    if responses:
+      self.__invalidate_quotas()
+
+    return self.__get_created_servers(responses)
+
+  def __get_created_servers(self, responses: List[VMCreateResponse]) -> List[OpenStackVMInfo]:
+    """
+    Resolve servers created by the create requests. Bulk request is resolved by its reservation id, so servers
+    with the same names, created earlier or at the same time by someone else, are not picked up
+    """
+    def __lookup(response: VMCreateResponse) -> List[OpenStackVMInfo]:
+      if response.reservation_id:
+        return list(self.get_servers({"reservation_id": response.reservation_id}).items)
+
+      return [self.get_server_by_id(response.server.id)]
 
-    return created_servers
+    return [server for servers in shared_executor().map(__lookup, responses) for server in servers]
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Callable, List, Optional
+
+from openstack_cli.modules.openstack import OpenStack
+from openstack_cli.modules.openstack.objects import OpenStackVMInfo
+
+
+class ConsoleLogTailer(object):
+  """
+  Reads only new lines of the server console log.
+
+  os-getConsoleOutput could return only the last N lines of the log, so the tailer remembers last seen lines (anchor)
+  and requests a small window of the log, doubling it till the window overlaps with the anchor
+  """
+  __anchor_size = 5
+
+  def __init__(self, ostack: OpenStack, server: OpenStackVMInfo, lines: int = 0, window: int = 50,
+               max_window: int = 3200):
+    """
+    :arg lines amount of already existing lines to return on the first poll, 0 - whole log
+    :arg window initial amount of lines to request on each poll
+    :arg max_window max amount of lines to request, if anchor is not found - the whole log would be requested
+    """
+    self.__ostack = ostack
+    self.__server = server
+    self.__initial_lines = lines
+    self.__window = window
+    self.__max_window = max_window
+    self.__anchor: Optional[List[str]] = None
+    self.__pending: str = ""
+
+  @property
+  def server(self) -> OpenStackVMInfo:
+    return self.__server
+
+  @property
+  def pending(self) -> str:
+    """
+    Incomplete last line of the log at the last poll, like the login prompt. Empty if the log ends with new line
+    """
+    return self.__pending
+
+  def __fetch(self, length: int) -> List[str]:
+    lines = self.__ostack.get_server_console_log(self.__server, last_lines=length)
+    # last line is incomplete (or empty if log ends with new line), hold it till the next poll
+    self.__pending = lines[-1] if lines else ""
+    return lines[:-1]
+
+  def __find_anchor(self, lines: List[str]) -> int:
+    """
+    :return position of the first line after the anchor or -1
+    """
+    size = len(self.__anchor)
+    for i in range(len(lines) - size, -1, -1):
+      if lines[i:i + size] == self.__anchor:
+        return i + size
+
+    return -1
+
+  def __set_anchor(self, lines: List[str]):
+    if lines:
+      self.__anchor = (self.__anchor + lines)[-self.__anchor_size:] if self.__anchor else lines[-self.__anchor_size:]
+    elif self.__anchor is None:
+      self.__anchor = []
+
+  def poll(self) -> List[str]:
+    """
+    :return complete lines appeared since the previous poll
+    """
+    if self.__anchor is None:  # first poll
+      lines = self.__fetch(self.__initial_lines + 1 if self.__initial_lines else 0)
+      self.__set_anchor(lines)
+      return lines
+
+    if not self.__anchor:  # log was empty, nothing to anchor to
+      new_lines = self.__fetch(0)
+      self.__set_anchor(new_lines)
+      return new_lines
+
+    window = self.__window
+    while True:
+      lines = self.__fetch(window + 1)
+      pos = self.__find_anchor(lines)
+      if pos >= 0:
+        new_lines = lines[pos:]
+        break
+
+      if len(lines) < window or window >= self.__max_window:  # the whole log received, or log was rotated
+        if window >= self.__max_window:
+          lines = self.__fetch(0)
+          pos = self.__find_anchor(lines)
+        new_lines = lines[pos:] if pos >= 0 else lines
+        break
+
+      window *= 2
+
+    self.__set_anchor(new_lines)
+    return new_lines
+
+  def wait_for(self, predicate: Callable[[str], bool], interval: float = 2, timeout: float = 400) -> Optional[str]:
+    """
+    Poll the log till the line matching the predicate appears, the incomplete last line is checked as well
+
+    :return matched line or None if timeout is reached
+    """
+    deadline = time.time() + timeout
+    while True:
+      for line in self.poll():
+        if predicate(line):
+          return line
+
+      if self.__pending and predicate(self.__pending):  # prompts are not followed by new line
+        return self.__pending
+
+      if time.time() + interval > deadline:
+        return None
+
+      time.sleep(interval)
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import base64
+import json
 import re
 from calendar import timegm
 from datetime import datetime
@@ -69,15 +70,25 @@ class ServerState(Enum):
   build = "BUILD"
   deleted = "DELETED"
   error = "ERROR"
+  hard_reboot = "HARD_REBOOT"
+  migrating = "MIGRATING"
+  password = "PASSWORD"
   paused = "PAUSED"
+  reboot = "REBOOT"
+  rebuild = "REBUILD"
+  rescue = "RESCUE"
   rescued = "RESCUED"
+  resize = "RESIZE"
   resized = "RESIZED"
+  revert_resize = "REVERT_RESIZE"
   shelved = "SHELVED"
   shelved_offloaded = "SHELVED_OFFLOADED"
   soft_deleted = "SOFT_DELETED"
   stopped = "STOPPED"
   suspended = "SUSPENDED"
   shutoff = "SHUTOFF"
+  unknown = "UNKNOWN"
+  verify_resize = "VERIFY_RESIZE"
 
   @classmethod
   def from_str(cls, state: str = "ERROR"):
@@ -284,6 +295,8 @@ class OpenStackQuotaType(Enum):
   KEYPAIRS = "KEYPAIRS"
   SERVER_GROUPS = "SERVER_GROUPS"
   RAM_MB = "RAM_MB"
+  VOLUMES = "VOLUMES"
+  VOLUME_GB = "VOLUME_GB"
 
 
 class OpenStackQuotaItem(object):
@@ -334,6 +347,33 @@ class OpenStackQuotas(object):
 
     return None
 
+  def exceeded(self, requested: Dict[OpenStackQuotaType, Union[int, float]]) -> List[OpenStackQuotaItem]:
+    """
+    :arg requested amount of resources to be additionally consumed
+    :return quotas which would be exceeded, unlimited and unknown quotas are skipped
+    """
+    result: List[OpenStackQuotaItem] = []
+    for _t, amount in requested.items():
+      if _t not in self.__metrics:
+        continue
+
+      item = OpenStackQuotaItem(_t, *self.__metrics[_t])
+      if item.max_count >= 0 and item.available < amount:
+        result.append(item)
+
+    return result
+
+  def serialize(self) -> str:
+    return json.dumps({k.value: list(v) for k, v in self.__metrics.items()})
+
+  @classmethod
+  def deserialize(cls, raw: str) -> "OpenStackQuotas":
+    quotas = cls()
+    for k, v in json.loads(raw).items():
+      quotas.add(OpenStackQuotaType(k), *v)
+
+    return quotas
+
   def __iter__(self):
     self.__n = 0
     self.__keys = list(self.__metrics.keys())
@@ -567,6 +607,9 @@ class VMCreateBuilder(object):
 
 
 class OpenStackVM(object):
+  """
+  Server inventory with per-user and per-cluster usage rollups, kept up to date on each inventory change
+  """
   __CLUSTER_NAME__ = re.compile("(?P<name>.*)-\\d+$", flags=re.IGNORECASE | re.MULTILINE)
 
   def __init__(self,
@@ -578,65 +621,141 @@ class OpenStackVM(object):
                ):
     self.__max_host_name_len = 0
     self.__max_domain_name_len = 0
-    self.__items = []
+    self.__items: Dict[str, OpenStackVMInfo] = {}
+    self.__user_stats: Dict[str, Dict[Union[str, OpenStackQuotaType], Union[int, Dict[str, int]]]] = {}
+    self.__cluster_states: Dict[str, Dict[ServerPowerState, int]] = {}
     self.__n = 0
+    self.__images = images
+    self.__flavors = flavors
+    self.__users = users
     # ToDo: do not hardcode net
-    net: OSNetworkItem = [n for n in networks.items if n.name == "INTERNAL_NET"][0]
+    self.__net: OSNetworkItem = [n for n in networks.items if n.name == "INTERNAL_NET"][0]
 
-    if net and net.domain_name:
-      self.__max_domain_name_len = len(net.domain_name)
+    if self.__net and self.__net.domain_name:
+      self.__max_domain_name_len = len(self.__net.domain_name)
 
     for server in servers:
-      vm = OpenStackVMInfo()
-
-      if self.__max_host_name_len < len(server.name):
-        self.__max_host_name_len = len(server.name)
-
-      vm._net = net
-      vm._original = server
-      vm.name = server.name
-      vm.id = server.id
-      vm.status = ServerState.from_str(server.status)
-      try:
-        vm.created = datetime.utcfromtimestamp(timegm(strptime(server.created, "%Y-%m-%dT%H:%M:%SZ")))
-      except ValueError:
-        vm.created = None
+      self.add(self.__to_vm(server))
+
+  def __to_vm(self, server: ComputeServerInfo) -> OpenStackVMInfo:
+    vm = OpenStackVMInfo()
+
+    vm._net = self.__net
+    vm._original = server
+    vm.name = server.name
+    vm.id = server.id
+    vm.status = ServerState.from_str(server.status)
+    try:
+      vm.created = datetime.utcfromtimestamp(timegm(strptime(server.created, "%Y-%m-%dT%H:%M:%SZ")))
+    except ValueError:
+      vm.created = None
+    try:
+      vm.updated = datetime.utcfromtimestamp(timegm(strptime(server.updated, "%Y-%m-%dT%H:%M:%SZ")))
+    except ValueError:
+      vm.updated = None
+
+    if server.addresses.keys():
+      vm.net_name = list(server.addresses.keys())[0]
+      vm.ip_address = server.addresses[vm.net_name][0].addr if server.addresses[vm.net_name] else "0.0.0.0"
+    else:
+      vm.net_name = "NOT SET"
+      vm.ip_address = "0.0.0.0"
+
+    vm.owner_id = server.user_id
+    vm.image_id = server.image.id
+    vm.image = self.__images[vm.image_id] if vm.image_id in self.__images else DiskImageInfo()
+    vm.key_name = server.key_name
+    vm.state = ServerPowerState.from_int(server.OS_EXT_STS_power_state)
+    matches = re.match(self.__CLUSTER_NAME__, vm.name)
+    if not matches:
+      vm.cluster_name = vm.name
+    else:
       try:
-        vm.updated = datetime.utcfromtimestamp(timegm(strptime(server.updated, "%Y-%m-%dT%H:%M:%SZ")))
-      except ValueError:
-        vm.updated = None
-
-      if server.addresses.keys():
-        vm.net_name = list(server.addresses.keys())[0]
-        vm.ip_address = server.addresses[vm.net_name][0].addr if server.addresses[vm.net_name] else "0.0.0.0"
-      else:
-        vm.net_name = "NOT SET"
-        vm.ip_address = "0.0.0.0"
-
-      vm.owner_id = server.user_id
-      vm.image_id = server.image.id
-      vm.image = images[vm.image_id] if vm.image_id in images else DiskImageInfo()
-      vm.key_name = server.key_name
-      vm.state = ServerPowerState.from_int(server.OS_EXT_STS_power_state)
-      matches = re.match(self.__CLUSTER_NAME__, vm.name)
-      if not matches:
+        vm.cluster_name = matches.group("name")
+      except IndexError:
         vm.cluster_name = vm.name
-      else:
-        try:
-          vm.cluster_name = matches.group("name")
-        except IndexError:
-          vm.cluster_name = vm.name
-      if server.flavor and server.flavor.id in flavors:
-        vm._flavor = flavors[server.flavor.id]
+    if server.flavor and server.flavor.id in self.__flavors:
+      vm._flavor = self.__flavors[server.flavor.id]
+
+    return vm
+
+  def __account(self, vm: OpenStackVMInfo, sign: int):
+    """
+    Add (sign=1) or subtract (sign=-1) server resources to the rollups
+    """
+    record = self.__user_stats.get(vm.owner_id)
+    if record is None:
+      record = self.__user_stats[vm.owner_id] = {
+        "clusters": {},
+        OpenStackQuotaType.CPU_CORES: 0,
+        OpenStackQuotaType.RAM_MB: 0,
+        OpenStackQuotaType.INSTANCES: 0
+      }
+
+    if vm.flavor:
+      record[OpenStackQuotaType.CPU_CORES] += sign * vm.flavor.vcpus
+      record[OpenStackQuotaType.RAM_MB] += sign * vm.flavor.raw.ram
+    record[OpenStackQuotaType.INSTANCES] += sign
+
+    clusters: Dict[str, int] = record["clusters"]
+    clusters[vm.cluster_name] = clusters.get(vm.cluster_name, 0) + sign
+    if not clusters[vm.cluster_name]:
+      del clusters[vm.cluster_name]
+
+    if not record[OpenStackQuotaType.INSTANCES]:
+      del self.__user_stats[vm.owner_id]
+
+    states = self.__cluster_states.setdefault(vm.cluster_name, {})
+    states[vm.state] = states.get(vm.state, 0) + sign
+    if not states[vm.state]:
+      del states[vm.state]
+    if not states:
+      del self.__cluster_states[vm.cluster_name]
+
+  def add(self, vm: OpenStackVMInfo):
+    """
+    Add server to the inventory, server with the same id would be replaced
+    """
+    if vm.id in self.__items:
+      self.remove(vm.id)
+
+    if self.__max_host_name_len < len(vm.name):
+      self.__max_host_name_len = len(vm.name)
+
+    self.__items[vm.id] = vm
+    self.__account(vm, 1)
 
-      self.__items.append(vm)
+    if self.__users:
+      self.__users.update_from_server(vm)
 
-      if users:
-        users.update_from_server(vm)
+  def update(self, vm: OpenStackVMInfo):
+    self.add(vm)
+
+  def remove(self, server_id: str) -> Optional[OpenStackVMInfo]:
+    vm = self.__items.pop(server_id, None)
+    if vm:
+      self.__account(vm, -1)
+
+    return vm
 
   @property
   def items(self) -> List[OpenStackVMInfo]:
-    return list(self.__items)
+    return list(self.__items.values())
+
+  @property
+  def user_stats(self) -> Dict[str, Dict[Union[str, OpenStackQuotaType], Union[int, Dict[str, int]]]]:
+    """
+    Per-user resources consumption:
+      {user id: {CPU_CORES: int, RAM_MB: int, INSTANCES: int, "clusters": {cluster name: amount of nodes}}}
+    """
+    return self.__user_stats
+
+  @property
+  def cluster_states(self) -> Dict[str, Dict[ServerPowerState, int]]:
+    """
+    Amount of cluster nodes per power state: {cluster name: {state: amount}}
+    """
+    return self.__cluster_states
 
   @property
   def max_host_len(self):
@@ -648,11 +767,12 @@ class OpenStackVM(object):
 
   def __iter__(self):
     self.__n = 0
+    self.__values = list(self.__items.values())
     return self
 
   def __next__(self) -> OpenStackVMInfo:
-    if self.__n < len(self.__items):
-      result = self.__items[self.__n]
+    if self.__n < len(self.__values):
+      result = self.__values[self.__n]
       self.__n += 1
       return result
     else:
@@ -660,7 +780,7 @@ class OpenStackVM(object):
 
   def __str__(self):
     s = []
-    for vm in self.__items:
+    for vm in self.__items.values():
       s.append(f"Cluster: {vm.cluster_name}, vm name: {vm.name},"
                f" image: {vm.image.name}, ip: {vm.ip_address}, status: {vm.status}")
 
@@ -0,0 +1,176 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List
+
+from openstack_cli.modules.openstack import JSONValueError, OpenStack
+from openstack_cli.modules.openstack.objects import OpenStackVMInfo, ServerPowerState, ServerState
+
+SERVER_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class ServerStatusWaiter(object):
+  """
+  Waits for the group of servers to reach the target state.
+
+  Each tick issues a single list request, filtered by reservation id or by the servers changed since the previous
+  tick, so the API load does not depend on the amount of tracked servers. Poll interval grows while nothing
+  changes and falls back to the minimal one on any change.
+  """
+
+  def __init__(self,
+               ostack: OpenStack,
+               servers: Iterable[OpenStackVMInfo],
+               target: Callable[[OpenStackVMInfo], bool],
+               failed: Callable[[OpenStackVMInfo], bool] = None,
+               reservation_id: str = None,
+               interval: float = 1,
+               max_interval: float = 10,
+               backoff: float = 1.5,
+               timeout: float = 1800):
+    """
+    :arg target predicate telling that the server reached desired state
+    :arg failed predicate telling that the server would never reach desired state
+    :arg reservation_id filter servers by reservation id (servers created by one request), otherwise
+                        only servers changed since the previous tick are requested
+    :arg timeout max time to wait in seconds, servers not reached the target state would be reported as failed
+    """
+    self.__ostack = ostack
+    self.__servers: Dict[str, OpenStackVMInfo] = {s.id: s for s in servers}
+    self.__pending: Dict[str, OpenStackVMInfo] = dict(self.__servers)
+    self.__target = target
+    self.__failed = failed if failed else lambda x: x.status == ServerState.error
+    self.__reservation_id = reservation_id
+    self.__interval = interval
+    self.__min_interval = interval
+    self.__max_interval = max_interval
+    self.__backoff = backoff
+    self.__timeout = timeout
+    self.__since: str = self.__changes_since(self.__servers.values())
+
+  @classmethod
+  def __changes_since(cls, servers: Iterable[OpenStackVMInfo], since: str = None) -> str:
+    # server time is used as reference point, as local clock could drift from the cloud one
+    updated = [s.updated.strftime(SERVER_TIME_FORMAT) for s in servers if s.updated]
+    if since:
+      updated.append(since)
+
+    if updated:
+      return max(updated)
+
+    return datetime.utcfromtimestamp(time.time() - 60).strftime(SERVER_TIME_FORMAT)
+
+  @property
+  def total(self) -> int:
+    return len(self.__servers)
+
+  @property
+  def pending(self) -> List[OpenStackVMInfo]:
+    return list(self.__pending.values())
+
+  def __request(self) -> List[OpenStackVMInfo]:
+    if self.__reservation_id:
+      arguments = {"reservation_id": self.__reservation_id}
+    else:
+      arguments = {"changes-since": self.__since}
+
+    try:
+      servers = self.__ostack.get_servers(arguments=arguments).items
+    except (JSONValueError, TimeoutError):  # temporary API issue, would retry on the next tick
+      return []
+
+    if not self.__reservation_id:
+      self.__since = self.__changes_since(servers, self.__since)
+
+    return [s for s in servers if s.id in self.__pending]
+
+  def poll(self) -> List[OpenStackVMInfo]:
+    """
+    Single tick: refresh state of the pending servers
+
+    :return servers reached the final state
+    """
+    done: List[OpenStackVMInfo] = []
+    is_changed: bool = False
+    for server in self.__request():
+      prev = self.__pending[server.id]
+      if prev.status != server.status or prev.state != server.state:
+        is_changed = True
+
+      self.__servers[server.id] = self.__pending[server.id] = server
+      if self.__target(server) or self.__failed(server):
+        del self.__pending[server.id]
+        done.append(server)
+
+    self.__interval = self.__min_interval if is_changed else min(self.__interval * self.__backoff, self.__max_interval)
+    return done
+
+  def wait(self, on_done: Callable[[OpenStackVMInfo, bool], None] = None,
+           on_tick: Callable[[], None] = None) -> bool:
+    """
+    Block till all servers reach the final state
+
+    :arg on_done called for each server reached the final state, with flag is the target state was reached
+    :arg on_tick called on each tick, allows to refresh progress while waiting
+    :return True if all servers reached the target state
+    """
+    is_ok: bool = True
+
+    def _done(_server: OpenStackVMInfo, _ok: bool):
+      nonlocal is_ok
+      is_ok = is_ok and _ok
+      if on_done:
+        on_done(_server, _ok)
+
+    # servers could be already in the desired state
+    for server in list(self.__pending.values()):
+      if self.__target(server):
+        del self.__pending[server.id]
+        _done(server, True)
+
+    deadline = time.time() + self.__timeout
+    while self.__pending and time.time() < deadline:
+      next_tick = time.time() + self.__interval
+      while time.time() < next_tick:
+        if on_tick:
+          on_tick()
+        time.sleep(min(0.5, max(next_tick - time.time(), 0)))
+
+      for server in self.poll():
+        _done(server, self.__target(server))
+
+    for server in list(self.__pending.values()):  # timeout
+      del self.__pending[server.id]
+      _done(server, False)
+
+    return is_ok
+
+
+def is_active(server: OpenStackVMInfo) -> bool:
+  return server.status == ServerState.active and server.state == ServerPowerState.running
+
+
+def is_stopped(server: OpenStackVMInfo) -> bool:
+  return server.status in (ServerState.shutoff, ServerState.stopped)
+
+
+def is_deleted(server: OpenStackVMInfo) -> bool:
+  return server.status in (ServerState.deleted, ServerState.soft_deleted)
+
+
+def is_build_failed(server: OpenStackVMInfo) -> bool:
+  return server.status not in (ServerState.building, ServerState.build, ServerState.active)
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -48,6 +49,59 @@ class ValueHolder(object):
     return self.__values[n]
 
 
+def watch_interval(value: str, default: float = 5) -> float:
+  """
+  Converts value of the "watch" argument: empty value means default interval, 0 - watch is disabled
+  """
+  if value == "":
+    return default
+
+  try:
+    interval = float(value)
+  except ValueError:
+    raise ValueError(f"watch argument expects interval in seconds, got '{value}'")
+
+  return max(interval, 1) if interval > 0 else 0
+
+
+_DURATION_UNITS = {"m": 60, "h": 3600, "d": 24 * 3600, "w": 7 * 24 * 3600}
+
+
+def parse_duration(value: str) -> float:
+  """
+  Converts duration like "90m", "12h", "30d" or "2w" to seconds, value without unit is treated as days
+  """
+  value = value.strip().lower()
+  unit = value[-1:] if value[-1:] in _DURATION_UNITS else "d"
+  amount = value[:-1] if value[-1:] in _DURATION_UNITS else value
+
+  try:
+    seconds = float(amount) * _DURATION_UNITS[unit]
+  except ValueError:
+    raise ValueError(f"duration expected in format like 30d, 12h, 2w or 90m, got '{value}'")
+
+  if seconds <= 0:
+    raise ValueError(f"duration should be positive, got '{value}'")
+
+  return seconds
+
+
+def format_age(timestamp: float) -> str:
+  """
+  Human readable time passed since the timestamp, like "5m 10s", "3h 20m" or "2 day(s)"
+  """
+  if not timestamp:
+    return "-"
+
+  d = int(time.time() - timestamp)
+  if d < 3600:
+    return f"{d // 60}m {d % 60}s"
+  if d < 86400:
+    return f"{d // 3600}h {(d % 3600) // 60}m"
+
+  return f"{d // 86400} day(s)"
+
+
 def cluster_selector(ostack: OpenStack, name: str, own: bool = False) -> List[OpenStackVMInfo]:
   pass
 
@@ -0,0 +1,96 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Compare two benchmark reports (micro.py or e2e.py output) and fail if any benchmark got slower than the threshold:
+
+  python tests/benchmarks/compare.py baseline.json current.json --threshold 10
+
+"""
+
+import json
+import sys
+from typing import Dict, List, Tuple
+
+
+def report_timings(report: dict) -> Dict[str, float]:
+  """
+  :return median time per benchmark name
+  """
+  if "results" in report:  # micro.py
+    return {name: r["median"] for name, r in report["results"].items()}
+
+  if "scenarios" in report:  # e2e.py
+    return {name: r["wall_median"] for name, r in report["scenarios"].items()}
+
+  raise ValueError("Unknown report format")
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[Tuple[str, float or None, float or None, float or None, bool]]:
+  """
+  :arg threshold max allowed slowdown in percents
+  :return (name, baseline time, current time, change in percents, is regression) per benchmark
+  """
+  base, cur = report_timings(baseline), report_timings(current)
+  rows = []
+  for name in list(base.keys()) + [n for n in cur.keys() if n not in base]:
+    if name not in base or name not in cur:
+      rows.append((name, base.get(name), cur.get(name), None, False))
+      continue
+
+    change = (cur[name] - base[name]) / base[name] * 100 if base[name] else 0.0
+    rows.append((name, base[name], cur[name], change, change > threshold))
+
+  return rows
+
+
+def main(args: List[str]) -> int:
+  import argparse
+
+  parser = argparse.ArgumentParser(description="Compare benchmark reports and flag regressions")
+  parser.add_argument("baseline")
+  parser.add_argument("current")
+  parser.add_argument("--threshold", type=float, default=10, help="max allowed slowdown in percents")
+  options = parser.parse_args(args)
+
+  with open(options.baseline, "r") as f:
+    baseline = json.load(f)
+  with open(options.current, "r") as f:
+    current = json.load(f)
+
+  base_env, cur_env = baseline.get("environment", {}), current.get("environment", {})
+  changed = sorted(k for k in set(base_env) | set(cur_env) if base_env.get(k) != cur_env.get(k))
+  if changed:
+    print(f"Warning: reports are collected in the different environments, differs: {', '.join(changed)}\n")
+
+  rows = compare(baseline, current, options.threshold)
+  print(f"{'Benchmark':<40} {'Baseline':>12} {'Current':>12} {'Change':>9}")
+  for name, base, cur, change, is_regression in rows:
+    _base = f"{base * 1000:.3f} ms" if base is not None else "-"
+    _cur = f"{cur * 1000:.3f} ms" if cur is not None else "-"
+    _change = f"{change:+.1f}%" if change is not None else "new" if base is None else "removed"
+    print(f"{name:<40} {_base:>12} {_cur:>12} {_change:>9}{'  REGRESSION' if is_regression else ''}")
+
+  regressions = [row[0] for row in rows if row[4]]
+  if regressions:
+    print(f"\n{len(regressions)} benchmark(s) are slower than the baseline by more than {options.threshold}%: "
+          f"{', '.join(regressions)}")
+    return 1
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
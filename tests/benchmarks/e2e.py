@@ -0,0 +1,243 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+End-to-end benchmark of the application commands against the local fake cloud.
+
+Each command is started as the separate process, exactly like the user does, and measured for wall time, amount
+of API requests, transferred bytes and peak RSS:
+
+  python tests/benchmarks/e2e.py --servers 1000 --latency 0.02 --repeat 5 --output e2e.json
+
+"""
+
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC_DIR = os.path.join(TESTS_DIR, "..", "src")
+APP_VERSION = 1.0
+
+sys.path.insert(0, TESTS_DIR)
+
+from fake_cloud import FakeCloud, configure
+
+
+class Scenario(object):
+  def __init__(self, name: str, args: List[str], stdin: str = "", prepare: Callable[["E2EBench", int], None] = None):
+    """
+    :arg args command line, "{n}" is replaced by the zero padded run number
+    :arg stdin input to be passed to the command, like operation confirmation
+    :arg prepare not measured step executed before each run
+    """
+    self.name = name
+    self.args = args
+    self.stdin = stdin
+    self.prepare = prepare
+
+
+def _reset_cache(bench: "E2EBench", n: int):
+  bench.run_command(["conf", "reset-cache"])
+
+
+def _cold_start(bench: "E2EBench", n: int):
+  _reset_cache(bench, n)
+  bench.run_command(["list"])
+
+
+SCENARIOS: Dict[str, Scenario] = {s.name: s for s in (
+  Scenario("startup_cold", ["list"], prepare=_reset_cache),  # images, flavors, networks and keys are re-synced
+  Scenario("startup_warm", ["list"], prepare=_cold_start),  # the first run after the cold one
+  Scenario("list", ["list"]),
+  Scenario("info", ["info"]),
+  Scenario("quota_graph", ["quota", "--graph"]),
+  Scenario("up", ["up", "up{n}", "3"]),
+  Scenario("destroy", ["destroy", "destroy{n}"], stdin="y\n",
+           prepare=lambda bench, n: bench.run_command(["up", f"destroy{n:03d}", "3"]))
+)}
+
+
+class RunResult(object):
+  def __init__(self, code: int, output: str, wall: float, rss: Optional[int], stats: dict):
+    self.code = code
+    self.output = output
+    self.wall = wall
+    self.rss = rss
+    self.stats = stats
+
+
+class E2EBench(object):
+  """
+  Fake cloud with the configured application data folder, running application commands
+  """
+
+  def __init__(self, servers: int = 1000, images: int = 20, latency: float = 0, error_rate: float = 0,
+               timeout: float = 300):
+    self.__cloud = FakeCloud(servers=servers, images=images, latency=latency, error_rate=error_rate)
+    self.__data_dir: Optional[str] = None
+    self.__timeout = timeout
+
+  @property
+  def cloud(self) -> FakeCloud:
+    return self.__cloud
+
+  def __enter__(self) -> "E2EBench":
+    self.__cloud.start()
+    self.__data_dir = tempfile.mkdtemp(prefix="oscli-e2e-")
+    configure(self.__cloud, self.__data_dir, version=APP_VERSION)
+    self.__cloud.reset_stats()
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.__cloud.stop()
+    shutil.rmtree(self.__data_dir, ignore_errors=True)
+
+  def run_command(self, args: List[str], stdin: str = "", stderr: bool = True) -> RunResult:
+    """
+    :arg stderr include stderr into the output, otherwise it is dropped and only stdout is captured
+    """
+    env = dict(os.environ, XDG_DATA_HOME=self.__data_dir, APP_VERSION=f"v{APP_VERSION}", PYTHONPATH=SRC_DIR)
+    env.pop("API_DEBUG", None)
+
+    self.__cloud.reset_stats()
+    t_start = time.perf_counter()
+    p = subprocess.Popen(
+      [sys.executable, "-m", "openstack_cli", *args],
+      env=env,
+      cwd=self.__data_dir,
+      stdin=subprocess.PIPE,
+      stdout=subprocess.PIPE,
+      stderr=subprocess.STDOUT if stderr else subprocess.DEVNULL
+    )
+    timer = threading.Timer(self.__timeout, p.kill)
+    timer.start()
+    try:
+      p.stdin.write(stdin.encode("utf-8"))
+      p.stdin.close()
+      output = p.stdout.read().decode("utf-8", errors="replace")
+      p.stdout.close()
+      rss: Optional[int] = None
+      if hasattr(os, "wait4"):  # resource usage of the exact child process, ru_maxrss is in KB on linux
+        _, status, usage = os.wait4(p.pid, 0)
+        p.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+      else:
+        p.wait()
+    finally:
+      timer.cancel()
+
+    wall = time.perf_counter() - t_start
+    return RunResult(p.returncode, output, wall, rss, self.__cloud.reset_stats().serialize())
+
+  def run_scenario(self, scenario: Scenario, repeat: int = 3) -> dict:
+    runs: List[RunResult] = []
+    for n in range(repeat):
+      if scenario.prepare:
+        scenario.prepare(self, n)
+
+      result = self.run_command([arg.replace("{n}", f"{n:03d}") for arg in scenario.args], scenario.stdin)
+      if result.code != 0:
+        raise RuntimeError(f"Scenario '{scenario.name}' failed with code {result.code}:\n{result.output}")
+
+      runs.append(result)
+
+    walls = [r.wall for r in runs]
+    return {
+      "runs": len(runs),
+      "wall_median": statistics.median(walls),
+      "wall_min": min(walls),
+      "wall_max": max(walls),
+      "requests": statistics.median([r.stats["requests"] for r in runs]),
+      "bytes_downloaded": statistics.median([r.stats["bytes_sent"] for r in runs]),
+      "bytes_uploaded": statistics.median([r.stats["bytes_received"] for r in runs]),
+      "errors": sum(r.stats["errors"] for r in runs),
+      "peak_rss": max(r.rss for r in runs) if runs[0].rss is not None else None,
+      "by_route": runs[-1].stats["by_route"]
+    }
+
+
+def run(scenarios: List[str] = None, repeat: int = 3, **cloud_args) -> dict:
+  """
+  :arg scenarios names of the scenarios to run, all if not set
+  :arg cloud_args FakeCloud arguments: servers, images, latency, error_rate
+  """
+  scenarios = scenarios if scenarios else list(SCENARIOS.keys())
+  unknown = set(scenarios) - set(SCENARIOS.keys())
+  if unknown:
+    raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+  with E2EBench(**cloud_args) as bench:
+    return {
+      "environment": {
+        "python": sys.version.split(" ")[0],
+        "platform": sys.platform,
+        "repeat": repeat,
+        **cloud_args
+      },
+      "scenarios": {name: bench.run_scenario(SCENARIOS[name], repeat) for name in scenarios}
+    }
+
+
+def print_report(report: dict):
+  def _size(value: Optional[float]) -> str:
+    if value is None:
+      return "n/a"
+    for unit in ("B", "KB", "MB"):
+      if value < 1024:
+        return f"{value:.0f} {unit}"
+      value /= 1024
+    return f"{value:.1f} GB"
+
+  print(f"{'Scenario':<14} {'Wall, ms':>10} {'Min, ms':>10} {'Requests':>9} {'Download':>10} {'Upload':>10} "
+        f"{'Peak RSS':>10} {'Errors':>7}")
+  for name, r in report["scenarios"].items():
+    print(f"{name:<14} {r['wall_median'] * 1000:>10.1f} {r['wall_min'] * 1000:>10.1f} {r['requests']:>9.0f} "
+          f"{_size(r['bytes_downloaded']):>10} {_size(r['bytes_uploaded']):>10} {_size(r['peak_rss']):>10} {r['errors']:>7}")
+
+
+def main(args: List[str]) -> int:
+  import argparse
+
+  parser = argparse.ArgumentParser(description="End-to-end benchmark of the application against the fake cloud")
+  parser.add_argument("--servers", type=int, default=1000)
+  parser.add_argument("--images", type=int, default=20)
+  parser.add_argument("--latency", type=float, default=0, help="delay added to each API response, in seconds")
+  parser.add_argument("--error-rate", type=float, default=0, help="share of the API requests to fail with 503")
+  parser.add_argument("--repeat", type=int, default=3)
+  parser.add_argument("--scenario", action="append", choices=list(SCENARIOS.keys()),
+                      help="scenario to run, could be given several times, all by default")
+  parser.add_argument("--output", help="save the results as json")
+  options = parser.parse_args(args)
+
+  report = run(options.scenario, options.repeat, servers=options.servers, images=options.images,
+               latency=options.latency, error_rate=options.error_rate)
+  print_report(report)
+  if options.output:
+    with open(options.output, "w") as f:
+      json.dump(report, f, indent=2)
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
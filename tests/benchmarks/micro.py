@@ -0,0 +1,199 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Microbenchmarks of the hot internal layers: json2obj, SQLStorage, DataCacheExtension and OpenStackVM.
+
+Payloads are the API responses of the fake cloud. Typical usage is to save the baseline on the main branch and
+compare the working tree against it:
+
+  python tests/benchmarks/micro.py --output baseline.json
+  python tests/benchmarks/micro.py --output current.json
+  python tests/benchmarks/compare.py baseline.json current.json --threshold 10
+
+"""
+
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Callable, Dict, List
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(TESTS_DIR, "..", "src"))
+sys.path.insert(0, TESTS_DIR)
+
+from fake_cloud import FakeCloud
+from openstack_cli.modules.apputils.config import DataCacheExtension, StorageProperty, StoragePropertyType, \
+  StorageType
+from openstack_cli.modules.openstack.api_objects import ComputeFlavors, ComputeServers, DiskImages, Networks, Subnets
+from openstack_cli.modules.openstack.objects import OSFlavor, OSNetwork, OpenStackUsers, OpenStackVM
+
+BATCH_SIZE = 100
+
+
+class MicroBench(object):
+  """
+  Prepared payloads and storage, with the benchmark functions registered by name
+  """
+
+  def __init__(self, servers: int = 1000, images: int = 200):
+    self.__params = {"servers": servers, "images": images}
+    self.__data_dir = tempfile.mkdtemp(prefix="oscli-micro-")
+    self.__old_data_home = os.environ.get("XDG_DATA_HOME")
+    os.environ["XDG_DATA_HOME"] = self.__data_dir
+
+    self.payloads = FakeCloud(servers=servers, images=images).payloads()
+    self.storage = StorageType.SQL.value(app_name="micro-bench", lazy=True)
+    with redirect_stdout(StringIO()):
+      self.storage.create_key(True, "")
+      self.storage.initialize_key()
+
+    self.cache = DataCacheExtension(self.storage, "cache", 3600).namespace("bench")
+    self.servers = ComputeServers(serialized_obj=self.payloads["servers"])
+    self.images = DiskImages(serialized_obj=self.payloads["images"])
+    self.images_dict = {image.id: image for image in self.images.images}
+    self.flavors = {f.id: f for f in map(OSFlavor.get, ComputeFlavors(serialized_obj=self.payloads["flavors"]).flavors)}
+    self.networks = OSNetwork().parse(Networks(serialized_obj=self.payloads["networks"]).networks,
+                                      Subnets(serialized_obj=self.payloads["subnets"]).subnets)
+    self.images_json = json.dumps({k: v.serialize() for k, v in self.images_dict.items()})
+    self.props = [StorageProperty(f"prop{n}", StoragePropertyType.text, f"value{n}" * 10) for n in range(BATCH_SIZE)]
+    self.storage.set_text_property("bench", "existing", "x" * 1024)
+
+  @property
+  def params(self) -> dict:
+    return self.__params
+
+  def close(self):
+    self.storage.connection.close()
+    shutil.rmtree(self.__data_dir, ignore_errors=True)
+    if self.__old_data_home is None:
+      del os.environ["XDG_DATA_HOME"]
+    else:
+      os.environ["XDG_DATA_HOME"] = self.__old_data_home
+
+  def benchmarks(self) -> Dict[str, Callable[[], object]]:
+    servers_raw, images_raw = self.payloads["servers"], self.payloads["images"]
+
+    def _cache_roundtrip(encrypted: bool):
+      self.cache.set("DiskImageInfo", self.images_json, encrypted=encrypted)
+      return self.cache.get("DiskImageInfo")
+
+    def _set_property_loop():
+      for prop in self.props:
+        self.storage.set_property("bench", prop)
+
+    return {
+      "json2obj.decode.ComputeServers": lambda: ComputeServers(serialized_obj=servers_raw),
+      "json2obj.serialize.ComputeServers": lambda: self.servers.serialize(),
+      "json2obj.decode.DiskImages": lambda: DiskImages(serialized_obj=images_raw),
+      "json2obj.serialize.DiskImages": lambda: self.images.serialize(),
+      "sqlstorage.get_property": lambda: self.storage.get_property("bench", "existing"),
+      "sqlstorage.set_property": lambda: self.storage.set_text_property("bench", "single", "x" * 1024),
+      f"sqlstorage.set_property.x{BATCH_SIZE}": _set_property_loop,
+      f"sqlstorage.set_properties.x{BATCH_SIZE}": lambda: self.storage.set_properties("bench", self.props),
+      "cache.roundtrip.plain": lambda: _cache_roundtrip(False),
+      "cache.roundtrip.encrypted": lambda: _cache_roundtrip(True),
+      "openstackvm.construct": lambda: OpenStackVM(self.servers.servers, self.images_dict, self.flavors, self.networks,
+                                                   OpenStackUsers(self.images.images))
+    }
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+  """
+  :arg min_time min duration of one measurement, the amount of calls per measurement is calibrated to it
+  :return time per call in seconds
+  """
+  timer = timeit.Timer(func)
+  number, elapsed = timer.autorange()
+  if elapsed < min_time:
+    number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+
+  samples = [t / number for t in timer.repeat(repeat, number)]
+  return {
+    "median": statistics.median(samples),
+    "min": min(samples),
+    "max": max(samples),
+    "calls": number
+  }
+
+
+def run(names: List[str] = None, repeat: int = 5, min_time: float = 0.2, **payload_args) -> dict:
+  """
+  :arg names benchmarks to run, all if not set
+  :arg payload_args amount of servers and images in the payloads
+  """
+  bench = MicroBench(**payload_args)
+  try:
+    benchmarks = bench.benchmarks()
+    names = names if names else list(benchmarks.keys())
+    unknown = set(names) - set(benchmarks.keys())
+    if unknown:
+      raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    return {
+      "environment": {
+        "python": sys.version.split(" ")[0],
+        "platform": sys.platform,
+        "repeat": repeat,
+        **bench.params
+      },
+      "results": {name: measure(benchmarks[name], repeat, min_time) for name in names}
+    }
+  finally:
+    bench.close()
+
+
+def _format_time(value: float) -> str:
+  for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+    if value >= scale:
+      return f"{value / scale:.2f} {unit}"
+  return f"{value / 1e-9:.0f} ns"
+
+
+def print_report(report: dict):
+  print(f"{'Benchmark':<40} {'Median':>12} {'Min':>12} {'Max':>12}")
+  for name, r in report["results"].items():
+    print(f"{name:<40} {_format_time(r['median']):>12} {_format_time(r['min']):>12} {_format_time(r['max']):>12}")
+
+
+def main(args: List[str]) -> int:
+  import argparse
+
+  parser = argparse.ArgumentParser(description="Microbenchmarks of json2obj, SQLStorage, cache and OpenStackVM")
+  parser.add_argument("--servers", type=int, default=1000, help="amount of servers in the payloads")
+  parser.add_argument("--images", type=int, default=200, help="amount of images in the payloads")
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--min-time", type=float, default=0.2, help="min duration of one measurement, in seconds")
+  parser.add_argument("--benchmark", action="append", help="benchmark to run, could be given several times")
+  parser.add_argument("--output", help="save the results as json, to be used as the baseline by compare.py")
+  options = parser.parse_args(args)
+
+  report = run(options.benchmark, options.repeat, options.min_time, servers=options.servers, images=options.images)
+  print_report(report)
+  if options.output:
+    with open(options.output, "w") as f:
+      json.dump(report, f, indent=2)
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,243 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Scaling benchmark of the "list" pipeline: decode -> OpenStackVM -> get_server_by_cluster -> table rendering.
+
+Every stage is measured for time and peak allocated memory at the growing amount of servers. The growth of
+each stage is estimated as the log-log slope between the sizes, 1.0 means linear, and the stages growing faster
+than --max-slope are reported as super-linear:
+
+  python tests/benchmarks/scaling.py --sizes 100,1000,10000,100000 --output scaling.json
+
+"""
+
+import json
+import math
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Callable, Dict, List, Tuple
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(TESTS_DIR, "..", "src"))
+sys.path.insert(0, TESTS_DIR)
+
+from fake_cloud import FakeCloud
+from openstack_cli.commands.list import WidthConst, print_cluster
+from openstack_cli.core.config import Configuration
+from openstack_cli.modules.openstack import OpenStack
+from openstack_cli.modules.openstack.api_objects import ComputeFlavors, ComputeServers, DiskImages, Networks, Subnets
+from openstack_cli.modules.openstack.objects import OSFlavor, OSNetwork, OpenStackUsers, OpenStackVM, \
+  OpenStackVMInfo
+from openstack_cli.modules.utils import ValueHolder
+
+DEFAULT_SIZES = [100, 1000, 10000]  # 100k takes minutes and few GB of memory, pass it explicitly
+STAGES = ["decode", "construct", "group", "render"]
+
+
+class ScalingBench(object):
+  """
+  Configured OpenStack client without the login, the inventory is passed to it directly instead of API calls
+  """
+
+  def __init__(self, images: int = 200):
+    self.__images = images
+    self.__data_dir = tempfile.mkdtemp(prefix="oscli-scaling-")
+    self.__old_data_home = os.environ.get("XDG_DATA_HOME")
+    os.environ["XDG_DATA_HOME"] = self.__data_dir
+
+    self.conf = Configuration(app_name="scaling-bench", lazy_init=True)
+    with redirect_stdout(StringIO()):
+      self.conf._storage.create_key(True, "")
+      self.conf._storage.initialize_key()
+    self.ostack = OpenStack(self.conf)
+
+  def close(self):
+    self.conf._storage.connection.close()
+    shutil.rmtree(self.__data_dir, ignore_errors=True)
+    if self.__old_data_home is None:
+      del os.environ["XDG_DATA_HOME"]
+    else:
+      os.environ["XDG_DATA_HOME"] = self.__old_data_home
+
+  def pipeline(self, servers: int) -> Tuple[List[Tuple[str, Callable[[object], object]]], str]:
+    """
+    :return stages in order of execution, each stage receives the result of the previous one, and the servers
+            list response body as the input of the first stage
+    """
+    payloads = FakeCloud(servers=servers, images=self.__images).payloads()
+    servers_body = json.dumps(payloads["servers"])
+    images = DiskImages(serialized_obj=payloads["images"]).images
+    images_dict = {image.id: image for image in images}
+    flavors = {f.id: f for f in map(OSFlavor.get, ComputeFlavors(serialized_obj=payloads["flavors"]).flavors)}
+    networks = OSNetwork().parse(Networks(serialized_obj=payloads["networks"]).networks,
+                                 Subnets(serialized_obj=payloads["subnets"]).subnets)
+    users = OpenStackUsers(images)
+
+    def _group(vms: OpenStackVM) -> Tuple[OpenStackVM, ValueHolder, Dict[str, List[OpenStackVMInfo]]]:
+      vh = ValueHolder(2)
+
+      def _width_filter(s: OpenStackVMInfo) -> bool:
+        vh.set_if_bigger(WidthConst.max_cluster_name, len(s.cluster_name))
+        vh.set_if_bigger(WidthConst.max_vm_type_len, len(s.flavor.name))
+        return False
+
+      return vms, vh, self.ostack.get_server_by_cluster(sort=True, filter_func=_width_filter, servers=vms)
+
+    def _render(args: Tuple[OpenStackVM, ValueHolder, Dict[str, List[OpenStackVMInfo]]]) -> str:
+      vms, vh, clusters = args
+      out = StringIO()
+      with redirect_stdout(out):
+        print_cluster(clusters, vh, vms.cluster_states)
+      return out.getvalue()
+
+    return [
+      ("decode", lambda body: ComputeServers(serialized_obj=json.loads(body)).servers),
+      ("construct", lambda items: OpenStackVM(items, images_dict, flavors, networks, users)),
+      ("group", _group),
+      ("render", _render)
+    ], servers_body
+
+  def measure(self, servers: int, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Time is the median of "repeat" runs, memory is the peak of the traced allocations during the separate run,
+    as tracing slows the code down several times
+
+    :return time in seconds and peak memory in bytes per stage
+    """
+    stages, body = self.pipeline(servers)
+    times: Dict[str, List[float]] = {name: [] for name, _ in stages}
+    for _ in range(repeat):
+      value = body
+      for name, f in stages:
+        t_start = time.perf_counter()
+        value = f(value)
+        times[name].append(time.perf_counter() - t_start)
+      del value
+
+    memory: Dict[str, int] = {}
+    value = body
+    for name, f in stages:
+      tracemalloc.start()  # tracing is restarted per stage to count only the allocations made by it
+      try:
+        value = f(value)
+        memory[name] = tracemalloc.get_traced_memory()[1]
+      finally:
+        tracemalloc.stop()
+    del value
+
+    return {name: {"time": statistics.median(times[name]), "memory": memory[name]} for name, _ in stages}
+
+
+def slope(sizes: List[int], values: List[float]) -> float or None:
+  """
+  Least squares slope of the values on the log-log scale: 1.0 for linear growth, 2.0 for quadratic
+  """
+  points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+  if len(points) < 2:
+    return None
+
+  mean_x = statistics.mean(x for x, _ in points)
+  mean_y = statistics.mean(y for _, y in points)
+  dx = sum((x - mean_x) ** 2 for x, _ in points)
+  return sum((x - mean_x) * (y - mean_y) for x, y in points) / dx if dx else None
+
+
+def run(sizes: List[int] = None, repeat: int = 3, images: int = 200, max_slope: float = 1.2) -> dict:
+  """
+  :arg max_slope stages with the time or memory log-log slope above are marked as super-linear
+  """
+  sizes = sorted(sizes if sizes else DEFAULT_SIZES)
+  bench = ScalingBench(images=images)
+  try:
+    results = {size: bench.measure(size, repeat) for size in sizes}
+  finally:
+    bench.close()
+
+  stages = {}
+  for stage in STAGES:
+    times = [results[size][stage]["time"] for size in sizes]
+    memory = [results[size][stage]["memory"] for size in sizes]
+    time_slope, memory_slope = slope(sizes, times), slope(sizes, memory)
+    stages[stage] = {
+      "time": times,
+      "memory": memory,
+      "time_slope": time_slope,
+      "memory_slope": memory_slope,
+      "super_linear": any(s is not None and s > max_slope for s in (time_slope, memory_slope))
+    }
+
+  return {
+    "environment": {
+      "python": sys.version.split(" ")[0],
+      "platform": sys.platform,
+      "repeat": repeat,
+      "images": images,
+      "max_slope": max_slope
+    },
+    "sizes": sizes,
+    "stages": stages
+  }
+
+
+def print_report(report: dict):
+  def _slope(value: float or None) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+  sizes = report["sizes"]
+  print(f"{'Stage':<10} {'Metric':<8} " + " ".join(f"{size:>10}" for size in sizes) + f" {'Slope':>7}")
+  for name, r in report["stages"].items():
+    mark = "  SUPER-LINEAR" if r["super_linear"] else ""
+    print(f"{name:<10} {'ms':<8} " + " ".join(f"{t * 1000:>10.1f}" for t in r["time"]) +
+          f" {_slope(r['time_slope']):>7}{mark}")
+    print(f"{'':<10} {'MB':<8} " + " ".join(f"{m / 1024 / 1024:>10.2f}" for m in r["memory"]) +
+          f" {_slope(r['memory_slope']):>7}")
+
+
+def main(args: List[str]) -> int:
+  import argparse
+
+  parser = argparse.ArgumentParser(description="Time and memory growth of the list pipeline with the project size")
+  parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                      help="comma separated amounts of servers, like 100,1000,10000,100000")
+  parser.add_argument("--images", type=int, default=200)
+  parser.add_argument("--repeat", type=int, default=3)
+  parser.add_argument("--max-slope", type=float, default=1.2, help="max allowed log-log growth slope, 1.0 is linear")
+  parser.add_argument("--output", help="save the results as json")
+  options = parser.parse_args(args)
+
+  report = run([int(s) for s in options.sizes.split(",")], options.repeat, options.images, options.max_slope)
+  print_report(report)
+  if options.output:
+    with open(options.output, "w") as f:
+      json.dump(report, f, indent=2)
+
+  super_linear = [name for name, r in report["stages"].items() if r["super_linear"]]
+  if super_linear:
+    print(f"\nStages growing faster than the slope {options.max_slope}: {', '.join(super_linear)}")
+    return 1
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,863 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Local fake OpenStack cloud: stdlib HTTP server implementing the part of Keystone, Nova, Glance, Neutron and Cinder
+API used by the application, with generated inventory, latency and error injection.
+
+Could be started standalone to play with the application:
+
+  python tests/fake_cloud.py --servers 1000 --latency 0.05 --data-dir /tmp/oscli
+
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+SERVER_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+REGION = "RegionOne"
+NETWORK_NAME = "INTERNAL_NET"
+LOGIN = "bench"
+PASSWORD = "bench-password"
+
+_ROUTE_GROUP_PATTERN = re.compile(r"\(\?P<(\w+)>[^)]+\)")
+
+BASE_IMAGES = (
+  "CentOS 7.6.1810",
+  "CentOS 8.2.2004",
+  "Ubuntu 18.04",
+  "Ubuntu 20.04",
+  "Debian 10",
+  "SLES 15 SP1",
+  "openSUSE 15.2",
+  "RHEL 8.2"
+)
+
+FLAVORS = (
+  # name, vcpus, ram mb, disk gb, ephemeral gb
+  ("m1.tiny", 1, 512, 1, 0),
+  ("m1.small", 1, 2048, 20, 0),
+  ("m1.medium", 2, 4096, 40, 20),
+  ("m1.large", 4, 8192, 80, 40),
+  ("m1.xlarge", 8, 16384, 160, 80)
+)
+
+CONSOLE_LOG = """[    0.000000] Linux version 4.18.0-193.el8.x86_64 (mockbuild@kbuilder.bsys.centos.org)
+[    0.000000] Command line: BOOT_IMAGE=/boot/vmlinuz-4.18.0-193.el8.x86_64 root=UUID=a5e0 ro console=ttyS0
+[    1.102223] systemd[1]: Detected virtualization kvm.
+[    2.305115] systemd[1]: Set hostname to <{name}>.
+[  OK  ] Started OpenSSH server daemon.
+cloud-init[812]: Cloud-init v. 19.4 running 'modules:config'
+cloud-init[890]: @users@: openstack
+cloud-init[890]: Cloud-init v. 19.4 finished at {updated}. Datasource DataSourceOpenStackLocal.
+
+{name} login: """
+
+
+def _now() -> str:
+  return time.strftime(SERVER_TIME_FORMAT, time.gmtime())
+
+
+def _error(code: int, message: str) -> Tuple[int, dict]:
+  name = {400: "badRequest", 404: "itemNotFound", 409: "conflictingRequest"}.get(code, "computeFault")
+  return code, {name: {"message": message, "code": code}}
+
+
+class FakeCloudStats(object):
+  """
+  Counters of the requests served by the cloud
+  """
+
+  def __init__(self):
+    self.requests: int = 0
+    self.bytes_sent: int = 0
+    self.bytes_received: int = 0
+    self.errors: int = 0
+    self.by_route: Dict[str, int] = {}
+
+  def serialize(self) -> dict:
+    return {
+      "requests": self.requests,
+      "bytes_sent": self.bytes_sent,
+      "bytes_received": self.bytes_received,
+      "errors": self.errors,
+      "by_route": dict(self.by_route)
+    }
+
+
+class _FakeCloudHandler(BaseHTTPRequestHandler):
+  server_version = "FakeOpenStack/1.0"
+  cloud: "FakeCloud" = None
+
+  def log_message(self, format, *args):
+    pass
+
+  def __handle(self, method: str):
+    length = int(self.headers.get("Content-Length") or 0)
+    body = self.rfile.read(length) if length else b""
+    code, headers, content = self.cloud.handle(method, self.path, dict(self.headers.items()), body)
+
+    self.send_response(code)
+    for name, value in headers.items():
+      self.send_header(name, value)
+    if content:
+      self.send_header("Content-Type", "application/json; charset=UTF-8")
+    self.send_header("Content-Length", str(len(content)))
+    self.end_headers()
+    if content:
+      self.wfile.write(content)
+
+  def do_GET(self):
+    self.__handle("GET")
+
+  def do_POST(self):
+    self.__handle("POST")
+
+  def do_PUT(self):
+    self.__handle("PUT")
+
+  def do_DELETE(self):
+    self.__handle("DELETE")
+
+
+class FakeCloud(object):
+  """
+  In-process fake cloud, serving generated inventory on the random local port.
+
+  Servers are grouped into clusters of "cluster_size" nodes named "<cluster>-<n>", every 10th server is stopped,
+  servers are owned by "users" users round-robin, the first one is the user the application is logged in with.
+  Created servers are active immediately and deleted ones stay visible to "changes-since" queries, like on the
+  real cloud.
+  """
+
+  def __init__(self,
+               servers: int = 0,
+               images: int = len(BASE_IMAGES),
+               users: int = 5,
+               cluster_size: int = 3,
+               latency: float = 0,
+               error_rate: float = 0,
+               error_code: int = 503,
+               seed: int = 0,
+               host: str = "127.0.0.1",
+               port: int = 0):
+    """
+    :arg servers amount of servers to generate
+    :arg images amount of images to generate, first of them are base OS images, the rest are user snapshots
+    :arg latency delay in seconds added to each response
+    :arg error_rate share of the API requests to fail with error_code, authentication requests are never failed
+    :arg seed random seed, the same seed produces the same inventory and error sequence
+    """
+    self.__random = random.Random(seed)
+    self.__lock = threading.RLock()
+    self.__latency = latency
+    self.__error_rate = error_rate
+    self.__error_code = error_code
+    self.__stats = FakeCloudStats()
+    self.__tokens: Dict[str, float] = {}
+    self.__reservation_ids: Dict[str, str] = {}
+    self.__deleted: Dict[str, dict] = {}
+
+    self.project_id = self.__uuid()
+    self.project_name = "bench-project"
+    self.domain_id = "default"
+    self.users: Dict[str, str] = {self.__uuid(): LOGIN if n == 0 else f"user{n}" for n in range(max(users, 1))}
+    self.user_id = next(iter(self.users))
+
+    self.network_id = self.__uuid()
+    self.subnet_id = self.__uuid()
+    self.flavors: Dict[str, dict] = {}
+    for name, vcpus, ram, disk, ephemeral in FLAVORS:
+      _id = self.__uuid()
+      self.flavors[_id] = {
+        "name": name,
+        "ram": ram,
+        "vcpus": vcpus,
+        "swap": 0,
+        "rxtx_factor": 1.0,
+        "disk": disk,
+        "id": _id,
+        "links": [],
+        "OS-FLV-DISABLED:disabled": False,
+        "os-flavor-access:is_public": True,
+        "OS-FLV-EXT-DATA:ephemeral": ephemeral
+      }
+
+    self.images: Dict[str, dict] = {}
+    for n in range(images):
+      self.__add_image(n)
+
+    self.keypairs: Dict[str, dict] = {}
+    self.servers: Dict[str, dict] = {}
+    user_ids = list(self.users.keys())
+    for n in range(servers):
+      cluster, node = divmod(n, cluster_size)
+      self.add_server(
+        f"cluster{cluster:05d}-{node + 1}",
+        user_id=user_ids[cluster % len(user_ids)],
+        stopped=n % 10 == 9,
+        updated="2020-01-01T00:00:00Z"
+      )
+
+    self.__routes: List[Tuple[str, re.Pattern, Callable[..., Tuple[int, dict]], str]] = []
+    self.__add_routes()
+
+    self.__handler = type("FakeCloudHandler", (_FakeCloudHandler,), {"cloud": self})
+    self.__httpd: Optional[ThreadingHTTPServer] = None
+    self.__thread: Optional[threading.Thread] = None
+    self.__address = (host, port)
+
+  def __uuid(self) -> str:
+    return str(uuid.UUID(int=self.__random.getrandbits(128), version=4))
+
+  def __add_image(self, n: int):
+    _id = self.__uuid()
+    image = {
+      "status": "active",
+      "name": BASE_IMAGES[n] if n < len(BASE_IMAGES) else f"snapshot-{n:05d}",
+      "tags": [],
+      "container_format": "bare",
+      "created_at": "2020-01-01T00:00:00Z",
+      "disk_format": "qcow2",
+      "updated_at": "2020-01-01T00:00:00Z",
+      "visibility": "public" if n < len(BASE_IMAGES) else "private",
+      "self": f"/v2/images/{_id}",
+      "min_disk": 0,
+      "protected": False,
+      "id": _id,
+      "file": f"/v2/images/{_id}/file",
+      "checksum": f"{n:032x}",
+      "owner": self.project_id,
+      "size": 1073741824,
+      "min_ram": 0,
+      "schema": "/v2/schemas/image",
+      "virtual_size": None
+    }
+    if n >= len(BASE_IMAGES):
+      user_id = list(self.users.keys())[n % len(self.users)]
+      image.update(image_type="snapshot", user_id=user_id, owner_user_name=self.users[user_id])
+
+    self.images[_id] = image
+
+  def add_server(self, name: str, user_id: str = None, flavor: str = "m1.large", image: str = BASE_IMAGES[0],
+                 stopped: bool = False, updated: str = None, reservation_id: str = None) -> dict:
+    flavor_id = next(k for k, v in self.flavors.items() if v["name"] == flavor)
+    image_id = next(k for k, v in self.images.items() if v["name"] == image)
+    _id = self.__uuid()
+    n = len(self.servers) + len(self.__deleted) + 10
+    updated = updated if updated else _now()
+    server = {
+      "OS-EXT-STS:task_state": None,
+      "OS-EXT-STS:vm_state": "stopped" if stopped else "active",
+      "OS-EXT-STS:power_state": 4 if stopped else 1,
+      "OS-EXT-AZ:availability_zone": "nova",
+      "OS-DCF:diskConfig": "MANUAL",
+      "OS-SRV-USG:launched_at": updated,
+      "metadata": {},
+      "tenant_id": self.project_id,
+      "created": updated,
+      "updated": updated,
+      "name": name,
+      "key_name": "default",
+      "hostId": f"{n:056x}",
+      "status": "SHUTOFF" if stopped else "ACTIVE",
+      "progress": 0,
+      "accessIPv4": "",
+      "accessIPv6": "",
+      "user_id": user_id if user_id else self.user_id,
+      "id": _id,
+      "security_groups": [{"name": "default"}],
+      "flavor": {"id": flavor_id, "links": []},
+      "image": {"id": image_id, "links": []},
+      "links": [],
+      "addresses": {
+        NETWORK_NAME: [{
+          "OS-EXT-IPS-MAC:mac_addr": f"fa:16:3e:{n >> 16 & 0xff:02x}:{n >> 8 & 0xff:02x}:{n & 0xff:02x}",
+          "version": 4,
+          "addr": f"10.{n >> 16 & 0xff}.{n >> 8 & 0xff}.{n & 0xff}",
+          "OS-EXT-IPS:type": "fixed"
+        }]
+      }
+    }
+    with self.__lock:
+      self.servers[_id] = server
+      if reservation_id:
+        self.__reservation_ids[_id] = reservation_id
+
+    return server
+
+  # ========= server lifecycle
+
+  def start(self) -> "FakeCloud":
+    self.__httpd = ThreadingHTTPServer(self.__address, self.__handler)
+    self.__httpd.daemon_threads = True
+    self.__thread = threading.Thread(target=self.__httpd.serve_forever, name="fake-cloud", daemon=True)
+    self.__thread.start()
+    return self
+
+  def stop(self):
+    if self.__httpd:
+      self.__httpd.shutdown()
+      self.__httpd.server_close()
+      self.__thread.join(10)
+      self.__httpd = None
+
+  def __enter__(self) -> "FakeCloud":
+    return self.start()
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.stop()
+
+  @property
+  def url(self) -> str:
+    host, port = self.__httpd.server_address[:2]
+    return f"http://{host}:{port}"
+
+  @property
+  def identity_url(self) -> str:
+    """
+    Address to be used as "os_address" in the application configuration
+    """
+    return f"{self.url}/identity"
+
+  @property
+  def stats(self) -> FakeCloudStats:
+    return self.__stats
+
+  def reset_stats(self) -> FakeCloudStats:
+    with self.__lock:
+      stats, self.__stats = self.__stats, FakeCloudStats()
+
+    return stats
+
+  @property
+  def latency(self) -> float:
+    return self.__latency
+
+  @latency.setter
+  def latency(self, value: float):
+    self.__latency = value
+
+  @property
+  def error_rate(self) -> float:
+    return self.__error_rate
+
+  @error_rate.setter
+  def error_rate(self, value: float):
+    self.__error_rate = value
+
+  def payloads(self) -> Dict[str, dict]:
+    """
+    API response bodies of the whole inventory, for the benchmarks which are not going through HTTP
+    """
+    with self.__lock:
+      return {
+        "servers": self.__servers(params={})[1],
+        "images": self.__images()[1],
+        "flavors": self.__flavors()[1],
+        "networks": self.__networks()[1],
+        "subnets": self.__subnets()[1]
+      }
+
+  # ========= request processing
+
+  def handle(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    parts = urlsplit(path)
+    params = dict(parse_qsl(parts.query))
+    data = json.loads(body) if body else None
+    route_name, code, response_headers, content = "unknown", 404, {}, _error(404, "Not found")[1]
+
+    if self.__latency:
+      time.sleep(self.__latency)
+
+    for _method, pattern, func, name in self.__routes:
+      match = pattern.match(parts.path) if _method == method else None
+      if not match:
+        continue
+
+      route_name = name
+      is_identity = parts.path.startswith("/identity/")
+      with self.__lock:
+        is_failed = not is_identity and self.__error_rate and self.__random.random() < self.__error_rate
+
+      if is_failed:
+        code, content = _error(self.__error_code, "Injected failure")
+        response_headers["Retry-After"] = "0"
+      elif not is_identity and headers.get("X-Auth-Token") not in self.__tokens:
+        code, content = 401, {"error": {"message": "The request you have made requires authentication.", "code": 401}}
+      else:
+        with self.__lock:
+          code, content = func(params=params, data=data, headers=response_headers, request_headers=headers,
+                               **match.groupdict())
+      break
+
+    raw = json.dumps(content).encode("utf-8") if content is not None else b""
+    with self.__lock:
+      self.__stats.requests += 1
+      self.__stats.bytes_received += len(body) + len(path)
+      self.__stats.bytes_sent += len(raw)
+      self.__stats.errors += 1 if code >= 500 else 0
+      self.__stats.by_route[route_name] = self.__stats.by_route.get(route_name, 0) + 1
+
+    return code, response_headers, raw
+
+  def __add_routes(self):
+    routes = [
+      # Keystone
+      ("POST", "/identity/v3/auth/tokens", self.__auth_tokens),
+      ("GET", "/identity/v3/auth/tokens", self.__validate_token),
+      ("GET", "/identity/v3/auth/projects", self.__projects),
+      ("GET", "/identity/v3/regions", self.__regions),
+      # Nova
+      ("GET", "/compute/v2.1/limits", self.__compute_limits),
+      ("GET", "/compute/v2.1/flavors/detail", self.__flavors),
+      ("GET", "/compute/v2.1/servers/detail", self.__servers),
+      ("POST", "/compute/v2.1/servers", self.__create_servers),
+      ("GET", "/compute/v2.1/servers/(?P<server_id>[\\w-]+)", self.__server),
+      ("DELETE", "/compute/v2.1/servers/(?P<server_id>[\\w-]+)", self.__delete_server),
+      ("POST", "/compute/v2.1/servers/(?P<server_id>[\\w-]+)/action", self.__server_action),
+      ("GET", "/compute/v2.1/os-keypairs", self.__keypairs),
+      ("POST", "/compute/v2.1/os-keypairs", self.__create_keypair),
+      ("GET", "/compute/v2.1/os-keypairs/(?P<name>[^/]+)", self.__keypair),
+      ("DELETE", "/compute/v2.1/os-keypairs/(?P<name>[^/]+)", self.__delete_keypair),
+      # Glance
+      ("GET", "/image/v2/images", self.__images),
+      ("DELETE", "/image/v2/images/(?P<image_id>[\\w-]+)", self.__delete_image),
+      # Neutron
+      ("GET", "/network/v2.0/networks", self.__networks),
+      ("GET", "/network/v2.0/subnets", self.__subnets),
+      ("GET", "/network/v2.0/quotas/{project_id}/details.json", self.__network_quotas),
+      # Cinder
+      ("GET", "/volume/v3/{project_id}/os-quota-sets/{project_id}", self.__volume_quotas)
+    ]
+    for method, path, func in routes:
+      pattern = re.compile(path.replace("{project_id}", re.escape(self.project_id)) + "$")
+      name = _ROUTE_GROUP_PATTERN.sub(r"{\1}", path)  # readable route name for the stats
+      self.__routes.append((method, pattern, func, f"{method} {name}"))
+
+  # ========= Keystone
+
+  def __token(self, scoped: bool = True) -> dict:
+    token = {
+      "is_domain": False,
+      "methods": ["password"],
+      "roles": [{"id": "member", "name": "member"}],
+      "expires_at": time.strftime("%Y-%m-%dT%H:%M:%S.000000Z", time.gmtime(time.time() + 3600)),
+      "issued_at": time.strftime("%Y-%m-%dT%H:%M:%S.000000Z", time.gmtime()),
+      "audit_ids": ["bench"],
+      "user": {"id": self.user_id, "name": LOGIN, "domain": {"id": self.domain_id, "name": "Default"}}
+    }
+    if not scoped:
+      return token
+
+    def _service(_type: str, name: str, url: str) -> dict:
+      return {
+        "type": _type,
+        "id": f"{_type}-service",
+        "name": name,
+        "endpoints": [{"region_id": REGION, "url": url, "region": REGION, "interface": "public", "id": f"{_type}-public"}]
+      }
+
+    token["project"] = {"id": self.project_id, "name": self.project_name, "domain": {"id": self.domain_id}}
+    token["catalog"] = [
+      _service("identity", "keystone", f"{self.url}/identity"),
+      _service("compute", "nova", f"{self.url}/compute/v2.1"),
+      _service("image", "glance", f"{self.url}/image"),
+      _service("network", "neutron", f"{self.url}/network"),
+      _service("volumev3", "cinderv3", f"{self.url}/volume/v3/{self.project_id}")
+    ]
+    return token
+
+  def __auth_tokens(self, data: dict, headers: Dict[str, str], **kwargs) -> Tuple[int, dict]:
+    try:
+      user = data["auth"]["identity"]["password"]["user"]
+    except (KeyError, TypeError):
+      return _error(400, "Malformed authentication request")
+
+    if user.get("name") != LOGIN or user.get("password") != PASSWORD:
+      return 401, {"error": {"message": "The request you have made requires authentication.", "code": 401}}
+
+    token = uuid.uuid4().hex
+    scoped = data["auth"].get("scope") != "unscoped"
+    self.__tokens[token] = time.time()
+    headers["X-Subject-Token"] = token
+    return 201, {"token": self.__token(scoped)}
+
+  def __validate_token(self, request_headers: Dict[str, str], **kwargs) -> Tuple[int, dict]:
+    if request_headers.get("X-Subject-Token") not in self.__tokens:
+      return _error(404, "Could not find token")
+
+    return 200, {"token": self.__token()}
+
+  def __projects(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {
+      "projects": [{
+        "is_domain": False,
+        "description": "",
+        "links": {},
+        "tags": [],
+        "enabled": True,
+        "id": self.project_id,
+        "parent_id": self.domain_id,
+        "domain_id": self.domain_id,
+        "name": self.project_name
+      }],
+      "links": {}
+    }
+
+  def __regions(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {"regions": [{"id": REGION, "description": "", "parent_region_id": None}], "links": {}}
+
+  # ========= Nova
+
+  def __compute_limits(self, **kwargs) -> Tuple[int, dict]:
+    servers = list(self.servers.values())
+    flavors = [self.flavors[s["flavor"]["id"]] for s in servers]
+    return 200, {
+      "limits": {
+        "rate": [],
+        "absolute": {
+          "maxTotalCores": max(1000, len(servers) * 8),
+          "totalCoresUsed": sum(f["vcpus"] for f in flavors),
+          "maxTotalRAMSize": max(2048000, len(servers) * 16384),
+          "totalRAMUsed": sum(f["ram"] for f in flavors),
+          "maxTotalInstances": max(200, len(servers) * 2),
+          "totalInstancesUsed": len(servers),
+          "maxTotalKeypairs": 100,
+          "maxServerGroups": 10,
+          "totalServerGroupsUsed": 0,
+          "maxServerMeta": 128,
+          "maxImageMeta": 128,
+          "maxSecurityGroups": 10,
+          "maxSecurityGroupRules": 20,
+          "totalSecurityGroupsUsed": 1
+        }
+      }
+    }
+
+  def __flavors(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {"flavors": list(self.flavors.values())}
+
+  def __servers(self, params: Dict[str, str], **kwargs) -> Tuple[int, dict]:
+    if "changes-since" in params:
+      since = params["changes-since"]
+      servers = [s for s in list(self.servers.values()) + list(self.__deleted.values()) if s["updated"] >= since]
+    else:
+      servers = list(self.servers.values())
+
+    if "reservation_id" in params:
+      servers = [s for s in servers if self.__reservation_ids.get(s["id"]) == params["reservation_id"]]
+
+    if "name" in params:
+      try:
+        pattern = re.compile(params["name"])
+      except re.error:
+        return _error(400, "Invalid name filter")
+      servers = [s for s in servers if pattern.search(s["name"])]
+
+    # the whole list is returned as one page, the client is following the "next" link only for some services
+    return 200, {"servers": servers}
+
+  def __server(self, server_id: str, **kwargs) -> Tuple[int, dict]:
+    if server_id not in self.servers:
+      return _error(404, f"Instance {server_id} could not be found.")
+
+    return 200, {"server": self.servers[server_id]}
+
+  def __create_servers(self, data: dict, **kwargs) -> Tuple[int, dict]:
+    request = data.get("server") or {}
+    flavor = self.flavors.get(request.get("flavorRef"))
+    image = self.images.get(request.get("imageRef"))
+    if not request.get("name") or not flavor or not image:
+      return _error(400, "Invalid server create request")
+
+    count = int(request.get("max_count") or request.get("min_count") or 1)
+    reservation_id = f"r-{uuid.uuid4().hex[:8]}"
+    created = []
+    for n in range(count):
+      name = f"{request['name']}-{n + 1}" if count > 1 else request["name"]
+      server = self.add_server(name, flavor=flavor["name"], image=image["name"], reservation_id=reservation_id)
+      server["key_name"] = request.get("key_name")
+      created.append(server)
+
+    if request.get("return_reservation_id"):
+      return 202, {"reservation_id": reservation_id}
+
+    return 202, {
+      "server": {
+        "security_groups": [{"name": "default"}],
+        "OS-DCF:diskConfig": "MANUAL",
+        "id": created[0]["id"],
+        "links": [],
+        "adminPass": request.get("adminPass")
+      }
+    }
+
+  def __delete_server(self, server_id: str, **kwargs) -> Tuple[int, dict or None]:
+    server = self.servers.pop(server_id, None)
+    if not server:
+      return _error(404, f"Instance {server_id} could not be found.")
+
+    server.update({"status": "DELETED", "OS-EXT-STS:vm_state": "deleted", "OS-EXT-STS:power_state": 0, "updated": _now()})
+    self.__deleted[server_id] = server
+    return 204, None
+
+  def __server_action(self, server_id: str, data: dict, **kwargs) -> Tuple[int, dict or None]:
+    server = self.servers.get(server_id)
+    if not server:
+      return _error(404, f"Instance {server_id} could not be found.")
+
+    action = next(iter(data.keys())) if data else None
+    if action == "os-getConsoleOutput":
+      lines = CONSOLE_LOG.format(name=server["name"], updated=server["updated"]).split("\n")
+      length = (data[action] or {}).get("length")
+      return 200, {"output": "\n".join(lines[-int(length):] if length else lines)}
+
+    states = {
+      "os-stop": ("SHUTOFF", "stopped", 4),
+      "os-start": ("ACTIVE", "active", 1),
+      "reboot": ("ACTIVE", "active", 1)
+    }
+    if action not in states:
+      return _error(400, f"Unsupported action {action}")
+
+    status, vm_state, power_state = states[action]
+    server.update({
+      "status": status,
+      "OS-EXT-STS:vm_state": vm_state,
+      "OS-EXT-STS:power_state": power_state,
+      "updated": _now()
+    })
+    return 202, None
+
+  def __keypairs(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {"keypairs": [{"keypair": {k: v for k, v in kp.items() if k in ("name", "public_key", "fingerprint")}}
+                              for kp in self.keypairs.values()]}
+
+  def __keypair(self, name: str, **kwargs) -> Tuple[int, dict]:
+    if name not in self.keypairs:
+      return _error(404, f"Keypair {name} not found for user {self.user_id}")
+
+    return 200, {"keypair": self.keypairs[name]}
+
+  def __create_keypair(self, data: dict, **kwargs) -> Tuple[int, dict]:
+    request = data.get("keypair") or {}
+    name = request.get("name")
+    if not name:
+      return _error(400, "Keypair name is required")
+    if name in self.keypairs:
+      return _error(409, f"Key pair '{name}' already exists.")
+
+    self.keypairs[name] = {
+      "public_key": request.get("public_key", ""),
+      "user_id": self.user_id,
+      "name": name,
+      "deleted": False,
+      "created_at": _now(),
+      "fingerprint": f"{len(self.keypairs):02x}:bench",
+      "type": "ssh",
+      "id": len(self.keypairs) + 1
+    }
+    return 200, {"keypair": self.keypairs[name]}
+
+  def __delete_keypair(self, name: str, **kwargs) -> Tuple[int, dict or None]:
+    if self.keypairs.pop(name, None) is None:
+      return _error(404, f"Keypair {name} not found for user {self.user_id}")
+
+    return 202, None
+
+  # ========= Glance
+
+  def __images(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {"images": list(self.images.values()), "schema": "/v2/schemas/images", "first": "/v2/images"}
+
+  def __delete_image(self, image_id: str, **kwargs) -> Tuple[int, dict or None]:
+    if self.images.pop(image_id, None) is None:
+      return _error(404, f"No image found with ID {image_id}")
+
+    return 204, None
+
+  # ========= Neutron
+
+  def __networks(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {
+      "networks": [{
+        "status": "ACTIVE",
+        "router:external": False,
+        "availability_zone_hints": [],
+        "availability_zones": ["nova"],
+        "description": "",
+        "port_security_enabled": True,
+        "subnets": [self.subnet_id],
+        "tenant_id": self.project_id,
+        "project_id": self.project_id,
+        "tags": [],
+        "dns_domain": "bench.local.",
+        "mtu": 1450,
+        "revision_number": 1,
+        "admin_state_up": True,
+        "shared": True,
+        "id": self.network_id,
+        "name": NETWORK_NAME,
+        "is_default": True
+      }]
+    }
+
+  def __subnets(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {
+      "subnets": [{
+        "description": "",
+        "enable_dhcp": True,
+        "tags": [],
+        "network_id": self.network_id,
+        "tenant_id": self.project_id,
+        "project_id": self.project_id,
+        "dns_nameservers": ["10.0.0.2"],
+        "allocation_pools": [{"start": "10.0.0.10", "end": "10.255.255.250"}],
+        "gateway_ip": "10.0.0.1",
+        "ip_version": 4,
+        "host_routes": [],
+        "cidr": "10.0.0.0/8",
+        "id": self.subnet_id,
+        "name": f"{NETWORK_NAME}_subnet"
+      }]
+    }
+
+  def __network_quotas(self, **kwargs) -> Tuple[int, dict]:
+    def _item(used: int, limit: int) -> dict:
+      return {"used": used, "limit": limit, "reserved": 0}
+
+    return 200, {
+      "quota": {
+        "port": _item(len(self.servers), max(500, len(self.servers) * 2)),
+        "network": _item(1, 10),
+        "subnet": _item(1, 10),
+        "router": _item(0, 10),
+        "floatingip": _item(0, 50),
+        "security_group": _item(1, 10),
+        "security_group_rule": _item(4, 100)
+      }
+    }
+
+  # ========= Cinder
+
+  def __volume_quotas(self, **kwargs) -> Tuple[int, dict]:
+    return 200, {
+      "quota_set": {
+        "id": self.project_id,
+        "volumes": {"limit": 50, "in_use": 0, "reserved": 0, "allocated": 0},
+        "gigabytes": {"limit": 1000, "in_use": 0, "reserved": 0, "allocated": 0}
+      }
+    }
+
+
+def configure(cloud: FakeCloud, data_dir: str, version: float = 0.0, warm_caches: bool = True):
+  """
+  Creates the application configuration in "data_dir" (used as XDG_DATA_HOME) pointing to the cloud, without
+  asking any questions. The configuration is marked as up to date for the "version", so the application should
+  be started with APP_VERSION=v<version>
+
+  :arg warm_caches keep images, flavors and networks fetched during the configuration in the cache
+  """
+  old_data_home = os.environ.get("XDG_DATA_HOME")
+  os.environ["XDG_DATA_HOME"] = data_dir
+  if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+  from openstack_cli import __app_name__
+  from openstack_cli.core.config import Configuration
+  from openstack_cli.core.updates import import_upgrade_packs
+  from openstack_cli.modules.apputils.config.upgrades import UPGRADE_CATALOGS
+  from openstack_cli.modules.openstack import OpenStack
+  from openstack_cli.modules.openstack.objects import VMProject
+
+  import_upgrade_packs()
+  try:
+    conf = Configuration(app_name=__app_name__, lazy_init=True)
+    storage = conf._storage
+    with redirect_stdout(StringIO()):
+      storage.create_key(True, "")
+      storage.initialize_key()
+    conf._test_encrypted_property = "test"
+
+    conf.os_address = cloud.identity_url
+    conf.os_login = LOGIN
+    conf.os_password = PASSWORD
+    conf.project = VMProject(id=cloud.project_id, name=cloud.project_name, domain=cloud.domain_id)
+    conf.region = REGION
+    conf.default_vm_password = "qwerty"
+
+    with redirect_stdout(StringIO()):
+      conf.default_network = next(n for n in OpenStack(conf).networks if n.name == NETWORK_NAME)
+      for catalog in UPGRADE_CATALOGS[1.1]:  # the same login and keys sync sequence as the interactive one
+        catalog(conf, storage, 1.1)()
+
+    conf.version = version
+    conf.is_conf_initialized = True
+    if not warm_caches:
+      conf.cache.invalidate_all()
+  finally:
+    if old_data_home is None:
+      del os.environ["XDG_DATA_HOME"]
+    else:
+      os.environ["XDG_DATA_HOME"] = old_data_home
+
+
+def main(args: List[str]) -> int:
+  import argparse
+
+  parser = argparse.ArgumentParser(description="Local fake OpenStack cloud")
+  parser.add_argument("--servers", type=int, default=100)
+  parser.add_argument("--images", type=int, default=len(BASE_IMAGES))
+  parser.add_argument("--latency", type=float, default=0, help="delay added to each response, in seconds")
+  parser.add_argument("--error-rate", type=float, default=0, help="share of the requests to fail with 503")
+  parser.add_argument("--port", type=int, default=0)
+  parser.add_argument("--data-dir", help="create the application configuration in the folder, to be used as XDG_DATA_HOME")
+  options = parser.parse_args(args)
+
+  cloud = FakeCloud(servers=options.servers, images=options.images, latency=options.latency,
+                    error_rate=options.error_rate, port=options.port).start()
+  if options.data_dir:
+    configure(cloud, options.data_dir, version=1.0)
+    print(f"Configured: XDG_DATA_HOME={options.data_dir} APP_VERSION=v1.0")
+
+  print(f"Fake cloud is listening on {cloud.identity_url}, press Ctrl+C to stop")
+  try:
+    while True:
+      time.sleep(1)
+  except KeyboardInterrupt:
+    pass
+  finally:
+    cloud.stop()
+    print(json.dumps(cloud.stats.serialize(), indent=2))
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,88 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from io import StringIO
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.core.agent import AgentClient, AgentServer, agent_socket_path, is_agent_supported
+
+
+class ClosedPipe(StringIO):
+  def write(self, s: str) -> int:
+    raise BrokenPipeError(32, "Broken pipe")
+
+
+class NoSessionAgentServer(AgentServer):
+  def _open_session(self, conf):
+    pass
+
+  def _refresh_session(self, conf):
+    pass
+
+
+@skipUnless(is_agent_supported(), "unix sockets are not supported")
+class TestAgent(TestCase):
+  app_name = "agent-test"
+
+  def setUp(self):
+    self.data_dir = tempfile.mkdtemp()
+    self.env = patch.dict(os.environ, {"XDG_DATA_HOME": self.data_dir})
+    self.env.start()
+    os.makedirs(os.path.join(self.data_dir, self.app_name))
+
+    ready = threading.Event()
+    self.server = NoSessionAgentServer(agent_socket_path(self.app_name), lambda: None, allowed_commands=("help",))
+    self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"on_ready": ready.set}, daemon=True)
+    self.thread.start()
+    ready.wait(10)
+    self.client = AgentClient(self.app_name)
+
+  def tearDown(self):
+    self.server.stop()
+    self.thread.join(10)
+    self.env.stop()
+    shutil.rmtree(self.data_dir, ignore_errors=True)
+
+  def test_execute(self):
+    with patch("sys.stdout", new_callable=StringIO) as out:
+      self.assertEqual(0, self.client.execute(["help"]))
+
+    self.assertIn("agent", out.getvalue())
+    self.assertEqual(1, self.client.ping()["served"])
+
+  def test_closed_output(self):
+    with patch("sys.stdout", new=ClosedPipe()):
+      self.assertEqual(1, self.client.execute(["help"]))
+
+    self.assertIsNotNone(self.client.ping())
+
+  def test_not_allowed_command_rejected(self):
+    self.assertIsNone(self.client.execute(["up"]))
+    self.assertEqual(0, self.client.ping()["served"])
+
+  def test_stop(self):
+    self.assertTrue(self.client.stop())
+    self.thread.join(10)
+    self.assertFalse(self.client.is_available)
+    self.assertIsNone(self.client.execute(["help"]))
@@ -0,0 +1,66 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.compare import compare
+
+
+class TestBenchmarks(TestCase):
+  def test_compare_flags_regressions(self):
+    baseline = {"results": {"a": {"median": 1.0}, "b": {"median": 2.0}, "removed": {"median": 1.0}}}
+    current = {"results": {"a": {"median": 1.05}, "b": {"median": 2.5}, "new": {"median": 1.0}}}
+
+    rows = {row[0]: row for row in compare(baseline, current, threshold=10)}
+
+    self.assertFalse(rows["a"][4])
+    self.assertTrue(rows["b"][4])
+    self.assertAlmostEqual(25.0, rows["b"][3])
+    self.assertIsNone(rows["removed"][2])
+    self.assertIsNone(rows["new"][1])
+
+  def test_micro_run(self):
+    from benchmarks.micro import run
+
+    report = run(["json2obj.decode.ComputeServers", "sqlstorage.set_properties.x100", "openstackvm.construct"],
+                 repeat=1, min_time=0.01, servers=30, images=10)
+
+    self.assertEqual(30, report["environment"]["servers"])
+    self.assertEqual(3, len(report["results"]))
+    for result in report["results"].values():
+      self.assertGreater(result["median"], 0)
+
+  def test_scaling_slope(self):
+    from benchmarks.scaling import slope
+
+    self.assertAlmostEqual(1.0, slope([10, 100, 1000], [0.1, 1, 10]))
+    self.assertAlmostEqual(2.0, slope([10, 100, 1000], [1, 100, 10000]))
+    self.assertIsNone(slope([10], [1]))
+
+  def test_scaling_run(self):
+    from benchmarks.scaling import run, STAGES
+
+    report = run([20, 100], repeat=1, images=10)
+
+    self.assertEqual([20, 100], report["sizes"])
+    self.assertEqual(STAGES, list(report["stages"].keys()))
+    for stage in report["stages"].values():
+      self.assertEqual(2, len(stage["time"]))
+      self.assertGreater(stage["memory"][1], 0)
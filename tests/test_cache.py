@@ -0,0 +1,85 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+import tempfile
+import time
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.config import DataCacheExtension, StorageProperty, StoragePropertyType, StorageType
+
+
+class TestDataCache(TestCase):
+  def setUp(self):
+    self.__tmp_dir = tempfile.TemporaryDirectory()
+    os.environ["XDG_DATA_HOME"] = self.__tmp_dir.name
+    self.storage = StorageType.SQL.value(app_name="test-cache", lazy=True)
+
+  def tearDown(self):
+    self.storage.connection.close()
+    self.__tmp_dir.cleanup()
+
+  def test_namespaces_isolated(self):
+    cache = DataCacheExtension(self.storage, "cache", 3600)
+    cache.namespace("cloud-a").set("OSFlavor", "a", encrypted=False)
+    cache.namespace("cloud-b").set("OSFlavor", "b", encrypted=False)
+
+    self.assertEqual("a", cache.namespace("cloud-a").get("OSFlavor"))
+    self.assertEqual("b", cache.namespace("cloud-b").get("OSFlavor"))
+    self.assertFalse(cache.exists("OSFlavor"))
+
+    cache.namespace("cloud-a").invalidate_all()
+    self.assertFalse(cache.namespace("cloud-a").exists("OSFlavor"))
+    self.assertTrue(cache.namespace("cloud-b").exists("OSFlavor"))
+
+  def test_independent_lifetime(self):
+    cache = DataCacheExtension(self.storage, "cache", 3600)
+    cache.set_lifetime("OSNetwork", 0)
+    ns = cache.namespace("cloud-a")
+    ns.set("OSNetwork", "n", encrypted=False)
+    ns.set("OSFlavor", "f", encrypted=False)
+    time.sleep(0.01)
+
+    self.assertFalse(ns.exists("OSNetwork"))
+    self.assertTrue(ns.exists("OSFlavor"))
+
+  def test_lru_eviction(self):
+    cache = DataCacheExtension(self.storage, "cache", 3600, size_limit=150)
+    ns = cache.namespace("cloud-a")
+    for name in ("a", "b", "c"):
+      ns.set(name, "x" * 60, encrypted=False)
+      time.sleep(0.01)
+    ns.get("a")
+    cache.flush()
+
+    self.assertEqual(["a", "c"], sorted(ns.keys))
+    stats = {item.name: item for item in cache.stats()}
+    self.assertEqual(1, stats["cloud-a/a"].hits)
+    self.assertEqual(60, stats["cloud-a/c"].size)
+
+  def test_batch_set_properties(self):
+    props = [StorageProperty(f"p{n}", StoragePropertyType.text, str(n)) for n in range(10)]
+    props.append(StorageProperty("secret", StoragePropertyType.encrypted, "value"))
+    self.storage.create_key(True, "")
+    self.storage.initialize_key()
+    self.storage.set_properties("batch", props)
+
+    self.assertEqual(11, len(self.storage.get_property_list("batch")))
+    self.assertEqual("7", self.storage.get_property("batch", "p7").value)
+    self.assertEqual("value", self.storage.get_property("batch", "secret").value)
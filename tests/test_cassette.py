@@ -0,0 +1,115 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.curl import CurlRequestType, curl, use_cassette
+from openstack_cli.modules.apputils.curl.cassette import REDACTED, Cassette, CassetteMissError, CassetteMode
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+  requests: int = 0
+
+  def do_GET(self):
+    StatusHandler.requests += 1
+    body = gzip.compress(json.dumps({"status": StatusHandler.requests, "adminPass": "secret"}).encode("UTF-8"))
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Encoding", "gzip")
+    self.send_header("X-Subject-Token", "token")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def do_POST(self):
+    self.rfile.read(int(self.headers["Content-Length"]))
+    self.send_response(404)
+    self.send_header("Content-Length", "0")
+    self.end_headers()
+
+  def log_message(self, *args):
+    pass
+
+
+class TestCassette(TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.server = HTTPServer(("127.0.0.1", 0), StatusHandler)
+    cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+    threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.server.shutdown()
+    cls.server.server_close()
+
+  def setUp(self):
+    StatusHandler.requests = 0
+    self.__tmp_dir = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.__tmp_dir.name, "cassette.json")
+
+  def tearDown(self):
+    use_cassette(None)
+    self.__tmp_dir.cleanup()
+
+  def __record(self):
+    cassette = Cassette(self.path, CassetteMode.record)
+    use_cassette(cassette)
+    recorded = [
+      curl(f"{self.url}/servers", params={"changes-since": "1"}, headers={"X-Auth-Token": "token"}).from_json(),
+      curl(f"{self.url}/servers", params={"changes-since": "2"}).from_json(),
+      curl(f"{self.url}/tokens", req_type=CurlRequestType.POST, data={"user": {"password": "secret"}}).code
+    ]
+    use_cassette(None)
+    cassette.save()
+    return recorded
+
+  def test_record_redacts_secrets(self):
+    recorded = self.__record()
+    self.assertEqual("secret", recorded[0]["adminPass"])  # caller receives the original response
+
+    with open(self.path) as f:
+      raw = f.read()
+
+    self.assertNotIn("secret", raw)
+    self.assertNotIn("\"token\"", raw)
+    interactions = json.loads(raw)["interactions"]
+    self.assertEqual(REDACTED, json.loads(interactions[2]["request"]["body"]["text"])["user"]["password"])
+    self.assertEqual("gzip", interactions[0]["response"]["encoding"])
+
+  def test_replay(self):
+    recorded = self.__record()
+    use_cassette(Cassette(self.path, CassetteMode.replay))
+
+    # volatile params are not matched, responses are served in the recorded order, the last one is repeated
+    replayed = [curl(f"{self.url}/servers", params={"changes-since": str(i)}).from_json()["status"] for i in range(3)]
+    self.assertEqual([recorded[0]["status"], recorded[1]["status"], recorded[1]["status"]], replayed)
+    self.assertEqual(404, curl(f"{self.url}/tokens", req_type=CurlRequestType.POST, data={}).code)
+    self.assertEqual(2, StatusHandler.requests)  # nothing is requested from the server on replay
+
+    self.assertRaises(CassetteMissError, curl, f"{self.url}/flavors")
+
+  def test_missing_file(self):
+    self.assertRaises(FileNotFoundError, Cassette, self.path, CassetteMode.replay)
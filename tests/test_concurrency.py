@@ -0,0 +1,86 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+import time
+from email.utils import formatdate
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.concurrency import ConcurrencyController, parse_retry_after
+
+
+class TestConcurrencyController(TestCase):
+  def test_slow_start_and_additive_increase(self):
+    c = ConcurrencyController(min_limit=2, max_limit=32)
+    for _ in range(6):
+      c.observe(202, 0.1)
+    self.assertEqual(8, c.limit)
+
+    c.observe(429, 0.1)
+    self.assertEqual(4, c.limit)
+
+    for _ in range(5):  # about one round trip, as window grows during the round
+      c.observe(202, 0.1)
+    self.assertEqual(5, c.limit)
+
+  def test_limits(self):
+    c = ConcurrencyController(min_limit=2, max_limit=4)
+    for _ in range(10):
+      c.observe(202, 0.1)
+    self.assertEqual(4, c.limit)
+
+    c.observe(503, 0.1)
+    time.sleep(0.01)
+    c.observe(503, 0)
+    self.assertEqual(2, c.limit)
+
+  def test_decrease_once_per_window(self):
+    c = ConcurrencyController(min_limit=1, max_limit=32)
+    for _ in range(15):
+      c.observe(200, 0.1)
+    self.assertEqual(16, c.limit)
+
+    # requests sent before the first decrease should not decrease the limit again
+    for _ in range(5):
+      c.observe(ConcurrencyController.TIMEOUT_CODE, 1)
+    self.assertEqual(8, c.limit)
+
+  def test_latency_spike(self):
+    c = ConcurrencyController(min_limit=2, max_limit=32, latency_tolerance=3, warm_up_samples=5)
+    for _ in range(6):
+      c.observe(200, 0.1)
+    self.assertEqual(8, c.limit)
+
+    c.observe(200, 0.2)
+    self.assertEqual(9, c.limit)
+
+    c.observe(200, 1)
+    self.assertEqual(4, c.limit)
+
+  def test_retry_after(self):
+    c = ConcurrencyController()
+    self.assertEqual(0, c.pause)
+
+    c.observe(429, 0.1, retry_after=10)
+    self.assertGreater(c.pause, 9)
+
+    self.assertEqual(0, parse_retry_after(None))
+    self.assertEqual(0, parse_retry_after("not a date"))
+    self.assertEqual(120, parse_retry_after("120"))
+    self.assertAlmostEqual(60, parse_retry_after(formatdate(time.time() + 60, usegmt=True)), delta=2)
@@ -0,0 +1,83 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.openstack.console_log import ConsoleLogTailer
+from openstack_cli.modules.openstack.objects import OpenStackVMInfo
+
+
+class FakeConsole(object):
+  """
+  Mimics os-getConsoleOutput: returns last "length" lines of the log
+  """
+  def __init__(self):
+    self.log = ""
+    self.requested = []
+
+  def write(self, text: str):
+    self.log += text
+
+  def get_server_console_log(self, server, last_lines: int = 0):
+    self.requested.append(last_lines)
+    lines = self.log.split("\n")
+    return lines[-last_lines:] if last_lines else lines
+
+
+class TestConsoleLogTailer(TestCase):
+  def setUp(self):
+    self.console = FakeConsole()
+    self.tailer = ConsoleLogTailer(self.console, OpenStackVMInfo(), lines=2, window=4)
+
+  def test_incremental_reads(self):
+    self.console.write("".join(f"line {i}\n" for i in range(100)))
+    self.assertEqual(["line 98", "line 99"], self.tailer.poll())
+
+    self.console.write("line 100\nline 1")
+    self.assertEqual(["line 100"], self.tailer.poll())
+
+    self.console.write("01\n")
+    self.assertEqual(["line 101"], self.tailer.poll())
+    self.assertEqual([], self.tailer.poll())
+    self.assertTrue(all(length and length <= 5 for length in self.console.requested))
+
+  def test_window_grows_till_anchor_found(self):
+    self.console.write("".join(f"line {i}\n" for i in range(10)))
+    self.tailer.poll()
+
+    self.console.write("".join(f"line {i}\n" for i in range(10, 30)))
+    self.assertEqual([f"line {i}" for i in range(10, 30)], self.tailer.poll())
+    self.assertEqual([3, 5, 9, 17, 33], self.console.requested)
+
+  def test_wait_for(self):
+    self.console.write("booting\n")
+    self.assertIsNone(self.tailer.wait_for(lambda l: "login:" in l, interval=0, timeout=0))
+
+    self.console.write("login: ")  # prompt is not followed by new line
+    self.assertEqual("login: ", self.tailer.wait_for(lambda l: "login:" in l, interval=0, timeout=0))
+
+  def test_pending_line(self):
+    self.console.write("line 1\nline 2\nlogin: ")
+    self.assertEqual(["line 1", "line 2"], self.tailer.poll())
+    self.assertEqual("login: ", self.tailer.pending)
+
+    self.console.write("\n")
+    self.assertEqual(["login: "], self.tailer.poll())
+    self.assertEqual("", self.tailer.pending)
@@ -0,0 +1,128 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import List
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.curl import CircuitBreakerOpenError, CurlRequestType, RetryPolicy, curl
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+  codes: List[int] = []
+  truncated: int = 0  # amount of responses to close before the whole body is sent
+  requests: int = 0
+
+  def __respond(self):
+    FlakyHandler.requests += 1
+    code = FlakyHandler.codes.pop(0) if FlakyHandler.codes else 200
+    is_truncated = FlakyHandler.truncated > 0
+    FlakyHandler.truncated -= 1 if is_truncated else 0
+    self.send_response(code)
+    self.send_header("Content-Length", "10" if is_truncated else "2")
+    self.end_headers()
+    self.wfile.write(b"ok")
+    self.close_connection = True
+
+  def do_GET(self):
+    self.__respond()
+
+  def do_POST(self):
+    self.__respond()
+
+  def log_message(self, *args):
+    pass
+
+
+class TestRetryPolicy(TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+    cls.url = f"http://127.0.0.1:{cls.server.server_port}/"
+    threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.server.shutdown()
+    cls.server.server_close()
+
+  def setUp(self):
+    FlakyHandler.codes = []
+    FlakyHandler.truncated = 0
+    FlakyHandler.requests = 0
+
+  def test_idempotent_request_is_retried(self):
+    FlakyHandler.codes = [503, 502]
+    r = curl(self.url, retry=RetryPolicy(retries=3, backoff=0.01))
+
+    self.assertEqual(200, r.code)
+    self.assertEqual(3, FlakyHandler.requests)
+
+  def test_post_is_not_retried(self):
+    FlakyHandler.codes = [503]
+    r = curl(self.url, req_type=CurlRequestType.POST, data={}, retry=RetryPolicy(retries=3, backoff=0.01))
+
+    self.assertEqual(503, r.code)
+    self.assertEqual(1, FlakyHandler.requests)
+
+  def test_retry_budget(self):
+    FlakyHandler.codes = [500] * 10
+    policy = RetryPolicy(retries=3, backoff=0.01, max_budget=2, budget_ratio=0)
+
+    self.assertEqual(500, curl(self.url, retry=policy).code)
+    self.assertEqual(3, FlakyHandler.requests)  # first attempt and 2 retries from the budget
+
+    self.assertEqual(500, curl(self.url, retry=policy).code)
+    self.assertEqual(4, FlakyHandler.requests)
+
+  def test_circuit_breaker(self):
+    # nothing is listening on the port of the closed server
+    with HTTPServer(("127.0.0.1", 0), FlakyHandler) as s:
+      url = f"http://127.0.0.1:{s.server_port}/"
+
+    policy = RetryPolicy(retries=0, failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+      with self.assertRaises(TimeoutError) as e:
+        curl(url, retry=policy)
+      self.assertNotIsInstance(e.exception, CircuitBreakerOpenError)
+
+    with self.assertRaises(CircuitBreakerOpenError):
+      curl(url, retry=policy)
+
+    # other endpoints are not affected
+    self.assertEqual(200, curl(self.url, retry=policy).code)
+
+  def test_body_read_failure(self):
+    FlakyHandler.truncated = 1
+    r = curl(self.url, retry=RetryPolicy(retries=3, backoff=0.01))
+
+    self.assertEqual(200, r.code)
+    self.assertEqual(2, FlakyHandler.requests)
+
+    # failed probe of the half-open circuit should not leave it open forever
+    FlakyHandler.truncated = 2
+    policy = RetryPolicy(retries=0, failure_threshold=1, reset_timeout=0)
+    for _ in range(2):
+      with self.assertRaises(TimeoutError) as e:
+        curl(self.url, retry=policy)
+      self.assertNotIsInstance(e.exception, CircuitBreakerOpenError)
+
+    self.assertEqual(200, curl(self.url, retry=policy).code)
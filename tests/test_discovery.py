@@ -0,0 +1,36 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.discovery import CommandsDiscovery
+import openstack_cli.commands
+
+
+class TestCommandsManifest(TestCase):
+  def test_manifest_matches_imported_commands(self):
+    imported = CommandsDiscovery(openstack_cli.commands.__file__, openstack_cli.commands.__name__, use_manifest=False)
+    imported.collect()
+
+    CommandsDiscovery(openstack_cli.commands.__file__, openstack_cli.commands.__name__).collect()  # ensure manifest
+    from_manifest = CommandsDiscovery(openstack_cli.commands.__file__, openstack_cli.commands.__name__).collect()
+
+    self.assertTrue(os.path.exists(from_manifest.manifest_path))
+    self.assertEqual(imported._modules.serialize(), from_manifest._modules.serialize())
@@ -0,0 +1,159 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase, skipUnless
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_cloud import FakeCloud, LOGIN, PASSWORD, configure
+
+
+class TestFakeCloud(TestCase):
+  def setUp(self):
+    self.cloud = FakeCloud(servers=30).start()
+
+  def tearDown(self):
+    self.cloud.stop()
+
+  def __request(self, method: str, uri: str, data: dict = None, token: str = None) -> (int, dict, dict):
+    headers = {"Content-Type": "application/json"}
+    if token:
+      headers["X-Auth-Token"] = token
+    req = Request(f"{self.cloud.url}{uri}", data=json.dumps(data).encode() if data else None, headers=headers,
+                  method=method)
+    try:
+      with urlopen(req) as r:
+        body = r.read()
+        return r.getcode(), dict(r.headers.items()), json.loads(body) if body else None
+    except HTTPError as e:
+      return e.code, dict(e.headers.items()), json.loads(e.read())
+
+  def __login(self) -> str:
+    code, headers, body = self.__request("POST", "/identity/v3/auth/tokens", {
+      "auth": {"identity": {"methods": ["password"], "password": {"user": {"name": LOGIN, "password": PASSWORD}}}}
+    })
+    self.assertEqual(201, code)
+    self.assertEqual(5, len(body["token"]["catalog"]))
+    return headers["X-Subject-Token"]
+
+  def test_inventory(self):
+    token = self.__login()
+    code, _, body = self.__request("GET", "/compute/v2.1/servers/detail", token=token)
+
+    self.assertEqual(200, code)
+    self.assertEqual(30, len(body["servers"]))
+    self.assertEqual(3, len([s for s in body["servers"] if s["status"] == "SHUTOFF"]))
+    self.assertEqual(3, len(self.__request("GET", "/compute/v2.1/servers/detail?name=%5Ecluster00001-",
+                                           token=token)[2]["servers"]))
+
+  def test_create_delete(self):
+    token = self.__login()
+    image_id = next(k for k, v in self.cloud.images.items() if v["name"] == "CentOS 7.6.1810")
+    flavor_id = next(k for k, v in self.cloud.flavors.items() if v["name"] == "m1.large")
+    _, _, body = self.__request("POST", "/compute/v2.1/servers", {
+      "server": {"name": "test", "imageRef": image_id, "flavorRef": flavor_id, "min_count": 2, "max_count": 2,
+                 "return_reservation_id": "True"}
+    }, token=token)
+    servers = self.__request("GET", f"/compute/v2.1/servers/detail?reservation_id={body['reservation_id']}",
+                             token=token)[2]["servers"]
+    self.assertEqual(["test-1", "test-2"], sorted(s["name"] for s in servers))
+
+    self.assertEqual(204, self.__request("DELETE", f"/compute/v2.1/servers/{servers[0]['id']}", token=token)[0])
+    self.assertEqual(31, len(self.cloud.servers))
+    deleted = self.__request("GET", "/compute/v2.1/servers/detail?changes-since=2021-01-01T00:00:00Z",
+                             token=token)[2]["servers"]
+    self.assertEqual({"DELETED", "ACTIVE"}, {s["status"] for s in deleted})
+
+  def test_authentication_required(self):
+    self.assertEqual(401, self.__request("GET", "/compute/v2.1/servers/detail", token="wrong")[0])
+
+  def test_error_injection(self):
+    token = self.__login()
+    self.cloud.error_rate = 1
+
+    code, headers, _ = self.__request("GET", "/compute/v2.1/limits", token=token)
+    self.assertEqual(503, code)
+    self.assertEqual("0", headers["Retry-After"])
+    self.assertEqual(2, self.cloud.stats.requests)
+    self.assertEqual(1, self.cloud.stats.errors)
+    self.assertEqual(1, self.cloud.stats.by_route["GET /compute/v2.1/limits"])
+
+
+class TestCreateServers(TestCase):
+  def setUp(self):
+    from openstack_cli import __app_name__
+    from openstack_cli.core.config import Configuration
+
+    self.cloud = FakeCloud(servers=10).start()
+    self.data_dir = tempfile.mkdtemp(prefix="oscli-test-")
+    configure(self.cloud, self.data_dir, version=1.0)
+    self.old_data_home = os.environ.get("XDG_DATA_HOME")
+    os.environ["XDG_DATA_HOME"] = self.data_dir
+    self.conf = Configuration(app_name=__app_name__, lazy_init=True)
+    self.conf.initialize(upgrade=False)
+
+  def tearDown(self):
+    self.conf._storage.connection.close()
+    self.cloud.stop()
+    shutil.rmtree(self.data_dir, ignore_errors=True)
+    if self.old_data_home is None:
+      del os.environ["XDG_DATA_HOME"]
+    else:
+      os.environ["XDG_DATA_HOME"] = self.old_data_home
+
+  def test_resolved_by_reservation_id(self):
+    from openstack_cli.modules.openstack import OpenStack
+
+    ostack = OpenStack(self.conf)
+    image = list(ostack.get_image_by_alias("centos-761810"))[0]
+    # the same names, as the bulk create would give, owned by the same user but not created by the request
+    existing = {self.cloud.add_server("test-1")["id"], self.cloud.add_server("test-3")["id"]}
+
+    servers = ostack.create_instances("test", image, ostack.get_flavor(image, "m1.large"), "qwerty", count=2)
+
+    self.assertEqual(["test-1", "test-2"], sorted(s.name for s in servers))
+    self.assertFalse(existing & {s.id for s in servers})
+
+
+@skipUnless(hasattr(os, "wait4"), "per-process resource usage is not available")
+class TestEndToEnd(TestCase):
+  def test_requests_per_command(self):
+    from benchmarks.e2e import run
+
+    report = run(["startup_cold", "list", "up", "destroy"], repeat=1, servers=60)["scenarios"]
+
+    self.assertGreater(report["startup_cold"]["requests"], report["list"]["requests"])
+    self.assertEqual(2, report["list"]["requests"])  # token validation and servers list, the rest is cached
+    self.assertEqual(1, report["up"]["by_route"]["POST /compute/v2.1/servers"])
+    self.assertEqual(3, report["destroy"]["by_route"]["DELETE /compute/v2.1/servers/{server_id}"])
+    self.assertGreater(report["list"]["peak_rss"], 0)
+
+  def test_machine_readable_output_after_cache_reset(self):
+    from benchmarks.e2e import E2EBench
+
+    with E2EBench(servers=20, images=5) as bench:
+      bench.run_command(["conf", "reset-cache"])
+      result = bench.run_command(["list", "--format", "json"], stderr=False)  # images, flavors, etc. are re-synced
+
+    self.assertEqual(0, result.code)
+    self.assertEqual(20, sum(cluster["nodes"] for cluster in json.loads(result.output)))
@@ -0,0 +1,82 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+from unittest import TestCase
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(TESTS_DIR, "..", "src")
+BUDGET_FILE = os.path.join(TESTS_DIR, "import_budget.json")
+
+
+def measure_import_time(*args: str) -> Dict[str, int]:
+  """
+  Run the application with "-X importtime" and return self import time in microseconds per module
+  """
+  with tempfile.TemporaryDirectory() as data_dir:
+    env = dict(os.environ, XDG_DATA_HOME=data_dir, PYTHONPATH=SRC_DIR)
+    p = subprocess.run(
+      [sys.executable, "-X", "importtime", "-m", "openstack_cli", *args],
+      env=env,
+      stdin=subprocess.DEVNULL,
+      stdout=subprocess.DEVNULL,
+      stderr=subprocess.PIPE,
+      universal_newlines=True
+    )
+
+  modules: Dict[str, int] = {}
+  for line in p.stderr.splitlines():
+    if not line.startswith("import time:") or "self [us]" in line:
+      continue
+
+    self_time, _, name = line[len("import time:"):].split("|")
+    modules[name.strip()] = int(self_time)
+
+  return modules
+
+
+class TestImportTime(TestCase):
+  def setUp(self):
+    with open(BUDGET_FILE, "r") as f:
+      self.budget = json.load(f)
+
+    measure_import_time(*self.budget["command"])  # warm-up: byte-code and commands manifest generation
+
+  def test_forbidden_modules(self):
+    modules = measure_import_time(*self.budget["command"])
+    self.assertTrue(modules, "No import time information collected")
+
+    forbidden = [name for name in modules
+                 if any(name == m or name.startswith(f"{m}.") for m in self.budget["forbidden_modules"])]
+    self.assertEqual([], forbidden, "Heavy modules should be imported lazily")
+
+  def test_modules_budget(self):
+    # amount of imported modules does not depend on the machine speed, unlike the import time
+    modules = measure_import_time(*self.budget["command"])
+    self.assertLessEqual(len(modules), self.budget["max_modules"],
+                         f"Too many modules imported: {sorted(modules.keys())}")
+
+  def test_import_budget(self):
+    # wall-clock time depends on the machine, the budget has a generous margin to catch only the big regressions
+    modules = measure_import_time(*self.budget["command"])
+    total_ms = sum(modules.values()) / 1000
+    self.assertLessEqual(total_ms, self.budget["max_total_ms"],
+                         f"Import time budget exceeded, top modules: {sorted(modules.items(), key=lambda x: -x[1])[:10]}")
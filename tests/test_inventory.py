@@ -0,0 +1,85 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.openstack.api_objects import ComputeFlavorItem, ComputeServerInfo, NetworkItem
+from openstack_cli.modules.openstack.objects import OSFlavor, OSNetwork, OpenStackQuotaType, OpenStackVM, \
+  ServerPowerState
+
+
+def compute_server(_id: str, name: str, user_id: str, power_state: int = 1) -> ComputeServerInfo:
+  return ComputeServerInfo(serialized_obj={
+    "id": _id,
+    "name": name,
+    "user_id": user_id,
+    "status": "ACTIVE",
+    "created": "2020-01-01T00:00:00Z",
+    "updated": "2020-01-01T00:00:00Z",
+    "OS-EXT-STS:power_state": power_state,
+    "flavor": {"id": "small"},
+    "image": {"id": "image"}
+  })
+
+
+class TestOpenStackVMRollups(TestCase):
+  def setUp(self):
+    flavor = OSFlavor.get(ComputeFlavorItem(serialized_obj={"id": "small", "name": "small", "vcpus": 2, "ram": 4096}))
+    networks = OSNetwork().parse([NetworkItem(serialized_obj={"name": "INTERNAL_NET"})], [])
+    self.inventory = OpenStackVM(
+      [
+        compute_server("1", "alpha-1", "u1"),
+        compute_server("2", "alpha-2", "u1", power_state=4),
+        compute_server("3", "beta-1", "u2")
+      ],
+      {},
+      {"small": flavor},
+      networks
+    )
+
+  def assertRollupsConsistent(self):
+    recalculated = OpenStackVM([vm.original for vm in self.inventory.items], {}, {"small": self.inventory.items[0].flavor},
+                               OSNetwork().parse([NetworkItem(serialized_obj={"name": "INTERNAL_NET"})], []))
+    self.assertEqual(recalculated.user_stats, self.inventory.user_stats)
+    self.assertEqual(recalculated.cluster_states, self.inventory.cluster_states)
+
+  def test_initial_rollups(self):
+    self.assertEqual({
+      "clusters": {"alpha": 2},
+      OpenStackQuotaType.CPU_CORES: 4,
+      OpenStackQuotaType.RAM_MB: 8192,
+      OpenStackQuotaType.INSTANCES: 2
+    }, self.inventory.user_stats["u1"])
+    self.assertEqual({ServerPowerState.running: 1, ServerPowerState.shutdown: 1}, self.inventory.cluster_states["alpha"])
+
+  def test_mutations(self):
+    changes = OpenStackVM([compute_server("2", "alpha-2", "u1"), compute_server("4", "gamma-1", "u2")],
+                          {}, {}, OSNetwork().parse([NetworkItem(serialized_obj={"name": "INTERNAL_NET"})], []))
+    for vm in changes.items:
+      vm._flavor = self.inventory.items[0].flavor
+      self.inventory.update(vm)
+
+    self.inventory.remove("3")
+    self.inventory.remove("unknown")
+
+    self.assertEqual({ServerPowerState.running: 2}, self.inventory.cluster_states["alpha"])
+    self.assertNotIn("beta", self.inventory.cluster_states)
+    self.assertEqual({"gamma": 1}, self.inventory.user_stats["u2"]["clusters"])
+    self.assertRollupsConsistent()
@@ -0,0 +1,146 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.core.output import LiveOutput, OutputFormat, RecordWriter, StatusOutput
+
+
+class TerminalStub(StringIO):
+  def isatty(self) -> bool:
+    return True
+
+
+class TestLiveOutput(TestCase):
+  def render(self, live: LiveOutput, lines):
+    with patch("sys.stdout", new_callable=TerminalStub) as out, \
+      patch("openstack_cli.core.output.get_terminal_size", return_value=(80, 24)):
+      live.render(lambda: print("\n".join(lines)))
+      return out.getvalue()
+
+  def test_only_changed_lines_are_redrawn(self):
+    live = LiveOutput()
+    self.assertEqual("header\nrow1\nrow2\n", self.render(live, ["header", "row1", "row2"]))
+
+    out = self.render(live, ["header", "row1", "ROW2"])
+    self.assertEqual("\x1b[3F\x1b[1E\x1b[1E\x1b[2KROW2\n", out)
+    self.assertEqual("\x1b[3F\x1b[1E\x1b[1E\x1b[1E", self.render(live, ["header", "row1", "ROW2"]))
+
+  def test_changed_rows_set(self):
+    live = LiveOutput()
+    self.render(live, ["header", "row1", "row2"])
+
+    self.assertEqual("\x1b[3F\x1b[1E\x1b[1E\x1b[1E\x1b[Jrow3\n", self.render(live, ["header", "row1", "row2", "row3"]))
+    self.assertEqual("\x1b[4F\x1b[1E\x1b[2Krow2\n\x1b[2Krow3\n\x1b[J", self.render(live, ["header", "row2", "row3"]))
+
+
+class TestStatusOutput(TestCase):
+  def run_tasks(self, so: StatusOutput, objects):
+    with patch("sys.stdout", new_callable=StringIO):
+      return so.start("test", objects)
+
+  def test_bounded_concurrency_and_idle_wait(self):
+    lock = threading.Lock()
+    running = [0, 0]  # current, max
+
+    def _task(x: int) -> bool:
+      with lock:
+        running[0] += 1
+        running[1] = max(running)
+      time.sleep(0.05)
+      with lock:
+        running[0] -= 1
+      return x % 2 == 0
+
+    cpu_start = time.process_time()
+    succeeded = self.run_tasks(StatusOutput(_task, pool_size=3), list(range(12)))
+
+    self.assertEqual(list(range(0, 12, 2)), sorted(succeeded))
+    self.assertLessEqual(running[1], 3)
+    self.assertLess(time.process_time() - cpu_start, 0.2)
+
+  def test_retries_and_timeout(self):
+    attempts = {}
+
+    def _task(x: str) -> bool:
+      attempts[x] = attempts.get(x, 0) + 1
+      if x == "slow":
+        time.sleep(0.3)
+        return True
+      return x == "ok" or attempts[x] > 1
+
+    succeeded = self.run_tasks(StatusOutput(_task, retries=1, timeout=0.1), ["ok", "flaky", "slow"])
+
+    self.assertEqual(["ok", "flaky"], succeeded)
+    self.assertEqual({"ok": 1, "flaky": 2, "slow": 2}, attempts)
+
+  def test_hung_task_holds_the_slot(self):
+    lock = threading.Lock()
+    running = [0, 0]  # current, max
+    release = threading.Event()
+    threading.Timer(0.3, release.set).start()
+
+    def _task(x: str) -> bool:
+      with lock:
+        running[0] += 1
+        running[1] = max(running)
+      try:
+        return release.wait() if x == "hung" else True
+      finally:
+        with lock:
+          running[0] -= 1
+
+    succeeded = self.run_tasks(StatusOutput(_task, pool_size=1, retries=1, timeout=0.1), ["hung", "ok"])
+
+    self.assertEqual(["ok", "hung"], succeeded)  # retry is started after the hung attempt returned
+    self.assertEqual(1, running[1])
+
+
+class TestRecordWriter(TestCase):
+  def write(self, fmt: OutputFormat, records) -> str:
+    out = StringIO()
+    with RecordWriter(fmt, ["name", "created", "zones"], stream=out) as writer:
+      for record in records:
+        writer.write(**record)
+    return out.getvalue()
+
+  def test_formats(self):
+    records = [
+      {"name": "node-1", "created": datetime(2020, 1, 2, 3, 4, 5), "zones": ["a", "b"]},
+      {"name": "node,2"}
+    ]
+
+    self.assertEqual(records[0]["zones"], json.loads(self.write(OutputFormat.json, records))[0]["zones"])
+    self.assertEqual("[]\n", self.write(OutputFormat.json, []))
+    self.assertEqual('{"name": "node,2", "created": null, "zones": null}',
+                     self.write(OutputFormat.ndjson, records).splitlines()[1])
+    self.assertEqual('name,created,zones\nnode-1,2020-01-02T03:04:05,"a,b"\n"node,2",,\n',
+                     self.write(OutputFormat.csv, records))
+
+  def test_format_validation(self):
+    self.assertEqual(OutputFormat.table, OutputFormat.from_str(""))
+    self.assertEqual(OutputFormat.ndjson, OutputFormat.from_str("NDJSON"))
+    self.assertRaises(ValueError, OutputFormat.from_str, "xml")
@@ -0,0 +1,78 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import tracemalloc
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.core.profiling import CommandProfiler, ProfileMode
+
+
+def _workload():
+  return sorted([str(i) for i in range(10000)])
+
+
+def _thread_workload():
+  return _workload()
+
+
+class TestCommandProfiler(TestCase):
+  def setUp(self):
+    self.__tmp_dir = tempfile.TemporaryDirectory()
+    self.directory = os.path.join(self.__tmp_dir.name, "profiles")
+
+  def tearDown(self):
+    self.__tmp_dir.cleanup()
+
+  def test_cpu(self):
+    with CommandProfiler("", self.directory, "list") as profiler:
+      _workload()
+
+    self.assertEqual(ProfileMode.cpu, profiler.mode)
+    with open(profiler.report_path) as f:
+      self.assertIn("_workload", f.read())
+
+    stats = pstats.Stats(profiler.raw_path)
+    self.assertTrue(any(func[2] == "_workload" for func in stats.stats))
+
+  def test_cpu_threads(self):
+    with CommandProfiler("cpu", self.directory, "list") as profiler:
+      worker = threading.Thread(target=_thread_workload)
+      worker.start()
+      worker.join()
+
+    stats = pstats.Stats(profiler.raw_path)
+    self.assertTrue(any(func[2] == "_thread_workload" for func in stats.stats))
+
+  def test_mem(self):
+    with CommandProfiler("mem", self.directory, "list") as profiler:
+      data = _workload()
+
+    self.assertFalse(tracemalloc.is_tracing())
+    with open(profiler.report_path) as f:
+      self.assertIn("peak", f.read())
+
+    self.assertTrue(tracemalloc.Snapshot.load(profiler.raw_path).traces)
+    self.assertEqual(10000, len(data))
+
+  def test_wrong_mode(self):
+    self.assertRaises(ValueError, CommandProfiler, "disk", self.directory, "list")
@@ -0,0 +1,66 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from io import StringIO
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.progressbar import ProgressBar, ProgressBarFormat, ProgressBarOptions
+
+
+class CountingStream(StringIO):
+  def __init__(self):
+    super(CountingStream, self).__init__()
+    self.writes = 0
+
+  def write(self, s: str) -> int:
+    self.writes += 1
+    return super(CountingStream, self).write(s)
+
+
+class TestProgressBar(TestCase):
+  def progress_bar(self, max_fps: int) -> (ProgressBar, CountingStream):
+    stream = CountingStream()
+    options = ProgressBarOptions(progress_format=ProgressBarFormat.PROGRESS_FORMAT_STATUS_SIMPLE)
+    return ProgressBar("test", 10, options, stdout=stream, max_fps=max_fps), stream
+
+  def test_frames_are_throttled(self):
+    p, stream = self.progress_bar(max_fps=1)
+    p.start(1000)
+    writes = stream.writes
+    for i in range(1000):
+      p.progress(i, f"{i}")
+
+    self.assertEqual(writes, stream.writes)
+
+    p.stop()
+    self.assertTrue(stream.getvalue().rstrip().endswith("100%   [999]"))
+
+  def test_unchanged_frame_is_not_written(self):
+    p, stream = self.progress_bar(max_fps=0)
+    p.start(10)
+    p.progress(5, "status")
+    writes = stream.writes
+    for _ in range(100):
+      p.progress(5, "status")
+
+    self.assertEqual(writes, stream.writes)
+
+    p.progress(6, "st")
+    self.assertTrue(stream.getvalue().endswith(" 60%   [st]    "))
@@ -0,0 +1,48 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.openstack.objects import OpenStackQuotas, OpenStackQuotaType
+
+
+class TestOpenStackQuotas(TestCase):
+  def setUp(self):
+    self.quotas = OpenStackQuotas()
+    self.quotas.add(OpenStackQuotaType.INSTANCES, 10, 8)
+    self.quotas.add(OpenStackQuotaType.CPU_CORES, 40, 16)
+    self.quotas.add(OpenStackQuotaType.VOLUME_GB, -1, 500)
+
+  def test_serialization(self):
+    restored = OpenStackQuotas.deserialize(self.quotas.serialize())
+
+    self.assertEqual([(q.type, q.max_count, q.used) for q in self.quotas],
+                     [(q.type, q.max_count, q.used) for q in restored])
+    self.assertEqual(self.quotas.max_metric_len, restored.max_metric_len)
+
+  def test_exceeded(self):
+    exceeded = self.quotas.exceeded({
+      OpenStackQuotaType.INSTANCES: 3,
+      OpenStackQuotaType.CPU_CORES: 24,
+      OpenStackQuotaType.VOLUME_GB: 1000,  # unlimited
+      OpenStackQuotaType.RAM_MB: 1024  # unknown
+    })
+
+    self.assertEqual([OpenStackQuotaType.INSTANCES], [q.type for q in exceeded])
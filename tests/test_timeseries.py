@@ -0,0 +1,108 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.config import StorageType, TimeSeriesExtension
+from openstack_cli.modules.utils import parse_duration
+
+DAY = 24 * 3600
+
+
+class TestTimeSeries(TestCase):
+  def setUp(self):
+    self.__tmp_dir = tempfile.TemporaryDirectory()
+    os.environ["XDG_DATA_HOME"] = self.__tmp_dir.name
+    self.storage = StorageType.SQL.value(app_name="test-timeseries", lazy=True)
+
+  def tearDown(self):
+    self.storage.connection.close()
+    self.__tmp_dir.cleanup()
+
+  def test_namespaces_isolated(self):
+    series = TimeSeriesExtension(self.storage, "history")
+    series.namespace("cloud-a").append({"INSTANCES": 1}, timestamp=100)
+    series.namespace("cloud-b").append({"INSTANCES": 2}, timestamp=100)
+
+    self.assertEqual({"INSTANCES": [(100, 1)]}, series.namespace("cloud-a").query(0, 200))
+    self.assertEqual({"INSTANCES": [(100, 2)]}, series.namespace("cloud-b").query(0, 200))
+
+  def test_range_query(self):
+    series = TimeSeriesExtension(self.storage, "history").namespace("cloud")
+    for ts in range(1000, 1010):
+      series.append({"CPU": ts - 1000, "RAM": 1}, timestamp=ts)
+
+    result = series.query(1003, 1006)
+    self.assertEqual([(1003, 3), (1004, 4), (1005, 5)], result["CPU"])
+    self.assertEqual(3, len(result["RAM"]))
+
+  def test_downsampling(self):
+    series = TimeSeriesExtension(self.storage, "history", raw_retention=DAY, hourly_retention=7 * DAY)
+    start = 100 * DAY
+    for minute in range(0, 120, 10):  # two hours of raw samples
+      series.append({"CPU": minute}, timestamp=start + minute * 60)
+
+    self.assertEqual(12, len(series.query(start, start + DAY)["CPU"]))
+
+    series.downsample(start + 2 * DAY)
+    hourly = series.query(start, start + DAY)["CPU"]
+    self.assertEqual([(start, 25), (start + 3600, 85)], hourly)
+
+    series.downsample(start + 10 * DAY)
+    self.assertEqual([(start, 55)], series.query(start, start + DAY)["CPU"])
+
+  def test_downsampling_once_per_hour(self):
+    series = TimeSeriesExtension(self.storage, "history", raw_retention=DAY, hourly_retention=7 * DAY)
+    start = 100 * DAY
+    with patch.object(self.storage, "downsample_series", wraps=self.storage.downsample_series) as downsample:
+      for minute in range(0, 60, 10):
+        series.namespace("cloud").append({"CPU": minute}, timestamp=start + minute * 60)
+      self.assertEqual(2, downsample.call_count)  # raw and hourly samples, only on the first append of the hour
+
+      series.namespace("other").append({"CPU": 1}, timestamp=start + 3600)
+      self.assertEqual(4, downsample.call_count)
+
+  def test_parse_duration(self):
+    self.assertEqual(30 * DAY, parse_duration("30d"))
+    self.assertEqual(12 * 3600, parse_duration("12h"))
+    self.assertEqual(14 * DAY, parse_duration("2w"))
+    self.assertEqual(90 * 60, parse_duration("90m"))
+    self.assertEqual(7 * DAY, parse_duration("7"))
+    self.assertRaises(ValueError, parse_duration, "d")
+    self.assertRaises(ValueError, parse_duration, "-1h")
+
+  def test_history_narrow_terminal(self):
+    from openstack_cli.commands.quota import _show_history
+
+    series = TimeSeriesExtension(self.storage, "history").namespace("cloud")
+    series.append({"INSTANCES": 5, "INSTANCES.max": 10}, timestamp=time.time() - 3600)
+    conf = SimpleNamespace(region="RegionOne", quota_history=series)
+
+    for columns in (40, 120):
+      with patch("openstack_cli.commands.quota.get_terminal_size", return_value=(columns, 24)), \
+        patch("sys.stdout", new_callable=StringIO) as out:
+        _show_history(conf, "1d")
+
+      self.assertIn("INSTANCES |", out.getvalue())
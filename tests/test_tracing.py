@@ -0,0 +1,110 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.apputils.curl import curl
+from openstack_cli.modules.apputils.tracing import Tracer, span, tracer
+
+
+class GzipJsonHandler(BaseHTTPRequestHandler):
+  def do_GET(self):
+    body = gzip.compress(json.dumps({"servers": [{"id": str(i)} for i in range(100)]}).encode("UTF-8"))
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json; charset=UTF-8")
+    self.send_header("Content-Encoding", "gzip")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+
+class TestTracer(TestCase):
+  def tearDown(self):
+    tracer.disable()
+    tracer.reset()
+
+  def test_disabled_records_nothing(self):
+    t = Tracer()
+    with t.span("request", "api") as s:
+      s.set(code=200)
+
+    self.assertFalse(t.enabled)
+    self.assertIs(t.span("a"), t.span("b"))  # shared no-op span, nothing is allocated
+    self.assertEqual([], t.events)
+
+  def test_nested_spans(self):
+    t = Tracer()
+    t.enable()
+    with t.span("outer", "app"):
+      with t.span("inner", "app", key="value"):
+        pass
+
+    inner, outer = t.events
+    self.assertEqual(("inner", "outer"), (inner["name"], outer["name"]))
+    self.assertEqual({"key": "value"}, inner["args"])
+    self.assertLessEqual(outer["ts"], inner["ts"])
+    self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+
+  def test_error_recorded(self):
+    t = Tracer()
+    t.enable()
+    with self.assertRaises(KeyError):
+      with t.span("lookup"):
+        raise KeyError()
+
+    self.assertEqual("KeyError", t.events[0]["args"]["error"])
+
+  def test_chrome_trace_export(self):
+    t = Tracer()
+    t.enable()
+    with t.span("request", "api"):
+      pass
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+      with open(t.export(os.path.join(tmp_dir, "trace.json"))) as f:
+        trace = json.load(f)
+
+    phases = [e["ph"] for e in trace["traceEvents"]]
+    self.assertEqual(["M", "X"], phases)
+    self.assertEqual("request", trace["traceEvents"][1]["name"])
+
+  def test_http_spans(self):
+    server = HTTPServer(("127.0.0.1", 0), GzipJsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+      tracer.enable()
+      with span("request", "api"):
+        data = curl(f"http://127.0.0.1:{server.server_port}/servers").from_json()
+    finally:
+      server.shutdown()
+      server.server_close()
+
+    self.assertEqual(100, len(data["servers"]))
+    names = [e["name"] for e in tracer.events]
+    for name in ("ttfb", "download", "decompress", "decode", "json", "request"):
+      self.assertIn(name, names)
@@ -0,0 +1,77 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import os
+import sys
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openstack_cli.modules.openstack.objects import OpenStackVMInfo, ServerPowerState, ServerState
+from openstack_cli.modules.openstack.waiter import ServerStatusWaiter, is_active, is_build_failed
+
+
+def server(_id: str, status: ServerState, updated: int) -> OpenStackVMInfo:
+  vm = OpenStackVMInfo()
+  vm.id = vm.name = _id
+  vm.status = status
+  vm.state = ServerPowerState.running if status == ServerState.active else ServerPowerState.nostate
+  vm.updated = datetime(2020, 1, 1, 0, 0, updated)
+  return vm
+
+
+class ServersList(object):
+  def __init__(self, items: List[OpenStackVMInfo]):
+    self.items = items
+
+
+class FakeOpenStack(object):
+  def __init__(self, ticks: List[List[OpenStackVMInfo]]):
+    self.ticks = ticks
+    self.requests = []
+
+  def get_servers(self, arguments: dict = None) -> ServersList:
+    self.requests.append(arguments)
+    return ServersList(self.ticks.pop(0) if self.ticks else [])
+
+
+class TestServerStatusWaiter(TestCase):
+  def test_one_request_per_tick(self):
+    servers = [server(f"vm-{i}", ServerState.build, 1) for i in range(50)]
+    ostack = FakeOpenStack([
+      [],
+      [server(f"vm-{i}", ServerState.active, 5) for i in range(25)],
+      [server(f"vm-{i}", ServerState.active, 7) for i in range(25, 49)] + [server("vm-49", ServerState.error, 7)]
+    ])
+    results = {}
+    waiter = ServerStatusWaiter(ostack, servers, target=is_active, failed=is_build_failed, interval=0.01)
+
+    self.assertFalse(waiter.wait(on_done=lambda s, ok: results.__setitem__(s.id, ok)))
+    self.assertEqual(3, len(ostack.requests))
+    self.assertEqual(["2020-01-01T00:00:01Z", "2020-01-01T00:00:01Z", "2020-01-01T00:00:05Z"],
+                     [r["changes-since"] for r in ostack.requests])
+    self.assertEqual(49, len([ok for ok in results.values() if ok]))
+    self.assertFalse(results["vm-49"])
+
+  def test_timeout(self):
+    ostack = FakeOpenStack([])
+    waiter = ServerStatusWaiter(ostack, [server("vm-1", ServerState.build, 1)], target=is_active, interval=0.01,
+                                timeout=0.05)
+
+    self.assertFalse(waiter.wait())
+    self.assertEqual([], waiter.pending)